@@ -16,6 +16,9 @@ set "HOUDINI_DISABLE_CONSOLE = 1"
 :: Set External Help Browser
 set "HOUDINI_EXTERNAL_HELP_BROWSER = 1"
 
+:: Defer Qt submodule imports until the snapshot tools first use them
+set "QT_LAZY_LOAD=1"
+
 
 ::Start Houdini
 set "HOUDINI_DIR=C:\Program Files\Side Effects Software\Houdini 20.5.550\bin" 
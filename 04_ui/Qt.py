@@ -26,6 +26,12 @@ DOCUMENTATION
         >> button.show()
         >> app.exec_()
 
+    Environment:
+        QT_LAZY_LOAD=1       Import binding submodules and install their
+                             members on first attribute access (Python 3.7+)
+        QT_PROFILE_IMPORT=1  Print the time spent in each import step,
+                             also available as QtCompat._import_profile()
+
     All members of PySide2 are mapped from other bindings, should they exist.
     If no equivalent member exist, it is excluded from Qt.py and inaccessible.
     The idea is to highlight members that exist across all supported binding,
@@ -41,6 +47,7 @@ LICENSE
 
 import os
 import sys
+import time
 import types
 import shutil
 import importlib
@@ -57,10 +64,46 @@ QT_VERBOSE = bool(os.getenv("QT_VERBOSE"))
 QT_PREFERRED_BINDING_JSON = os.getenv("QT_PREFERRED_BINDING_JSON", "")
 QT_PREFERRED_BINDING = os.getenv("QT_PREFERRED_BINDING", "")
 QT_SIP_API_HINT = os.getenv("QT_SIP_API_HINT")
+QT_PROFILE_IMPORT = bool(os.getenv("QT_PROFILE_IMPORT"))
+
+# Lazy loading relies on module level __getattr__ (PEP 562)
+QT_LAZY_LOAD = bool(os.getenv("QT_LAZY_LOAD")) and sys.version_info >= (3, 7)
+
+
+class _LazyModule(types.ModuleType):
+    """Submodule whose members are installed on first attribute access
+
+    Used in place of the plain submodules when QT_LAZY_LOAD is set, such
+    that importing Qt.py only probes which bindings and submodules exist.
+    The binding submodule is imported, and its common, misplaced and
+    missing members installed, once something is read from it.
+
+    """
+
+    def __getattr__(self, name):
+        if name.startswith("__") or not _populate(self):
+            raise AttributeError("module '%s' has no attribute '%s'"
+                                 % (self.__name__, name))
+        try:
+            return self.__dict__[name]
+        except KeyError:
+            raise AttributeError("module '%s' has no attribute '%s'"
+                                 % (self.__name__, name))
+
 
 # Reference to Qt.py
 Qt = sys.modules[__name__]
-Qt.QtCompat = types.ModuleType("QtCompat")
+Qt.QtCompat = (_LazyModule if QT_LAZY_LOAD else types.ModuleType)("QtCompat")
+
+# Lazy loading state, see _LazyModule
+_lazy_sources = {}
+_lazy_binding = {}
+_lazy_populated = set()
+
+# (step, seconds) pairs, see _import_profile()
+_import_profile_steps = []
+_clock = getattr(time, "perf_counter", time.time)
+_import_start = _clock()
 
 try:
     long
@@ -1280,9 +1323,100 @@ def _apply_site_config():
 
 
 def _new_module(name):
+    if QT_LAZY_LOAD:
+        return _LazyModule(__name__ + "." + name)
     return types.ModuleType(__name__ + "." + name)
 
 
+def _record(step, start):
+    _import_profile_steps.append((step, _clock() - start))
+
+
+def _import_profile():
+    """Return a report of the time spent importing and populating Qt.py"""
+    lines = ["Qt.py import profile (%s%s)" % (
+        getattr(Qt, "__binding__", "no binding"),
+        ", lazy" if QT_LAZY_LOAD else "")]
+    for step, seconds in _import_profile_steps:
+        lines.append("%9.2f ms  %s" % (seconds * 1000.0, step))
+    return "\n".join(lines)
+
+
+def _find_sub_module(module, name):
+    """Return the import name of a submodule without importing it"""
+    import importlib.util
+
+    for fullname in (module.__name__ + "." + name, name):
+        try:
+            if importlib.util.find_spec(fullname) is not None:
+                return fullname
+        except (ImportError, ValueError):
+            continue
+    return None
+
+
+def _has_sub_module(name):
+    if QT_LAZY_LOAD:
+        return name in _lazy_sources
+    return hasattr(Qt, "_" + name)
+
+
+def _deferred_member(module, path):
+    """Return `module`.`path`, deferring the submodule import when lazy"""
+
+    def resolve():
+        member = getattr(Qt, "_" + module)
+        for part in path.split("."):
+            member = getattr(member, part)
+        return member
+
+    if not QT_LAZY_LOAD:
+        return resolve()
+
+    def proxy(*args, **kwargs):
+        return resolve()(*args, **kwargs)
+
+    proxy.__name__ = path.rsplit(".", 1)[-1]
+    return proxy
+
+
+def __getattr__(name):
+    """Import binding submodules on first access when QT_LAZY_LOAD is set"""
+    source = _lazy_sources.get(name[1:]) if name.startswith("_") else None
+    if source is None:
+        raise AttributeError("module '%s' has no attribute '%s'"
+                             % (__name__, name))
+
+    start = _clock()
+    submodule = importlib.import_module(source)
+    _record("import %s" % source, start)
+
+    setattr(Qt, name, submodule)
+    return submodule
+
+
+def _populate(module):
+    """Install the members of a lazy submodule, returns False if done before"""
+    name = module.__name__.rsplit(".", 1)[-1]
+    if name in _lazy_populated:
+        return False
+    _lazy_populated.add(name)
+
+    start = _clock()
+    if "misplaced" in _lazy_binding:
+        _apply_misplaced_members(_lazy_binding["misplaced"], only=name)
+
+    if name == "QtCompat" and "compatibility" in _lazy_binding:
+        _apply_compatibility_members(*_lazy_binding["compatibility"])
+
+    if name in _common_members:
+        _install_common_members(name, module)
+        _install_missing_members(name, module)
+
+    _record("populate %s" % name, start)
+    return True
+
+
 def _import_sub_module(module, name):
     """import_sub_module will mimic the function of importlib.import_module"""
     module = __import__(module.__name__ + "." + name)
@@ -1303,6 +1437,17 @@ def _setup(module, extras):
         _warn("ImportError(%s): %s" % (module, msg))
 
     for name in list(_common_members) + extras:
+        if QT_LAZY_LOAD:
+            fullname = _find_sub_module(module, name)
+            if fullname is None:
+                continue
+
+            _lazy_sources[name] = fullname
+            if name not in extras:
+                setattr(Qt, name, _new_module(name))
+            continue
+
+        start = _clock()
         try:
             submodule = _import_sub_module(
                 module, name)
@@ -1316,6 +1461,7 @@ def _setup(module, extras):
                 _warn_import_error(e2, name)
                 continue
 
+        _record("import %s" % submodule.__name__, start)
         setattr(Qt, "_" + name, submodule)
 
         if name not in extras:
@@ -1328,11 +1474,33 @@ def _setup(module, extras):
 def _reassign_misplaced_members(binding):
     """Apply misplaced members from `binding` to Qt.py
 
+    When QT_LAZY_LOAD is set, each member is applied once its destination
+    submodule is first accessed instead.
+
     Arguments:
         binding (dict): Misplaced members
 
     """
 
+    if not QT_LAZY_LOAD:
+        _apply_misplaced_members(binding)
+        return
+
+    _lazy_binding["misplaced"] = binding
+
+    # Destination modules are created up front, such that they can be
+    # imported even when the binding lacks them, as with eager loading.
+    for dst in _misplaced_members[binding].values():
+        if isinstance(dst, (list, tuple)):
+            dst = dst[0]
+        dst_module = dst.split(".")[0]
+        if dst_module in _common_members and dst_module not in vars(Qt):
+            setattr(Qt, dst_module, _new_module(dst_module))
+            sys.modules[__name__ + "." + dst_module] = getattr(Qt, dst_module)
+
+
+def _apply_misplaced_members(binding, only=None):
+    """Apply misplaced members, optionally only those destined for `only`"""
 
     for src, dst in _misplaced_members[binding].items():
         dst_value = None
@@ -1352,6 +1520,9 @@ def _reassign_misplaced_members(binding):
         if len(dst_parts) > 1:
             dst_member = dst_parts[1]
 
+        if only is not None and dst_module != only:
+            continue
+
 
         # Get the member we want to store in the namesapce.
         if not dst_value:
@@ -1412,6 +1583,14 @@ def _build_compatibility_members(binding, decorators=None):
 
     """
 
+    if QT_LAZY_LOAD:
+        _lazy_binding["compatibility"] = (binding, decorators)
+        return
+
+    _apply_compatibility_members(binding, decorators)
+
+
+def _apply_compatibility_members(binding, decorators=None):
     decorators = decorators or dict()
 
     # Allow optional site-level customization of the compatibility members.
@@ -1481,24 +1660,24 @@ def _pyside6():
     _setup(module, extras)
     Qt.__binding_version__ = module.__version__
 
-    if hasattr(Qt, "_shiboken6"):
+    if _has_sub_module("shiboken6"):
         Qt.QtCompat.wrapInstance = _wrapinstance
         Qt.QtCompat.getCppPointer = _getcpppointer
         Qt.QtCompat.delete = shiboken6.delete
 
-    if hasattr(Qt, "_QtUiTools"):
+    if _has_sub_module("QtUiTools"):
         Qt.QtCompat.loadUi = _loadUi
 
-    if hasattr(Qt, "_QtCore"):
+    if _has_sub_module("QtCore"):
         Qt.__qt_version__ = Qt._QtCore.qVersion()
         Qt.QtCompat.dataChanged = (
             lambda self, topleft, bottomright, roles=None:
             self.dataChanged.emit(topleft, bottomright, roles or [])
         )
 
-    if hasattr(Qt, "_QtWidgets"):
-        Qt.QtCompat.setSectionResizeMode = \
-            Qt._QtWidgets.QHeaderView.setSectionResizeMode
+    if _has_sub_module("QtWidgets"):
+        Qt.QtCompat.setSectionResizeMode = _deferred_member(
+            "QtWidgets", "QHeaderView.setSectionResizeMode")
 
     def setWeight(func):
         def wrapper(self, weight):
@@ -1558,24 +1737,24 @@ def _pyside2():
     _setup(module, extras)
     Qt.__binding_version__ = module.__version__
 
-    if hasattr(Qt, "_shiboken2"):
+    if _has_sub_module("shiboken2"):
         Qt.QtCompat.wrapInstance = _wrapinstance
         Qt.QtCompat.getCppPointer = _getcpppointer
         Qt.QtCompat.delete = shiboken2.delete
 
-    if hasattr(Qt, "_QtUiTools"):
+    if _has_sub_module("QtUiTools"):
         Qt.QtCompat.loadUi = _loadUi
 
-    if hasattr(Qt, "_QtCore"):
+    if _has_sub_module("QtCore"):
         Qt.__qt_version__ = Qt._QtCore.qVersion()
         Qt.QtCompat.dataChanged = (
             lambda self, topleft, bottomright, roles=None:
             self.dataChanged.emit(topleft, bottomright, roles or [])
         )
 
-    if hasattr(Qt, "_QtWidgets"):
-        Qt.QtCompat.setSectionResizeMode = \
-            Qt._QtWidgets.QHeaderView.setSectionResizeMode
+    if _has_sub_module("QtWidgets"):
+        Qt.QtCompat.setSectionResizeMode = _deferred_member(
+            "QtWidgets", "QHeaderView.setSectionResizeMode")
 
     _reassign_misplaced_members("PySide2")
     _build_compatibility_members("PySide2")
@@ -1647,15 +1826,15 @@ def _pyqt5():
             sip = None
 
     _setup(module, extras)
-    if hasattr(Qt, "_sip"):
+    if _has_sub_module("sip"):
         Qt.QtCompat.wrapInstance = _wrapinstance
         Qt.QtCompat.getCppPointer = _getcpppointer
         Qt.QtCompat.delete = sip.delete
 
-    if hasattr(Qt, "_uic"):
+    if _has_sub_module("uic"):
         Qt.QtCompat.loadUi = _loadUi
 
-    if hasattr(Qt, "_QtCore"):
+    if _has_sub_module("QtCore"):
         Qt.__binding_version__ = Qt._QtCore.PYQT_VERSION_STR
         Qt.__qt_version__ = Qt._QtCore.QT_VERSION_STR
         Qt.QtCompat.dataChanged = (
@@ -1663,9 +1842,9 @@ def _pyqt5():
             self.dataChanged.emit(topleft, bottomright, roles or [])
         )
 
-    if hasattr(Qt, "_QtWidgets"):
-        Qt.QtCompat.setSectionResizeMode = \
-            Qt._QtWidgets.QHeaderView.setSectionResizeMode
+    if _has_sub_module("QtWidgets"):
+        Qt.QtCompat.setSectionResizeMode = _deferred_member(
+            "QtWidgets", "QHeaderView.setSectionResizeMode")
 
     _reassign_misplaced_members("PyQt5")
     _build_compatibility_members('PyQt5')
@@ -1848,9 +2027,15 @@ def _cli(args):
     parser.add_argument("--stdin",
                         help="Read from stdin instead of file",
                         action="store_true")
+    parser.add_argument("--profile",
+                        help="Print the time spent importing Qt.py",
+                        action="store_true")
 
     args = parser.parse_args(args)
 
+    if args.profile:
+        sys.stdout.write(_import_profile() + "\n")
+
     if args.stdout:
         raise NotImplementedError("--stdout")
 
@@ -1916,6 +2101,36 @@ class MissingMember(object):
         raise NotImplementedError(self.__err)
 
 
+def _install_common_members(name, our_submodule):
+    their_submodule = getattr(Qt, "_%s" % name)
+
+    for member in _common_members[name]:
+        # Accept that a submodule may miss certain members.
+        try:
+            their_member = getattr(their_submodule, member)
+        except AttributeError:
+            _log("'%s.%s' was missing." % (name, member))
+            continue
+
+        setattr(our_submodule, member, their_member)
+
+
+def _install_missing_members(name, our_submodule):
+    members = _missing_members.get(name, {})
+
+    for member in members:
+
+        # If the submodule already has this member installed,
+        # either by the common members, or the site config,
+        # then skip installing this one over it.
+        if hasattr(our_submodule, member):
+            continue
+
+        placeholder = MissingMember("{}.{}".format(name, member),
+                                    details=members[member])
+        setattr(our_submodule, member, placeholder)
+
+
 def _install():
     # Default order (customize order and content via QT_PREFERRED_BINDING)
     default_order = ("PySide6", "PySide2", "PyQt5", "PySide", "PyQt4")
@@ -1968,9 +2183,11 @@ def _install():
     for name in order:
         _log("Trying %s" % name)
 
+        start = _clock()
         try:
             available[name]()
             found_binding = True
+            _record("setup %s" % name, start)
             break
 
         except ImportError as e:
@@ -1984,10 +2201,9 @@ def _install():
         raise ImportError("No Qt binding were found.")
 
     # Install individual members
-    for name, members in _common_members.items():
-        try:
-            their_submodule = getattr(Qt, "_%s" % name)
-        except AttributeError:
+    start = _clock()
+    for name in _common_members:
+        if not _has_sub_module(name):
             continue
 
         our_submodule = getattr(Qt, name)
@@ -1999,31 +2215,15 @@ def _install():
         # e.g. import Qt.QtCore
         sys.modules[__name__ + "." + name] = our_submodule
 
-        for member in members:
-            # Accept that a submodule may miss certain members.
-            try:
-                their_member = getattr(their_submodule, member)
-            except AttributeError:
-                _log("'%s.%s' was missing." % (name, member))
-                continue
-
-            setattr(our_submodule, member, their_member)
+        # Lazy submodules install their members on first access
+        if not QT_LAZY_LOAD:
+            _install_common_members(name, our_submodule)
 
     # Install missing member placeholders
-    for name, members in _missing_members.items():
-        our_submodule = getattr(Qt, name)
-
-        for member in members:
-
-            # If the submodule already has this member installed,
-            # either by the common members, or the site config,
-            # then skip installing this one over it.
-            if hasattr(our_submodule, member):
-                continue
-
-            placeholder = MissingMember("{}.{}".format(name, member),
-                                        details=members[member])
-            setattr(our_submodule, member, placeholder)
+    if not QT_LAZY_LOAD:
+        for name in _missing_members:
+            _install_missing_members(name, getattr(Qt, name))
+    _record("install members", start)
 
     # Enable direct import of QtCompat
     sys.modules[__name__ + ".QtCompat"] = Qt.QtCompat
@@ -2053,6 +2253,11 @@ such as `QHeaderView.setSectionResizeMode`.
 
 Qt.QtCompat._cli = _cli
 Qt.QtCompat._convert = _convert
+Qt.QtCompat._import_profile = _import_profile
+
+_record("import Qt.py", _import_start)
+if QT_PROFILE_IMPORT:
+    sys.stdout.write(_import_profile() + "\n")
 
 # Enable command-line interface
 if __name__ == "__main__":
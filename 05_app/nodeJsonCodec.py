@@ -0,0 +1,195 @@
+# ****************************************************************************************
+# Content : JSON encode/decode for snapshots, using orjson or ujson when importable
+# -----
+# Date:
+# Created  : 19/10/2026
+# Modified : 19/10/2026
+# -----
+# Dependencies = os, sys, json, math, time, array, argparse, importlib,
+#                orjson (optional), ujson (optional)
+# -----
+# Author  : Mayank Modi
+# Email   : mayank_modi@outlook.com
+# ****************************************************************************************
+
+# Snapshot files are read and written through this module so the JSON library can be
+# swapped without touching the tools. Environment variables:
+#   NODESNAP_JSON_BACKEND    - force "orjson", "ujson" or "json"
+#   NODESNAP_JSON_PRETTY     - set to 0 to write compact files
+#   NODESNAP_JSON_COMPATIBLE - set to 1 to write files byte for byte as json.dump(indent=4)
+# Run "python nodeJsonCodec.py <snapshot.json>" to compare the backends.
+
+import os
+import sys
+import json
+import math
+import time
+import argparse
+import importlib
+from array import array
+
+BACKENDS = ("orjson", "ujson", "json")
+
+PRETTY     = os.environ.get("NODESNAP_JSON_PRETTY", "1") != "0"
+COMPATIBLE = os.environ.get("NODESNAP_JSON_COMPATIBLE", "0") == "1"
+
+_modules = {"json": json}
+
+
+def _importBackend(name):
+    if name not in _modules:
+        try:
+            _modules[name] = importlib.import_module(name)
+        except ImportError:
+            _modules[name] = None
+    return _modules[name]
+
+
+def availableBackends():
+    return [name for name in BACKENDS if _importBackend(name) is not None]
+
+
+def selectBackend(name=None):
+    name = name or os.environ.get("NODESNAP_JSON_BACKEND")
+    if name and _importBackend(name) is not None:
+        return name
+    return availableBackends()[0]
+
+
+BACKEND = selectBackend()
+
+
+def _default(value):
+    # Packed parm vectors from nodeSnapModel
+    if isinstance(value, array):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def hasNonFinite(data):
+    """True when ``data`` holds a NaN or infinite float anywhere."""
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+        elif isinstance(value, array) and value.typecode in "fd":
+            if not all(map(math.isfinite, value)):
+                return True
+    return False
+
+
+def _finiteDefault(value):
+    # orjson writes NaN and Infinity as null, packed vectors holding them fall back to the stdlib
+    if isinstance(value, array) and value.typecode in "fd" and not all(map(math.isfinite, value)):
+        raise ValueError("non-finite float")
+    return _default(value)
+
+
+def dumpsBytes(data, pretty=None, compatible=None, backend=None):
+    pretty     = PRETTY if pretty is None else pretty
+    compatible = COMPATIBLE if compatible is None else compatible
+    backend    = backend or BACKEND
+
+    # The fast backends are tried first, only the stdlib keeps NaN and Infinity
+    if not compatible and backend == "orjson":
+        orjson = _modules["orjson"]
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        try:
+            encoded = orjson.dumps(data, default=_finiteDefault, option=option)
+        except orjson.JSONEncodeError:
+            encoded = None
+        # A plain NaN float also comes out as null, the tree is only scanned when there is one
+        if encoded is not None and (b"null" not in encoded or not hasNonFinite(data)):
+            return encoded
+
+    elif not compatible and backend == "ujson":
+        try:
+            return _modules["ujson"].dumps(data, indent=4 if pretty else 0, escape_forward_slashes=False,
+                                           default=_default).encode("utf-8")
+        except (OverflowError, ValueError):
+            # ujson refuses NaN and Infinity
+            pass
+
+    # Only the stdlib reproduces indent=4 output (spacing, escaping) exactly
+    return json.dumps(data, indent=4 if pretty or compatible else None, default=_default).encode("utf-8")
+
+
+def dumps(data, pretty=None, compatible=None, backend=None):
+    return dumpsBytes(data, pretty, compatible, backend).decode("utf-8")
+
+
+def loads(text, backend=None):
+    backend = backend or BACKEND
+    if backend != "json":
+        try:
+            return _modules[backend].loads(text)
+        except ValueError:
+            # NaN/Infinity and other stdlib-only input
+            pass
+    if isinstance(text, memoryview):
+        text = text.tobytes()
+    return json.loads(text)
+
+
+def dump(data, filePath, pretty=None, compatible=None, backend=None):
+    compatible = COMPATIBLE if compatible is None else compatible
+
+    if compatible:
+        # Text mode, so line endings also match what json.dump() always wrote
+        with open(filePath, "w") as f:
+            json.dump(data, f, indent=4, default=_default)
+        return
+
+    with open(filePath, "wb") as f:
+        f.write(dumpsBytes(data, pretty, compatible, backend))
+
+
+def load(filePath, backend=None):
+    with open(filePath, "rb") as f:
+        return loads(f.read(), backend)
+
+
+def benchmark(filePath, repeat=5):
+    with open(filePath, "rb") as f:
+        raw = f.read()
+    data = json.loads(raw)
+
+    results = {}
+    for backend in availableBackends():
+        timings = {}
+        for label, func in (
+            ("decode", lambda: loads(raw, backend)),
+            ("encode_pretty", lambda: dumpsBytes(data, True, False, backend)),
+            ("encode_compact", lambda: dumpsBytes(data, False, False, backend)),
+        ):
+            best = None
+            for _ in range(repeat):
+                start = time.perf_counter()
+                func()
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            timings[label] = round(best * 1000.0, 2)
+        results[backend] = timings
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time the available JSON backends on a snapshot file.")
+    parser.add_argument("snapshot")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    sizeMb = os.path.getsize(args.snapshot) / (1024.0 * 1024.0)
+    print(f"{args.snapshot} ({sizeMb:.1f} MB), best of {args.repeat}, milliseconds")
+    for backend, timings in benchmark(args.snapshot, args.repeat).items():
+        print(f"  {backend:<8}" + "  ".join(f"{label} {value:>9}" for label, value in timings.items()))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
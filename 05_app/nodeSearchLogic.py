@@ -0,0 +1,138 @@
+# ****************************************************************************************
+# Content : Prebuilt name/type/parm index used to filter the loader tree while typing
+# -----
+# Date:
+# Created  : 19/10/2026
+# Modified : 19/10/2026
+# -----
+# Dependencies = bisect, collections.defaultdict
+# -----
+# Author  : Mayank Modi
+# Email   : mayank_modi@outlook.com
+# ****************************************************************************************
+
+from bisect import bisect_left
+from collections import defaultdict
+
+
+def trigramsOf(text):
+    return {text[index:index + 3] for index in range(len(text) - 2)}
+
+
+class NodeSearchIndex:
+    """
+    Index over every tree entry, built once when a snapshot is loaded.
+    Words of three or more characters are looked up through a trigram index,
+    shorter words through a sorted prefix list, so a keystroke never has to
+    look at entries that cannot match.
+    """
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.parents  = []
+        self.tokens   = []
+        self.trigrams = defaultdict(set)
+        self.prefixes = []
+        self._sorted  = True
+        self._lastQuery   = ""
+        self._lastMatches = None
+
+    def __len__(self):
+        return len(self.parents)
+
+    def addNode(self, name, typeName, parmNames=(), parentId=None):
+        entryId = len(self.parents)
+        tokens  = {name.lower(), typeName.lower()}
+        tokens.update(parmName.lower() for parmName in parmNames)
+        tokens.discard("")
+
+        self.parents.append(parentId)
+        self.tokens.append(tuple(tokens))
+
+        for token in tokens:
+            self.prefixes.append((token, entryId))
+            for trigram in trigramsOf(token):
+                self.trigrams[trigram].add(entryId)
+
+        self._sorted = False
+        self._lastQuery   = ""
+        self._lastMatches = None
+        return entryId
+
+    def finalize(self):
+        if not self._sorted:
+            self.prefixes.sort()
+            self._sorted = True
+
+    def _prefixMatches(self, word):
+        self.finalize()
+        matches = set()
+        index   = bisect_left(self.prefixes, (word, -1))
+
+        while index < len(self.prefixes):
+            token, entryId = self.prefixes[index]
+            if not token.startswith(word):
+                break
+            matches.add(entryId)
+            index += 1
+
+        return matches
+
+    def _substringMatches(self, word, candidates=None):
+        trigramSets = sorted((self.trigrams.get(trigram, set()) for trigram in trigramsOf(word)), key=len)
+        found = set(trigramSets[0])
+        for trigramSet in trigramSets[1:]:
+            found &= trigramSet
+            if not found:
+                return found
+
+        if candidates is not None:
+            found &= candidates
+
+        return {entryId for entryId in found if any(word in token for token in self.tokens[entryId])}
+
+    def match(self, text):
+        """Return the ids of entries matching every word in ``text``."""
+        query = " ".join(text.lower().split())
+        if not query:
+            self._lastQuery, self._lastMatches = "", None
+            return None
+
+        # Typing more characters can only narrow the previous result, except when
+        # a short (prefix matched) word grows into a substring matched one
+        candidates = None
+        if self._lastMatches is not None and self._lastQuery and query.startswith(self._lastQuery):
+            extended = query[len(self._lastQuery):]
+            if extended.startswith(" ") or len(self._lastQuery.split()[-1]) >= 3:
+                candidates = self._lastMatches
+
+        matches = candidates
+        for word in query.split():
+            if len(word) < 3:
+                wordMatches = self._prefixMatches(word)
+                if matches is not None:
+                    wordMatches &= matches
+            else:
+                wordMatches = self._substringMatches(word, matches)
+
+            matches = wordMatches
+            if not matches:
+                break
+
+        self._lastQuery, self._lastMatches = query, matches
+        return matches
+
+    def visibleIds(self, text):
+        """Return matching ids plus all their ancestors, or None if nothing filters."""
+        matches = self.match(text)
+        if matches is None:
+            return None
+
+        visible = set()
+        for entryId in matches:
+            while entryId is not None and entryId not in visible:
+                visible.add(entryId)
+                entryId = self.parents[entryId]
+
+        return visible
@@ -0,0 +1,172 @@
+# ****************************************************************************************
+# Content : Content-hashed sidecar blobs for geometry payloads of exported networks
+# -----
+# Date:
+# Created  : 19/10/2026
+# Modified : 19/10/2026
+# -----
+# Dependencies = os, mmap, hashlib, nodeJsonCodec
+# -----
+# Author  : Mayank Modi
+# Email   : mayank_modi@outlook.com
+# ****************************************************************************************
+
+# Geometry inlined by childrenAsData()/parmsAsData() (stash parms, locked nodes) is
+# written to <snapshot>.blobs/<sha256>.blob and replaced by
+#   {"$blob": <sha256>, "kind": "text" | "json", "size": <bytes>}
+# The snapshot's top-level "blobs" key holds the folder name, relative to the snapshot.
+
+import os
+import mmap
+import hashlib
+
+import nodeJsonCodec
+
+BLOB_KEY    = "$blob"
+BLOB_SUFFIX = ".blobs"
+
+# Payload keys that hold geometry, these move out from a smaller size on
+GEOMETRY_KEYS      = ("geometry", "geo", "stash", "stashed_geometry", "locked_geometry")
+GEOMETRY_THRESHOLD = 64 * 1024
+
+# Any other value this large moves out as well
+BLOB_THRESHOLD = 1024 * 1024
+
+
+def isBlobRef(value):
+    return isinstance(value, dict) and BLOB_KEY in value and "kind" in value
+
+
+def hasBlobs(value):
+    if isBlobRef(value):
+        return True
+    if isinstance(value, list):
+        return any(hasBlobs(item) for item in value)
+    if isinstance(value, dict):
+        return any(hasBlobs(item) for item in value.values())
+    return False
+
+
+def blobDirFor(filePath):
+    return os.path.splitext(filePath.rstrip("/\\"))[0] + BLOB_SUFFIX
+
+
+def _payloadBytes(value):
+    if isinstance(value, str):
+        return "text", value.encode("utf-8")
+    return "json", nodeJsonCodec.dumpsBytes(value, pretty=False, compatible=False)
+
+
+def _writeBlob(blobDir, payload):
+    key = hashlib.sha256(payload).hexdigest()
+    blobPath = os.path.join(blobDir, key + ".blob")
+
+    # Content addressed, an existing blob is already the same bytes
+    if not os.path.exists(blobPath):
+        os.makedirs(blobDir, exist_ok=True)
+        tempPath = blobPath + ".tmp"
+        with open(tempPath, "wb") as f:
+            f.write(payload)
+        os.replace(tempPath, blobPath)
+    return key
+
+
+def extractValue(value, blobDir, key=None):
+    threshold = GEOMETRY_THRESHOLD if key in GEOMETRY_KEYS else BLOB_THRESHOLD
+
+    if isinstance(value, str) and len(value) > threshold or (
+        key in GEOMETRY_KEYS and isinstance(value, (dict, list)) and value
+    ):
+        kind, payload = _payloadBytes(value)
+        if len(payload) > threshold:
+            return {BLOB_KEY: _writeBlob(blobDir, payload), "kind": kind, "size": len(payload)}
+
+    if isinstance(value, list):
+        return [extractValue(item, blobDir) for item in value]
+    if isinstance(value, dict):
+        return {itemKey: extractValue(item, blobDir, itemKey) for itemKey, item in value.items()}
+    return value
+
+
+def extractBlobs(data, filePath):
+    """Move geometry payloads of every node and definition into sidecar blobs next to ``filePath``."""
+    blobDir = blobDirFor(filePath)
+    stack = list(data.get("nodes", {}).values())
+
+    while stack:
+        nodeData = stack.pop()
+        if not isinstance(nodeData, dict):
+            continue
+        for payloadKey in ("parm", "children_data"):
+            if nodeData.get(payloadKey):
+                nodeData[payloadKey] = extractValue(nodeData[payloadKey], blobDir)
+        stack.extend((nodeData.get("child") or {}).values())
+
+    for definitionKey, payload in (data.get("definitions") or {}).items():
+        data["definitions"][definitionKey] = extractValue(payload, blobDir)
+
+    if os.path.isdir(blobDir):
+        data["blobs"] = os.path.basename(blobDir)
+    return data
+
+
+class BlobStore:
+    """Blob folder of a loaded snapshot, blobs are memory-mapped when resolved."""
+    def __init__(self, dirName=None):
+        self.dirName = dirName
+        self.blobDir = None
+        self._maps = {}
+
+    def __bool__(self):
+        return bool(self.dirName)
+
+    def setSnapshotPath(self, filePath):
+        # The folder name is stored relative to the snapshot
+        if self.dirName:
+            self.blobDir = os.path.join(os.path.dirname(filePath.rstrip("/\\")), self.dirName)
+
+    def buffer(self, key):
+        if key not in self._maps:
+            with open(os.path.join(self.blobDir, key + ".blob"), "rb") as f:
+                try:
+                    self._maps[key] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:
+                    # Empty files cannot be mapped
+                    self._maps[key] = f.read()
+        return self._maps[key]
+
+    def load(self, ref):
+        payload = self.buffer(ref[BLOB_KEY])
+        if ref["kind"] == "text":
+            return payload[:].decode("utf-8")
+        if nodeJsonCodec.BACKEND == "orjson":
+            return nodeJsonCodec.loads(memoryview(payload))
+        return nodeJsonCodec.loads(payload[:])
+
+    def resolve(self, value):
+        if not self.blobDir:
+            return value
+        if isBlobRef(value):
+            return self.load(value)
+        if isinstance(value, list):
+            return [self.resolve(item) for item in value]
+        if isinstance(value, dict):
+            return {key: self.resolve(item) for key, item in value.items()}
+        return value
+
+    def close(self):
+        for payload in self._maps.values():
+            if isinstance(payload, mmap.mmap):
+                payload.close()
+        self._maps.clear()
+
+
+def summarizeBlobs(value):
+    """Replace blob references by a short description, for display."""
+    if isBlobRef(value):
+        return f"<{value['kind']} blob, {value.get('size', 0) / (1024.0 * 1024.0):.1f} MB>"
+    if isinstance(value, list):
+        return [summarizeBlobs(item) for item in value]
+    if isinstance(value, dict):
+        return {key: summarizeBlobs(item) for key, item in value.items()}
+    return value
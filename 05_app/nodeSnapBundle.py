@@ -0,0 +1,170 @@
+# ****************************************************************************************
+# Content : Sharded snapshot bundles, a directory or zip of a manifest plus node shards
+# -----
+# Date:
+# Created  : 19/10/2026
+# Modified : 19/10/2026
+# -----
+# Dependencies = os, shutil, zipfile, concurrent.futures, nodeJsonCodec
+# -----
+# Author  : Mayank Modi
+# Email   : mayank_modi@outlook.com
+# ****************************************************************************************
+
+import os
+import shutil
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+import nodeJsonCodec
+
+BUNDLE_SUFFIX  = ".nsbundle"
+MANIFEST       = "manifest.json"
+BUNDLE_FORMAT  = "nodesnap-bundle"
+BUNDLE_VERSION = 1
+
+# Top-level snapshot keys besides "nodes" and "meta", carried in the manifest
+SNAPSHOT_TABLES = ("strings", "blobs", "definitions", "labels")
+
+# Records per shard, top-level nodes are never split across shards
+NODES_PER_SHARD = 1000
+
+# Bundles are written here next to their final path, then renamed into place
+TEMP_SUFFIX = ".tmp"
+
+
+def isBundle(filePath):
+    # Only .nsbundle folders (or their manifest) and zips, any other folder is left alone
+    return bundleRoot(filePath).rstrip("/\\").lower().endswith((BUNDLE_SUFFIX, ".zip"))
+
+
+def bundleRoot(filePath):
+    if os.path.basename(filePath) == MANIFEST:
+        return os.path.dirname(filePath)
+    return filePath
+
+
+def sourceFile(filePath):
+    """File whose size/mtime change with every save, used for index staleness checks."""
+    root = bundleRoot(filePath)
+    return os.path.join(root, MANIFEST) if os.path.isdir(root) else root
+
+
+def countRecords(nodeData):
+    count = 0
+    stack = [nodeData]
+    while stack:
+        current = stack.pop()
+        count += 1
+        if isinstance(current, dict):
+            stack.extend((current.get("child") or {}).values())
+    return count
+
+
+def splitShards(nodesData, nodesPerShard=NODES_PER_SHARD):
+    shard, shardCount = {}, 0
+    for nodeName, nodeData in nodesData.items():
+        shard[nodeName] = nodeData
+        shardCount += countRecords(nodeData)
+        if shardCount >= nodesPerShard:
+            yield shard
+            shard, shardCount = {}, 0
+    if shard:
+        yield shard
+
+
+def _writeShard(root, shardName, shardNodes):
+    nodeJsonCodec.dump({"nodes": shardNodes}, os.path.join(root, shardName), pretty=False)
+    return shardName
+
+
+def writeBundle(data, filePath, nodesPerShard=NODES_PER_SHARD, workers=None):
+    root = bundleRoot(filePath)
+    if not isBundle(root):
+        raise ValueError(f"{filePath} is not a {BUNDLE_SUFFIX} folder or .zip path")
+    if os.path.isdir(root) and not os.path.isfile(os.path.join(root, MANIFEST)):
+        raise ValueError(f"{root} exists and is not a node snapshot bundle, it is not overwritten")
+    shards = [(f"shard_{number:05d}.json", shardNodes)
+              for number, shardNodes in enumerate(splitShards(data.get("nodes", {}), nodesPerShard))]
+    manifest = {
+        "format"  : BUNDLE_FORMAT,
+        "version" : data.get("version"),
+        "bundle"  : BUNDLE_VERSION,
+        "meta"    : data.get("meta", {}),
+        "shards"  : [{"file": shardName, "nodes": list(shardNodes)} for shardName, shardNodes in shards],
+    }
+
+    manifest.update((key, data[key]) for key in SNAPSHOT_TABLES if data.get(key))
+
+    # A bundle is never seen half written, readers get the old or the new one
+    tempRoot = root.rstrip("/\\") + TEMP_SUFFIX
+    _removePath(tempRoot)
+
+    if root.lower().endswith(".zip"):
+        # Shards are encoded concurrently, ZipFile itself only takes one writer
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            encoded = list(pool.map(lambda shard: nodeJsonCodec.dumpsBytes({"nodes": shard[1]}, pretty=False), shards))
+        with zipfile.ZipFile(tempRoot, "w", zipfile.ZIP_DEFLATED) as bundle:
+            for (shardName, _), payload in zip(shards, encoded):
+                bundle.writestr(shardName, payload)
+            bundle.writestr(MANIFEST, nodeJsonCodec.dumpsBytes(manifest))
+        os.replace(tempRoot, root)
+        return root
+
+    os.makedirs(tempRoot)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(lambda shard: _writeShard(tempRoot, *shard), shards))
+    nodeJsonCodec.dump(manifest, os.path.join(tempRoot, MANIFEST))
+
+    # A directory cannot be replaced in one rename, the old one is moved aside first
+    oldRoot = None
+    if os.path.exists(root):
+        oldRoot = root.rstrip("/\\") + ".old"
+        _removePath(oldRoot)
+        os.rename(root, oldRoot)
+    os.rename(tempRoot, root)
+    if oldRoot:
+        _removePath(oldRoot)
+    return root
+
+
+def _removePath(path):
+    if os.path.isdir(path):
+        shutil.rmtree(path)
+    elif os.path.exists(path):
+        os.remove(path)
+
+
+def _readMember(root, memberName):
+    if os.path.isdir(root):
+        with open(os.path.join(root, memberName), "rb") as f:
+            return f.read()
+    with zipfile.ZipFile(root) as bundle:
+        return bundle.read(memberName)
+
+
+def readManifest(filePath):
+    manifest = nodeJsonCodec.loads(_readMember(bundleRoot(filePath), MANIFEST))
+    if manifest.get("format") != BUNDLE_FORMAT:
+        raise ValueError(f"{filePath} is not a node snapshot bundle")
+    return manifest
+
+
+def readBundle(filePath, workers=None):
+    """Decode every shard and merge them back into one snapshot dict."""
+    root = bundleRoot(filePath)
+    manifest = readManifest(root)
+    shardNames = [shard["file"] for shard in manifest["shards"]]
+
+    # Only reading (and inflating) the shards overlaps, which helps on network shares.
+    # Decoding holds the GIL and gains nothing from threads, so it runs as they arrive.
+    nodesData = {}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for payload in pool.map(_readMember, [root] * len(shardNames), shardNames):
+            nodesData.update(nodeJsonCodec.loads(payload).get("nodes", {}))
+
+    data = {"nodes": nodesData, "meta": manifest.get("meta", {})}
+    data.update((key, manifest[key]) for key in SNAPSHOT_TABLES if manifest.get(key))
+    if manifest.get("version") is not None:
+        data["version"] = manifest["version"]
+    return data
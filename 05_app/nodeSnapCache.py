@@ -0,0 +1,177 @@
+# ****************************************************************************************
+# Content : Hidden prototype networks of imported templates, copied on repeated loads
+# -----
+# Date:
+# Created  : 19/10/2026
+# Modified : 19/10/2026
+# -----
+# Dependencies = time, hashlib, hou
+# -----
+# Author  : Mayank Modi
+# Email   : mayank_modi@outlook.com
+# ****************************************************************************************
+
+# Every import is copied once into an entry subnet of a hidden container, one container per
+# network type. Entries are keyed by the snapshot hash, the checked paths and the parms edited
+# in the session, a changed snapshot gets a new key and its old entries are removed. An import spanning several
+# networks has one entry per network, the entries of a key are only used and removed together.
+
+import time
+import hashlib
+
+import hou
+
+CACHE_NAME = "__nodesnap_cache__"
+
+# Network type -> (where its container lives, container node type). Only networks whose
+# contents do nothing until something points at them, cached lights, cameras or stages
+# would still render, so object and LOP level imports are not cached.
+CONTAINERS = {
+    "Sop"    : ("/obj", "geo"),
+    "Vop"    : ("/mat", "subnet"),
+}
+
+# Least recently used entries are removed past either limit
+MAX_ENTRIES      = 32
+MAX_CACHED_NODES = 20000
+
+KEY_DATA    = "nodesnap_key"
+SOURCE_DATA = "nodesnap_source"
+HASH_DATA   = "nodesnap_hash"
+TARGET_DATA = "nodesnap_target"
+USED_DATA   = "nodesnap_used"
+SIZE_DATA   = "nodesnap_size"
+COUNT_DATA  = "nodesnap_count"
+
+
+def cacheKey(snapshotHash, checkedPaths, targetNetwork="", edits=()):
+    """``edits`` are (record index, parms) pairs of the records whose parms differ from the file."""
+    digest = hashlib.sha1(f"{snapshotHash}>{targetNetwork}".encode("utf-8"))
+    for path in sorted(checkedPaths):
+        digest.update(b"\0" + path.encode("utf-8"))
+    for index, parms in sorted(edits, key=lambda edit: edit[0]):
+        digest.update(f"\1{index}={parms!r}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def container(category, create=True):
+    if category is None or category.name() not in CONTAINERS:
+        return None
+
+    rootPath, typeName = CONTAINERS[category.name()]
+    containerPath = f"{rootPath}/{CACHE_NAME}{category.name().lower()}"
+    node = hou.node(containerPath)
+    if node is None and create and hou.node(rootPath):
+        node = hou.node(rootPath).createNode(typeName, CACHE_NAME + category.name().lower())
+        node.hide(True)
+        if hasattr(node, "setDisplayFlag"):
+            node.setDisplayFlag(False)
+    return node
+
+
+def entries():
+    for category in hou.nodeTypeCategories().values():
+        cacheNode = container(category, create=False)
+        if cacheNode is not None:
+            yield from cacheNode.children()
+
+
+def find(key):
+    return [entry for entry in entries() if entry.userData(KEY_DATA) == key]
+
+
+def byKey():
+    cached = {}
+    for entry in entries():
+        cached.setdefault(entry.userData(KEY_DATA), []).append(entry)
+    return cached
+
+
+def complete(cached):
+    return bool(cached) and all(entry.userData(COUNT_DATA) == str(len(cached)) for entry in cached)
+
+
+def instantiate(key):
+    """
+    Copy the cached networks of ``key`` into their targets. Returns None when they are not
+    all cached or any of the cached nodes already exists, the normal import reuses those.
+    """
+    cached = find(key)
+    targets = [hou.node(entry.userData(TARGET_DATA) or "") for entry in cached]
+    if not complete(cached) or None in targets:
+        return None
+
+    for entry, target in zip(cached, targets):
+        if any(hou.node(f"{target.path()}/{child.name()}") for child in entry.children()):
+            return None
+
+    createdNodes = []
+    for entry, target in zip(cached, targets):
+        createdNodes.extend(hou.copyNodesTo(entry.children(), target))
+        entry.setUserData(USED_DATA, repr(time.time()))
+    return createdNodes
+
+
+def store(key, filePath, snapshotHash, nodes):
+    """Copy freshly imported top-level ``nodes`` into new cache entries under ``key``."""
+    invalidate(filePath, snapshotHash)
+    for entry in find(key):
+        entry.destroy()
+
+    byParent = {}
+    for node in nodes:
+        byParent.setdefault(node.parent().path(), []).append(node)
+
+    # A network type without a container would leave the template partly cached
+    categories = [parentNodes[0].parent().childTypeCategory() for parentNodes in byParent.values()]
+    if not all(category is not None and category.name() in CONTAINERS for category in categories):
+        return
+
+    for number, (parentPath, parentNodes) in enumerate(byParent.items()):
+        # trim() removes what was stored of an entry set that cannot be completed
+        cacheNode = container(categories[number])
+        if cacheNode is None:
+            break
+
+        entry = cacheNode.createNode("subnet", f"entry_{key[:12]}_{number}")
+        copies = hou.copyNodesTo(parentNodes, entry)
+        entry.setUserData(KEY_DATA, key)
+        entry.setUserData(SOURCE_DATA, filePath)
+        entry.setUserData(HASH_DATA, snapshotHash)
+        entry.setUserData(TARGET_DATA, parentPath)
+        entry.setUserData(USED_DATA, repr(time.time()))
+        entry.setUserData(SIZE_DATA, str(sum(len(copy.allSubChildren()) + 1 for copy in copies)))
+        entry.setUserData(COUNT_DATA, str(len(byParent)))
+
+    trim()
+
+
+def invalidate(filePath, snapshotHash):
+    # Entries of an older version of the same snapshot are never hit again
+    for entry in list(entries()):
+        if entry.userData(SOURCE_DATA) == filePath and entry.userData(HASH_DATA) != snapshotHash:
+            entry.destroy()
+
+
+def trim(maxEntries=MAX_ENTRIES, maxNodes=MAX_CACHED_NODES):
+    # Whole keys are removed, incomplete ones first, then the least recently used
+    keys = sorted(
+        byKey().values(),
+        key=lambda cached: (complete(cached), max(float(entry.userData(USED_DATA) or 0) for entry in cached)),
+        reverse=True
+    )
+    count = 0
+    total = 0
+    for cached in keys:
+        count += len(cached)
+        total += sum(int(entry.userData(SIZE_DATA) or 0) for entry in cached)
+        if not complete(cached) or count > maxEntries or total > maxNodes:
+            for entry in cached:
+                entry.destroy()
+
+
+def clear():
+    for category in hou.nodeTypeCategories().values():
+        cacheNode = container(category, create=False)
+        if cacheNode is not None:
+            cacheNode.destroy()
@@ -0,0 +1,212 @@
+# ****************************************************************************************
+# Content : Columnar encoding of keyframe channels found in parmsAsData() output
+# -----
+# Date:
+# Created  : 19/10/2026
+# Modified : 19/10/2026
+# -----
+# Dependencies = sys, base64, array
+# -----
+# Author  : Mayank Modi
+# Email   : mayank_modi@outlook.com
+# ****************************************************************************************
+
+# A list of per-key dicts (time/frame, value, slope, accel, expression, ...) becomes
+#   {"$keys": {"count": N, "fields": [...], "numeric": {field: <base64 little-endian doubles>},
+#              "constants": {field: value shared by every key},
+#              "tables": {field: {"table": [unique strings], "ids": [N ids]}},
+#              "other": {field: [N values]},
+#              "missing": {field: [indices of the keys without it]}}}
+# Fields missing on some keys are stored as None in the columns and dropped again on decode,
+# values that were None to begin with stay None.
+
+import sys
+import base64
+from array import array
+
+CHANNEL_KEY = "$keys"
+
+# Short channels are left as they are, the columns would not save anything
+MIN_KEYS = 4
+
+TIME_FIELDS = ("time", "frame", "t")
+
+
+def isKeyframeList(value):
+    if not isinstance(value, list) or len(value) < MIN_KEYS:
+        return False
+    return all(
+        isinstance(key, dict) and "value" in key and any(field in key for field in TIME_FIELDS)
+        for key in value
+    )
+
+
+def isChannel(value):
+    return isinstance(value, dict) and len(value) == 1 and CHANNEL_KEY in value
+
+
+def hasChannels(value):
+    if isChannel(value):
+        return True
+    if isinstance(value, list):
+        return any(hasChannels(item) for item in value)
+    if isinstance(value, dict):
+        return any(hasChannels(item) for item in value.values())
+    return False
+
+
+def packColumn(column):
+    packed = array("d", column)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return base64.b64encode(packed.tobytes()).decode("ascii")
+
+
+def unpackColumn(encoded):
+    packed = array("d")
+    packed.frombytes(base64.b64decode(encoded))
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed
+
+
+def _isNumber(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def encodeKeys(keys):
+    fields = []
+    for key in keys:
+        fields.extend(field for field in key if field not in fields)
+
+    numeric, constants, tables, other, missing = {}, {}, {}, {}, {}
+    for field in fields:
+        column = [key.get(field) for key in keys]
+        absent = [index for index, key in enumerate(keys) if field not in key]
+        if absent:
+            missing[field] = absent
+        present = [item for item in column if item is not None]
+
+        # Slopes, accels and interpolation are usually the same on every key
+        if isinstance(column[0], (int, float, str)) and all(
+            item == column[0] and type(item) is type(column[0]) for item in column
+        ):
+            constants[field] = column[0]
+        elif present and all(_isNumber(item) for item in present) and len(present) == len(column):
+            numeric[field] = packColumn(column)
+        elif present and all(isinstance(item, str) for item in present):
+            table = []
+            tableIds = {}
+            ids = []
+            for item in column:
+                if item is None:
+                    ids.append(-1)
+                    continue
+                if item not in tableIds:
+                    tableIds[item] = len(table)
+                    table.append(item)
+                ids.append(tableIds[item])
+            tables[field] = {"table": table, "ids": ids}
+        else:
+            other[field] = column
+
+    # Integer fields (frame numbers) are restored as integers
+    integers = [field for field in numeric if all(isinstance(key.get(field), int) for key in keys)]
+
+    channel = {"count": len(keys), "fields": fields, "numeric": numeric, "constants": constants,
+               "tables": tables, "other": other, "missing": missing}
+    if integers:
+        channel["integers"] = integers
+    return {CHANNEL_KEY: channel}
+
+
+def decodeKeys(channelValue):
+    channel = channelValue[CHANNEL_KEY]
+    count = channel["count"]
+    keys = [{} for _ in range(count)]
+    integers = set(channel.get("integers", ()))
+
+    columns = {field: [value] * count for field, value in channel.get("constants", {}).items()}
+    for field, column in channel.get("numeric", {}).items():
+        values = unpackColumn(column)
+        columns[field] = [int(item) for item in values] if field in integers else values.tolist()
+    for field, tableData in channel.get("tables", {}).items():
+        table = tableData["table"]
+        columns[field] = [table[tableId] if tableId >= 0 else None for tableId in tableData["ids"]]
+    columns.update(channel.get("other", {}))
+
+    # Channels written without "missing" never kept None values apart from absent fields
+    missing = channel.get("missing")
+
+    # Keep the original field order of every key
+    for field in channel["fields"]:
+        column = columns.get(field)
+        if column is None:
+            continue
+        if missing is None:
+            for key, item in zip(keys, column):
+                if item is not None:
+                    key[field] = item
+            continue
+        absent = set(missing.get(field, ()))
+        for index, (key, item) in enumerate(zip(keys, column)):
+            if index not in absent:
+                key[field] = item
+    return keys
+
+
+def encodeChannels(value):
+    if isKeyframeList(value):
+        return encodeKeys(value)
+    if isinstance(value, list):
+        return [encodeChannels(item) for item in value]
+    if isinstance(value, dict):
+        return {key: encodeChannels(item) for key, item in value.items()}
+    return value
+
+
+def decodeChannels(value):
+    if isChannel(value):
+        return decodeKeys(value)
+    if isinstance(value, list):
+        return [decodeChannels(item) for item in value]
+    if isinstance(value, dict):
+        return {key: decodeChannels(item) for key, item in value.items()}
+    return value
+
+
+def summarizeChannels(value):
+    """Replace channels by a short description, for display."""
+    if isChannel(value):
+        channel = value[CHANNEL_KEY]
+        timeField = next((field for field in TIME_FIELDS if field in channel.get("numeric", {})), None)
+        if timeField and channel["count"]:
+            times = unpackColumn(channel["numeric"][timeField])
+            return f"<{channel['count']} keys, {timeField} {min(times):g}-{max(times):g}>"
+        return f"<{channel['count']} keys>"
+    if isinstance(value, list):
+        return [summarizeChannels(item) for item in value]
+    if isinstance(value, dict):
+        return {key: summarizeChannels(item) for key, item in value.items()}
+    return value
+
+
+def encodeSnapshotChannels(data):
+    """
+    Encode the keyframe channels in place, in every node's "parm" dict and in the
+    childrenAsData() payloads of "children_data" and the definitions table.
+    """
+    stack = list(data.get("nodes", {}).values())
+
+    while stack:
+        nodeData = stack.pop()
+        if not isinstance(nodeData, dict):
+            continue
+        for key in ("parm", "children_data"):
+            if isinstance(nodeData.get(key), dict):
+                nodeData[key] = encodeChannels(nodeData[key])
+        stack.extend((nodeData.get("child") or {}).values())
+
+    if isinstance(data.get("definitions"), dict):
+        data["definitions"] = encodeChannels(data["definitions"])
+    return data
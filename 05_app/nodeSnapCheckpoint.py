@@ -0,0 +1,80 @@
+# ****************************************************************************************
+# Content : Checkpoints of chunked imports, so an interrupted load can resume or roll back
+# -----
+# Date:
+# Created  : 19/10/2026
+# Modified : 19/10/2026
+# -----
+# Dependencies = os, hashlib, tempfile, nodeJsonCodec
+# -----
+# Author  : Mayank Modi
+# Email   : mayank_modi@outlook.com
+# ****************************************************************************************
+
+# One checkpoint per snapshot file, written to the Houdini temp dir after every chunk:
+#   {"source", "hash", "target", "checked": [...], "done": [record paths], "created": [node paths]}
+
+import os
+import hashlib
+import tempfile
+
+import nodeJsonCodec
+
+CHECKPOINT_SUFFIX = ".nscheckpoint"
+
+
+def checkpointPath(filePath):
+    tempDir = os.environ.get("HOUDINI_TEMP_DIR") or tempfile.gettempdir()
+    key = hashlib.sha1(os.path.abspath(filePath).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(tempDir, f"nodesnap_{key}{CHECKPOINT_SUFFIX}")
+
+
+class Checkpoint:
+    def __init__(self, source, snapshotHash, checkedPaths, target=""):
+        self.source  = source
+        self.hash    = snapshotHash
+        self.target  = target
+        self.checked = sorted(checkedPaths)
+        self.done    = []
+        self.created = []
+
+    def matches(self, snapshotHash, checkedPaths, target=""):
+        return self.hash == snapshotHash and self.checked == sorted(checkedPaths) and self.target == target
+
+    def save(self):
+        # Models built in memory have no file to resume from
+        if not self.source:
+            return
+
+        data = {
+            "source"  : self.source,
+            "hash"    : self.hash,
+            "target"  : self.target,
+            "checked" : self.checked,
+            "done"    : self.done,
+            "created" : self.created,
+        }
+        # Written beside and swapped in, a crash mid-write keeps the previous checkpoint
+        path = checkpointPath(self.source)
+        nodeJsonCodec.dump(data, path + ".tmp", pretty=False)
+        os.replace(path + ".tmp", path)
+
+    def remove(self):
+        path = checkpointPath(self.source) if self.source else ""
+        if path and os.path.exists(path):
+            os.remove(path)
+
+    @classmethod
+    def load(cls, source):
+        """Return the checkpoint left by an unfinished load of ``source``, or None."""
+        path = checkpointPath(source)
+        if not os.path.exists(path):
+            return None
+        try:
+            data = nodeJsonCodec.load(path)
+            checkpoint = cls(data["source"], data["hash"], data["checked"], data.get("target", ""))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        checkpoint.done    = data.get("done", [])
+        checkpoint.created = data.get("created", [])
+        return checkpoint
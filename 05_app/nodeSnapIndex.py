@@ -0,0 +1,195 @@
+# ****************************************************************************************
+# Content : Sidecar skeleton index of a snapshot, enough to show the tree and meta panel
+# -----
+# Date:
+# Created  : 19/10/2026
+# Modified : 19/10/2026
+# -----
+# Dependencies = os, sys, copy, hashlib, threading, nodeJsonCodec, nodeSnapModel, nodeSnapBundle
+# -----
+# Author  : Mayank Modi
+# Email   : mayank_modi@outlook.com
+# ****************************************************************************************
+
+import os
+import sys
+import copy
+import hashlib
+import threading
+
+import nodeJsonCodec
+import nodeSnapBundle
+from nodeSnapModel import NodeRecord, SnapshotModel
+
+INDEX_VERSION = 1
+
+# Not ".json", so template directory scans never pick the index up as a snapshot
+INDEX_SUFFIX = ".nsidx"
+
+_rebuildThreads = {}
+
+
+def indexPath(filePath):
+    # The full name is kept, a.json, a.ndjson and a.zip each get their own index
+    return nodeSnapBundle.bundleRoot(filePath).rstrip("/\\") + INDEX_SUFFIX
+
+
+def fileHash(filePath):
+    digest = hashlib.sha1()
+    with open(filePath, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def snapshotHash(filePath):
+    # A current index already holds the hash, the file is only read without one
+    index = readIndex(filePath)
+    if index is not None and index["source"].get("hash"):
+        return index["source"]["hash"]
+    return fileHash(nodeSnapBundle.sourceFile(filePath))
+
+
+def skeleton(model):
+    """Everything the index keeps of ``model``, copied so the model can change afterwards."""
+    # Nodes of one type mostly share their parm names, so each set is stored once
+    parmSets = []
+    parmSetIds = {}
+    records = []
+    for record in model.records:
+        parmNames = tuple(record.parms)
+        parmSetId = parmSetIds.setdefault(parmNames, len(parmSets))
+        if parmSetId == len(parmSets):
+            parmSets.append(parmNames)
+
+        records.append([
+            record.name, record.type, record.path, record.parentIndex, record.root,
+            record.parentName, record.parentType, int(record.native), parmSetId,
+        ])
+
+    return {
+        "version"  : INDEX_VERSION,
+        "meta"     : copy.deepcopy(model.meta),
+        "counts"   : {
+            "nodes"  : len(model.records),
+            "native" : sum(1 for record in model.records if record.native),
+            "parms"  : sum(len(record.parms) for record in model.records),
+        },
+        "parmSets" : parmSets,
+        "records"  : records,
+    }
+
+
+def sourceStats(filePath):
+    sourcePath = nodeSnapBundle.sourceFile(filePath)
+    stat = os.stat(sourcePath)
+    return {"mtime": stat.st_mtime, "size": stat.st_size, "hash": fileHash(sourcePath)}
+
+
+def buildIndex(model, filePath):
+    return dict(skeleton(model), source=sourceStats(filePath))
+
+
+def saveIndex(index, filePath):
+    try:
+        nodeJsonCodec.dump(index, indexPath(filePath), pretty=False)
+    except OSError:
+        # Read-only template locations simply go without an index
+        return False
+    return True
+
+
+def writeSkeleton(skeletonData, filePath):
+    try:
+        index = dict(skeletonData, source=sourceStats(filePath))
+    except OSError:
+        return False
+    return saveIndex(index, filePath)
+
+
+def writeIndex(model, filePath):
+    return writeSkeleton(skeleton(model), filePath)
+
+
+def readIndex(filePath):
+    """Return the index of ``filePath`` or None when it is missing or stale."""
+    path = indexPath(filePath)
+    if not os.path.exists(path):
+        return None
+
+    try:
+        index = nodeJsonCodec.load(path)
+        source = index["source"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    if index.get("version") != INDEX_VERSION:
+        return None
+
+    # mtime and size are checked first so an unchanged file is never hashed
+    sourcePath = nodeSnapBundle.sourceFile(filePath)
+    stat = os.stat(sourcePath)
+    if source.get("mtime") == stat.st_mtime and source.get("size") == stat.st_size:
+        return index
+    if source.get("size") == stat.st_size and source.get("hash") == fileHash(sourcePath):
+        # Touched but unchanged, the new mtime spares the next open from hashing again
+        source["mtime"] = stat.st_mtime
+        saveIndex(index, filePath)
+        return index
+
+    return None
+
+
+def modelFromIndex(index, filePath):
+    model = SnapshotModel()
+    model.meta   = index.get("meta", {})
+    model.source = filePath
+    model.loaded = False
+
+    parmSets = index.get("parmSets", [])
+    for name, typeName, path, parentIndex, root, parentName, parentType, native, parmSetId in index["records"]:
+        record = NodeRecord(len(model.records), name, typeName, path, parentIndex)
+        record.root       = sys.intern(root)
+        record.parentName = sys.intern(parentName)
+        record.parentType = sys.intern(parentType)
+        record.native     = bool(native)
+
+        # Parm names only, so the tree filter works before the payload is decoded
+        record.parms = dict.fromkeys(map(sys.intern, parmSets[parmSetId]))
+
+        model.records.append(record)
+        model.byPath[record.fullPath] = record.index
+        if parentIndex is None:
+            model.roots.append(record.index)
+        else:
+            model.records[parentIndex].children.append(record.index)
+
+    return model
+
+
+def rebuildInBackground(model, filePath):
+    thread = _rebuildThreads.get(filePath)
+    if thread is not None and thread.is_alive():
+        return thread
+
+    # The thread gets a copy of the records, the loader edits the model meanwhile
+    thread = threading.Thread(target=writeSkeleton, args=(skeleton(model), filePath), daemon=True)
+    _rebuildThreads[filePath] = thread
+    thread.start()
+    return thread
+
+
+def openModel(filePath):
+    """
+    Open ``filePath`` from its index when it is current, leaving the payload to
+    SnapshotModel.ensureLoaded(). Otherwise decode it in full and rebuild the index.
+    """
+    index = readIndex(filePath)
+    if index is not None:
+        try:
+            return modelFromIndex(index, filePath)
+        except (KeyError, TypeError, ValueError, IndexError):
+            pass
+
+    model = SnapshotModel.load(filePath)
+    rebuildInBackground(model, filePath)
+    return model
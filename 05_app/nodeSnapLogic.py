@@ -3,165 +3,491 @@
 # -----
 # Date:
 # Created  : 29/04/2025
-# Modified : 15/06/2025
+# Modified : 19/10/2026
 # -----
-# Dependencies = hou
+# Dependencies = hashlib, time, hou, nodeJsonCodec, nodeSnapModel, nodeSnapChannels, nodeSnapRemap, nodeSnapProfile
 # -----
 # Author  : Mayank Modi
 # Email   : mayank_modi@outlook.com
 # ****************************************************************************************
 
+import hashlib
+from time import perf_counter
+
 import hou
 
+import nodeJsonCodec
+import nodeSnapProfile
+from nodeSnapModel import SCHEMA_VERSION, unpackParms
+from nodeSnapChannels import isChannel, hasChannels, decodeKeys, decodeChannels
+from nodeSnapRemap import PathRemapper
+
+FLAG_NAMES = ("display", "render", "template", "bypass")
+
+# asData()/childrenAsData() options of the native export, everything setChildrenFromData() restores
+NATIVE_OPTIONS = {"children": True, "editables": True, "inputs": True, "position": True, "flags": True, "parms": True}
+
 class NodeSnapLogic:
     def __init__(self):
-        pass
+        # Source prefix -> target network of the next import, empty imports in place
+        self.remapper = PathRemapper({})
+
+        # Per-node phase timings of imports, see nodeSnapProfile
+        self.profiler = nodeSnapProfile.DISABLED
+
+    def targetPath(self, path):
+        return self.remapper.remapPath(path) if self.remapper else path
+
+    def targetParentPath(self, record):
+        # Only imported nodes are remapped, so the parent path follows the node's own target
+        return self.targetPath(record.fullPath).rsplit("/", 1)[0] + "/"
+
+    def definitionKey(self, node):
+        """Key of a locked HDA's contents, None when the node's contents are editable."""
+        definition = node.type().definition()
+        if definition is None or not node.isLockedHDA():
+            return None
+        libraryFile = definition.libraryFilePath()
+        version = f"{node.type().nameWithCategory()}|{libraryFile}|{definition.modificationTime()}"
+        return hashlib.sha1(version.encode("utf-8")).hexdigest()
+
+    def childrenToData(self, node, definitions):
+        # childrenAsData() reads locked contents as they are, nothing is unlocked.
+        # Every instance of the same definition shares one payload in "definitions",
+        # which is filled per export so definitions edited in the session are read again.
+        definitionKey = self.definitionKey(node)
+        if definitionKey is None:
+            return {"children_data": node.childrenAsData()}
+
+        if definitionKey not in definitions:
+            definitions[definitionKey] = node.childrenAsData()
+        return {"definition": definitionKey}
+
+    def contentsMatch(self, node, nativeData):
+        # Compared as they would be written, so tuples and lists or int and float keys match
+        current = nodeJsonCodec.loads(nodeJsonCodec.dumpsBytes(node.childrenAsData(), pretty=False, compatible=False))
+        return self.remapper.remapValue(current) == nativeData
+
+    def nodeToData(self, node, rootPath):
+        return {
+            "path"          : node.parent().path().rstrip("/") + "/",
+            "type"          : node.type().name(),
+            "parent"        : {
+                "name"      : node.parent().name(),
+                "type"      : node.parent().type().name()
+                              },
+            "root"          : rootPath,
+            "parm"          : node.parmsAsData(),
+            "parm_label"    : {parm.name(): parm.description() for parm in node.parms()},
+            "input"         : node.inputsAsData(),
+            "flag"          : {
+                "display"   : node.isDisplayFlagSet() if hasattr(node, 'isDisplayFlagSet') else False,
+                "render"    : node.isRenderFlagSet() if hasattr(node, 'isRenderFlagSet') else False,
+                "template"  : node.isTemplateFlagSet() if hasattr(node, 'isTemplateFlagSet') else False,
+                "bypass"    : node.isBypassed() if hasattr(node, 'isBypassed') else False
+                              },
+            "child"         : {}
+        }
 
     def exportSelectedNodesToJson(self):
         selectedNodes = hou.selectedNodes()
-        outputNodes   = {"nodes": {}}
+        outputNodes   = {"version": SCHEMA_VERSION, "nodes": {}, "definitions": {}}
 
         for node in selectedNodes:
             path     = node.parent().path().rstrip("/")
             rootPath = "/".join(path.split("/")[:2]) + "/"
-
-            nodeDict = {
-                "path"          : node.parent().path().rstrip("/") + "/",
-                "type"          : node.type().name(),
-                "parent"        : {
-                    "name"      : node.parent().name(),
-                    "type"      : node.parent().type().name()
-                                  },
-                "root"          : rootPath,
-                "parm"          : node.parmsAsData(),
-                "parm_label"    : {parm.name(): parm.description() for parm in node.parms()},
-                "input"         : node.inputsAsData(),
-                "flag"          : {
-                    "display"   : node.isDisplayFlagSet() if hasattr(node, 'isDisplayFlagSet') else False,
-                    "render"    : node.isRenderFlagSet() if hasattr(node, 'isRenderFlagSet') else False,
-                    "template"  : node.isTemplateFlagSet() if hasattr(node, 'isTemplateFlagSet') else False,
-                    "bypass"    : node.isBypassed() if hasattr(node, 'isBypassed') else False
-                                  },
-                "child"         : {}
-            }
+            nodeDict = self.nodeToData(node, rootPath)
 
             for child in node.children():
-                childData = {
-                    "name"          : child.name(),
-                    "path"          : child.parent().path().rstrip("/") + "/",
-                    "type"          : child.type().name(),
-                    "parent"        : {
-                        "name"      : child.parent().name(),
-                        "type"      : child.parent().type().name()
-                                      },
-                    "root"          : rootPath,
-                    "parm"          : child.parmsAsData(),
-                    "parm_label"    : {parm.name(): parm.description() for parm in child.parms()},
-                    "input"         : child.inputsAsData(),
-                    "flag"          : {
-                        "display"   : child.isDisplayFlagSet() if hasattr(child, 'isDisplayFlagSet') else False,
-                        "render"    : child.isRenderFlagSet() if hasattr(child, 'isRenderFlagSet') else False,
-                        "template"  : child.isTemplateFlagSet() if hasattr(child, 'isTemplateFlagSet') else False,
-                        "bypass"    : child.isBypassed() if hasattr(child, 'isBypassed') else False
-                                      },
-                    "grandchild": {}
-                }
+                childData = self.nodeToData(child, rootPath)
 
                 if child.type().name().endswith(("solver", "net", "vop")):
-                    child.allowEditingOfContents()
-                    childData["grandchild"] = child.childrenAsData()
-                    child.matchCurrentDefinition()
+                    childData.update(self.childrenToData(child, outputNodes["definitions"]))
                 else:
                     for grandchild in child.children():
-                        grandchildData = {
-                            "name"          : grandchild.name(),
-                            "path"          : grandchild.parent().path().rstrip("/") + "/",
-                            "type"          : grandchild.type().name(),
-                            "parent"        : {
-                                "name"      : grandchild.parent().name(),
-                                "type"      : grandchild.parent().type().name()
-                                              },
-                            "root"          : rootPath,
-                            "parm"          : grandchild.parmsAsData(),
-                            "parm_label"    : {parm.name(): parm.description() for parm in grandchild.parms()},
-                            "input"         : grandchild.inputsAsData(),
-                            "flag"          : {
-                                "display"   : grandchild.isDisplayFlagSet() if hasattr(grandchild, 'isDisplayFlagSet') else False,
-                                "render"    : grandchild.isRenderFlagSet() if hasattr(grandchild, 'isRenderFlagSet') else False,
-                                "template"  : grandchild.isTemplateFlagSet() if hasattr(grandchild, 'isTemplateFlagSet') else False,
-                                "bypass"    : grandchild.isBypassed() if hasattr(grandchild, 'isBypassed') else False
-                                              }
-                        }
-                        
-                        childData["grandchild"][grandchild.name()] = grandchildData
+                        grandchildData = self.nodeToData(grandchild, rootPath)
+                        del grandchildData["child"]
+                        childData["child"][grandchild.name()] = grandchildData
 
                 nodeDict["child"][child.name()] = childData
 
             outputNodes["nodes"][node.name()] = nodeDict
 
+        if not outputNodes["definitions"]:
+            del outputNodes["definitions"]
         return outputNodes
 
-    def importNodesFromJson(self, allNodeData, nodeDataDict):
+    def collectLabels(self, nodeType, payload, labels):
+        # Labels are read once per node type from its parm templates, not per parm
+        typeCache = {}
+        stack = [(nodeType, payload)]
+
+        while stack:
+            currentType, currentData = stack.pop()
+            if currentType is None:
+                continue
+
+            typeKey = currentType.nameWithCategory()
+            if typeKey not in typeCache:
+                typeCache[typeKey] = currentType
+                # Keyed with the category, null or subnet exist in several network types
+                typeLabels = labels.setdefault(typeKey, {})
+                for parmTemplate in currentType.parmTemplateGroup().entriesWithoutFolders():
+                    typeLabels.setdefault(parmTemplate.name(), parmTemplate.label())
+
+            childCategory = currentType.childTypeCategory()
+            for childData in (currentData.get("children") or {}).values():
+                if childCategory is None or not isinstance(childData, dict):
+                    continue
+                childKey = f"{childCategory.name()}/{childData.get('type')}"
+                childType = typeCache.get(childKey) or hou.nodeType(childCategory, childData.get("type", ""))
+                stack.append((childType, childData))
+
+    def exportSelectedNodesNative(self):
+        """Export every selected node's subtree with one native asData() call per node."""
+        outputNodes = {"version": SCHEMA_VERSION, "nodes": {}, "labels": {}}
+
+        for node in hou.selectedNodes():
+            payload  = node.asData(**NATIVE_OPTIONS)
+            parent   = node.parent()
+            path     = parent.path().rstrip("/")
+            rootPath = "/".join(path.split("/")[:2]) + "/"
+            flagData = payload.get("flags") or {}
+
+            # The tree below the node stays one payload, applied with setChildrenFromData()
+            nodeDict = {
+                "path"          : path + "/",
+                "type"          : node.type().name(),
+                "parent"        : {"name": parent.name(), "type": parent.type().name()},
+                "root"          : rootPath,
+                "parm"          : payload.get("parms") or {},
+                "input"         : payload.get("inputs"),
+                "flag"          : {flagName: bool(flagData.get(flagName)) for flagName in FLAG_NAMES},
+                "child"         : {}
+            }
+            # Locked HDA contents come back with the definition, see childrenToData()
+            if payload.get("children") and self.definitionKey(node) is None:
+                nodeDict["children_data"] = payload["children"]
+
+            self.collectLabels(node.type(), payload, outputNodes["labels"])
+            outputNodes["nodes"][node.name()] = nodeDict
+
+        return outputNodes
+
+    def captureCookStats(self, nodes, forceCook=False):
+        """
+        Last cook time (ms), cook count and memory per path of ``nodes`` and their contents,
+        as Houdini reports them. Nothing is cooked unless ``forceCook`` is set, which force
+        cooks only ``nodes`` themselves, their contents cook as far as they need to.
+        """
+        stats = {}
+
+        for topNode in nodes:
+            elapsed = None
+            if forceCook:
+                start = perf_counter()
+                try:
+                    topNode.cook(force=True)
+                    elapsed = (perf_counter() - start) * 1000.0
+                except hou.Error:
+                    pass
+
+            for node in (topNode, *topNode.allSubChildren()):
+                # The node's own cook time when Houdini reports it, upstream cooks are not counted
+                lastCookTime = getattr(node, "lastCookTime", None)
+                entry = {
+                    "time"   : lastCookTime() if lastCookTime else (elapsed if node is topNode and elapsed else 0.0),
+                    "cooks"  : node.cookCount() if hasattr(node, "cookCount") else 0,
+                    "memory" : 0,
+                }
+                # geometry() would cook a node that is out of date
+                if isinstance(node, hou.SopNode) and not node.needsToCook() and node.geometry() is not None:
+                    entry["memory"] = node.geometry().intrinsicValue("memoryusage")
+                stats[node.path()] = entry
+
+        return stats
+
+    def createNodesFromRecords(self, records, newPaths=None):
+        # ``newPaths`` collects the nodes created here, as opposed to existing ones reused
         createdNodes = {}
+        newPaths = newPaths if newPaths is not None else []
+
+        profiler = self.profiler
 
-        for node_name, info in allNodeData.items():
-            if node_name in createdNodes:
+        for record in records:
+            fullPath = self.targetPath(record.fullPath)
+
+            # Native records are rebuilt by setChildrenFromData() on their owner
+            if record.native or fullPath in createdNodes:
                 continue
 
-            type_name = info["type"]
-            root_path = info["root"]
-            path = info["path"]
-            parent_info = info.get("parent", {})
-            parent_name = parent_info.get("name")
-            parent_type = parent_info.get("type")
+            start = profiler.mark()
 
-            existing_node = hou.node(f"{path}{node_name}")
-            if existing_node:
-                createdNodes[node_name] = existing_node
+            existingNode = hou.node(fullPath)
+            if existingNode:
+                createdNodes[fullPath] = existingNode
                 continue
 
-            parent = (
-                hou.node(path) or
-                createdNodes.get(parent_name) or
-                hou.node(f"{root_path.rstrip('/')}/{parent_name}")
-            )
-            
-            if not parent and (root := hou.node(root_path)):
-                parent = root.createNode(parent_type, parent_name)
-                createdNodes[parent_name] = parent
+            path       = self.targetParentPath(record)
+            parentPath = path.rstrip("/")
+            parent     = hou.node(path) or createdNodes.get(parentPath)
+
+            # The saved root and parent name only apply to nodes imported in place
+            if not parent and path == record.path:
+                parent = hou.node(f"{record.root.rstrip('/')}/{record.parentName}")
+                if not parent and (root := hou.node(record.root)):
+                    parent = root.createNode(record.parentType, record.parentName)
+                    createdNodes[parent.path()] = parent
+                    newPaths.append(parent.path())
 
             if parent:
-                node = parent.createNode(type_name, node_name)
-                createdNodes[node_name] = node
-
-    def setNodeDataFromJson(self, checkedNodeData, nodeDataDict):
-        if not checkedNodeData:
-            return
-
-        for nodeName, nodeInfo in nodeDataDict["nodes"].items():
-            nodePath = nodeInfo["path"] + nodeName
-            node = hou.node(nodePath)
-            
-            parameterData = nodeInfo.get("parm", {})
-            if parameterData:
-                node.setParmsFromData(parameterData)
-
-            childParameterData = nodeInfo.get("child") or {}
-            if childParameterData:
-                node.setParmsFromData(childParameterData)
-
-            grandchildParameterData = nodeInfo.get("grandchild") or {}
-            if grandchildParameterData:
-                if node.type().name().endswith(("solver", "net", "vop")):
-                    node.setChildrenFromData(grandchildParameterData)
-                else:
-                    node.setParmsFromData(grandchildParameterData)
+                try:
+                    node = parent.createNode(record.type, record.name)
+                except hou.OperationFailed:
+                    continue
+                createdNodes[fullPath] = node
+                newPaths.append(node.path())
+                profiler.add(fullPath, "create", start, record.type)
+
+        return createdNodes
+
+    def recordToPayload(self, model, record, checked, resolve):
+        # childrenAsData()-style entry of a record and its checked descendants
+        if record.native:
+            return self.nativePayload(model, record)
+
+        payload = {"type": record.type}
+        if record.parms:
+            payload["parms"] = decodeChannels(resolve(unpackParms(record.parms)))
+        if record.inputs:
+            payload["inputs"] = record.inputs
+        if record.flags:
+            payload["flags"] = {flagName: True for flagName in FLAG_NAMES if record.flags.get(flagName)}
+
+        # Native records can not be checked, an owner brings its whole childrenAsData() payload
+        children = dict(resolve(record.nativeData)) if record.nativeData and not record.definition else {}
+        for childIndex in record.children:
+            child = model.records[childIndex]
+            # Locked HDA contents are created by the HDA itself
+            if child.fullPath in checked and not (child.native and child.definition):
+                children[child.name] = self.recordToPayload(model, child, checked, resolve)
+        if children:
+            payload["children"] = children
+        return payload
+
+    def nativePayload(self, model, record):
+        # The childrenAsData() entry behind a native record, found through its owner's payload
+        names = []
+        while record.native:
+            names.append(record.name)
+            record = model.records[record.parentIndex]
+
+        childrenData = record.nativeData or {}
+        for name in reversed(names[1:]):
+            childrenData = childrenData[name].get("children") or {}
+        return childrenData[names[0]]
+
+    def importRecordsNative(self, model, records, newPaths=None):
+        """
+        Create checked subtrees with one setChildrenFromData() call per parent.
+        Returns the records left for createNodesFromRecords()/setNodeDataFromRecords(),
+        those whose node already exists, whose parent is missing or that hold locked HDA contents.
+        """
+        checked   = {record.fullPath for record in records}
+        fallback  = []
+        byParent  = {}
+
+        for record in records:
+            parentRecord = model.records[record.parentIndex] if record.parentIndex is not None else None
+            if parentRecord is not None and parentRecord.fullPath in checked:
+                continue
+
+            parent = hou.node(self.targetParentPath(record))
+            if parent is None or hou.node(self.targetPath(record.fullPath)) is not None or record.definition:
+                fallback.extend(self.subtreeRecords(model, record, checked))
+                continue
+            byParent.setdefault(parent.path(), (parent, []))[1].append(record)
+
+        profiler = self.profiler
+        for parent, subtreeRoots in byParent.values():
+            # One call builds the whole group, its time is booked on the parent
+            start = profiler.mark()
+            payload = {record.name: self.recordToPayload(model, record, checked, model.resolve) for record in subtreeRoots}
+            parent.setChildrenFromData(decodeChannels(self.remapper.remapValue(model.resolve(payload))), clear_content=False)
+            if newPaths is not None:
+                newPaths.extend(f"{parent.path().rstrip('/')}/{record.name}" for record in subtreeRoots)
+            start = profiler.add(parent.path(), "children", start, parent.type().name() if profiler else "")
+
+            for record in subtreeRoots:
+                node = parent.node(record.name)
+                if node is not None and not record.native:
+                    node.moveToGoodPosition()
+                    start = profiler.add(node.path() if profiler else "", "layout", start, record.type)
+
+        return fallback
+
+    def subtreeRecords(self, model, record, checked):
+        subtree = []
+        stack = [record]
+        while stack:
+            current = stack.pop()
+            subtree.append(current)
+            stack.extend(model.records[childIndex] for childIndex in reversed(current.children)
+                         if model.records[childIndex].fullPath in checked)
+        return subtree
+
+    def setKeyframes(self, parm, keys):
+        try:
+            keyframes = []
+            for keyData in keys:
+                keyframe = hou.Keyframe()
+                keyframe.fromJSON(keyData)
+                keyframes.append(keyframe)
+            parm.deleteAllKeyframes()
+            parm.setKeyframes(keyframes)
+        except (AttributeError, TypeError, hou.Error):
+            return False
+        return True
+
+    def setParmsWithChannels(self, node, parmData):
+        # Encoded channels are set with one setKeyframes() call per parm instead of
+        # expanding them back into per-key dicts for setParmsFromData()
+        plainData = {}
+
+        for parmName, value in parmData.items():
+            if not hasChannels(value):
+                plainData[parmName] = value
+                continue
+
+            parmTuple = node.parmTuple(parmName)
+            components = value if isinstance(value, list) else [value]
+            batchable = parmTuple is not None and len(components) == len(parmTuple) and all(
+                isChannel(component) or isinstance(component, (int, float, str)) for component in components
+            )
+            if not batchable:
+                plainData[parmName] = decodeChannels(value)
+                continue
+
+            for parm, component in zip(parmTuple, components):
+                if not isChannel(component):
+                    parm.set(component)
+                elif not self.setKeyframes(parm, decodeKeys(component)):
+                    plainData[parmName] = decodeChannels(value)
+                    break
+
+        if plainData:
+            node.setParmsFromData(plainData)
+
+    def resolveInput(self, node, source, nodeIndex):
+        # Input sources are sibling names or full paths, looked up in the nodes just created first
+        if isinstance(source, hou.Node):
+            return source
+        if not isinstance(source, str) or not source:
+            return None
+        path = source if source.startswith("/") else f"{node.parent().path().rstrip('/')}/{source}"
+        return nodeIndex.get(path) or hou.node(path)
+
+    def connectInputs(self, pendingInputs, nodeIndex):
+        """
+        Wire every (node, inputsAsData()) pair once all nodes exist.
+        Returns (node path, input index, source) for every input that could not be connected.
+        """
+        unresolved = []
+
+        profiler = self.profiler
+
+        with hou.undos.group("Connect snapshot inputs"):
+            for fullPath, node, inputs in pendingInputs:
+                start = profiler.mark()
+                for position, inputData in enumerate(inputs):
+                    if not isinstance(inputData, dict):
+                        continue
+                    source = inputData.get("from")
+                    toIndex = inputData.get("to_index", position)
+                    sourceNode = self.resolveInput(node, source, nodeIndex)
+
+                    # A named source that is not in the scene would be looked up again at its old path
+                    if sourceNode is None and isinstance(source, str):
+                        unresolved.append((node.path(), toIndex, source))
+                        continue
+
+                    try:
+                        if sourceNode is not None:
+                            node.setInput(toIndex, sourceNode, inputData.get("from_index", 0))
+                        else:
+                            # Subnet indirect inputs and other forms only Houdini can resolve
+                            node.setInputsFromData([inputData])
+                    except (hou.Error, TypeError):
+                        unresolved.append((node.path(), toIndex, source))
+                profiler.add(fullPath, "inputs", start)
+
+        return unresolved
 
-            inputData = nodeInfo.get("input")
-            if inputData:
-                node.setInputsFromData(inputData)
+    def queueInputs(self, records, nodeIndex):
+        # Inputs of records imported earlier, for a load resumed from a checkpoint
+        pendingInputs = []
+        for record in records:
+            fullPath = self.targetPath(record.fullPath)
+            node = nodeIndex.get(fullPath) or hou.node(fullPath)
+            if not record.native and record.inputs and node is not None:
+                pendingInputs.append((fullPath, node, self.remapper.remapValue(record.inputs)))
+        return pendingInputs
 
-            flagData    = nodeInfo.get("flag", {})
+    def setNodeDataFromRecords(self, records, resolve=None, createdNodes=None, pendingInputs=None):
+        """
+        Set parms, contents and flags of the imported records, then wire all of their inputs.
+        Returns the inputs that could not be connected, see connectInputs(). Chunked imports
+        pass their own ``pendingInputs`` list and connect it once after the last chunk.
+        """
+        nodeIndex = dict(createdNodes or {})
+        connect = pendingInputs is None
+        pendingInputs = [] if connect else pendingInputs
+        # Out-of-line text and sidecar blobs are only read here, for the nodes being imported
+        resolve = resolve or (lambda value: value)
+        remapValue = self.remapper.remapValue
+        profiler = self.profiler
+        definitionMatches = {}
+
+        for record in records:
+            if record.native:
+                continue
+
+            fullPath = self.targetPath(record.fullPath)
+            node = nodeIndex.get(fullPath) or hou.node(fullPath)
+            if node is None:
+                continue
+
+            start = profiler.mark()
+            parms = remapValue(resolve(unpackParms(record.parms))) if record.parms else None
+            nativeData = decodeChannels(remapValue(resolve(record.nativeData))) if record.nativeData else None
+            inputs = remapValue(record.inputs) if record.inputs else None
+            if parms:
+                self.setParmsWithChannels(node, parms)
+            start = profiler.add(fullPath, "parms", start, record.type)
+
+            # Locked HDA contents are recreated by the session's definition, the saved ones
+            # are only applied when that definition's contents differ, checked once per definition
+            if nativeData and record.definition:
+                matchKey = (record.definition, self.definitionKey(node))
+                if matchKey not in definitionMatches:
+                    definitionMatches[matchKey] = self.contentsMatch(node, nativeData)
+                if definitionMatches[matchKey]:
+                    nativeData = None
+
+            unlocked = False
+            if nativeData:
+                if node.type().definition() is not None:
+                    node.allowEditingOfContents()
+                    unlocked = True
+                node.setChildrenFromData(nativeData)
+            start = profiler.add(fullPath, "children", start)
+
+            # Inputs wait until every node exists, upstream siblings can come later in the records
+            nodeIndex[fullPath] = node
+            if inputs:
+                pendingInputs.append((fullPath, node, inputs))
+
+            flagData    = record.flags or {}
             flagMethods =     {
                 "display"   : getattr(node, "setDisplayFlag", None),
                 "render"    : getattr(node, "setRenderFlag", None),
@@ -172,6 +498,12 @@ class NodeSnapLogic:
             for flagName, flagMethod in flagMethods.items():
                 if flagData.get(flagName) and flagMethod:
                     flagMethod(True)
-                    
-            node.matchCurrentDefinition()
-            node.moveToGoodPosition()
\ No newline at end of file
+            start = profiler.add(fullPath, "flags", start)
+
+            # Re-locking would throw away the contents set above
+            if not unlocked:
+                node.matchCurrentDefinition()
+            node.moveToGoodPosition()
+            profiler.add(fullPath, "layout", start)
+
+        return self.connectInputs(pendingInputs, nodeIndex) if connect else []
@@ -0,0 +1,412 @@
+# ****************************************************************************************
+# Content : Canonical in-memory snapshot model and the snapshot schema migrations
+# -----
+# Date:
+# Created  : 19/10/2026
+# Modified : 19/10/2026
+# -----
+# Dependencies = sys, array, nodeJsonCodec, nodeSnapBundle, nodeSnapStream, nodeSnapStrings,
+#                nodeSnapBlobs
+# -----
+# Author  : Mayank Modi
+# Email   : mayank_modi@outlook.com
+# ****************************************************************************************
+
+import sys
+from array import array
+
+import nodeJsonCodec
+import nodeSnapBundle
+import nodeSnapStream
+from nodeSnapStrings import StringTable
+from nodeSnapBlobs import BlobStore
+from nodeSnapBundle import SNAPSHOT_TABLES
+
+SCHEMA_VERSION = 1
+
+# Keys of a canonical node entry, anything else is carried along in NodeRecord.extra
+NODE_KEYS = ("path", "type", "parent", "root", "parm", "parm_label", "input", "flag", "child", "children_data",
+             "definition")
+
+
+def _migrateNodeV0(nodeName, nodeData):
+    if "parms" in nodeData and "parm" not in nodeData:
+        nodeData["parm"] = nodeData.pop("parms")
+    if "label" in nodeData and "parm_label" not in nodeData:
+        nodeData["parm_label"] = nodeData.pop("label")
+
+    grandchildDict = nodeData.pop("grandchild", None)
+    if not grandchildDict:
+        return
+
+    # childrenAsData() payloads carry no "path", saved child entries always do
+    isNative = not all(isinstance(data, dict) and "path" in data for data in grandchildDict.values())
+    if isNative:
+        nodeData["children_data"] = grandchildDict
+    else:
+        nodeData.setdefault("child", {}).update(grandchildDict)
+
+
+def migrateV0(data):
+    """Unversioned snapshots: "parms"/"label" aliases and "grandchild" levels."""
+    stack = list(data.get("nodes", {}).items())
+
+    while stack:
+        nodeName, nodeData = stack.pop()
+        if not isinstance(nodeData, dict):
+            continue
+        _migrateNodeV0(nodeName, nodeData)
+        stack.extend((nodeData.get("child") or {}).items())
+
+    return data
+
+
+MIGRATIONS = {
+    0: migrateV0,
+}
+
+
+def migrate(data):
+    version = data.get("version") or 0
+    # Newer files may hold keys this version would drop or misread, they are not opened
+    if version > SCHEMA_VERSION:
+        raise ValueError(f"Snapshot version {version} is newer than {SCHEMA_VERSION}, update the tool to open it")
+
+    while version < SCHEMA_VERSION:
+        data = MIGRATIONS[version](data)
+        version += 1
+
+    data["version"] = SCHEMA_VERSION
+    return data
+
+
+def packValue(value):
+    """Store float vectors (and the float lists inside ramp data) as array('d')."""
+    if isinstance(value, list):
+        if len(value) > 1 and all(type(item) is float for item in value):
+            return array("d", value)
+        return [packValue(item) for item in value]
+    if isinstance(value, dict):
+        return {key: packValue(item) for key, item in value.items()}
+    return value
+
+
+def unpackValue(value):
+    if isinstance(value, array):
+        return value.tolist()
+    if isinstance(value, list):
+        return [unpackValue(item) for item in value]
+    if isinstance(value, dict):
+        return {key: unpackValue(item) for key, item in value.items()}
+    return value
+
+
+def packParms(parms):
+    if not isinstance(parms, dict):
+        return {}
+    return {sys.intern(key): packValue(value) for key, value in parms.items()}
+
+
+def unpackParms(parms):
+    """Plain lists again, for display, json and setParmsFromData()."""
+    return {key: unpackValue(value) for key, value in parms.items()}
+
+
+def _interned(mapping, internValues=False):
+    if not isinstance(mapping, dict):
+        return {}
+    if internValues:
+        return {sys.intern(key): sys.intern(value) if isinstance(value, str) else value
+                for key, value in mapping.items()}
+    return {sys.intern(key): value for key, value in mapping.items()}
+
+
+def readSnapshot(filePath):
+    if nodeSnapStream.isStream(filePath):
+        return nodeSnapStream.readStream(filePath)
+    if nodeSnapBundle.isBundle(filePath):
+        return nodeSnapBundle.readBundle(filePath)
+    return nodeJsonCodec.load(filePath)
+
+
+def writeSnapshot(data, filePath):
+    # ".zip" and ".nsbundle" paths are written as sharded bundles, ".ndjson" as a stream
+    if nodeSnapStream.isStream(filePath):
+        return nodeSnapStream.writeStream(data, filePath)
+    if nodeSnapBundle.isBundle(filePath):
+        return nodeSnapBundle.writeBundle(data, filePath)
+    nodeJsonCodec.dump(data, filePath)
+    return filePath
+
+
+class NodeRecord:
+    __slots__ = (
+        "index", "name", "type", "path", "root", "parentIndex", "parentName", "parentType",
+        "parms", "labels", "inputs", "flags", "children", "nativeData", "native", "definition", "extra",
+    )
+
+    def __init__(self, index, name, typeName, path, parentIndex=None):
+        self.index       = index
+        self.name        = sys.intern(name)
+        self.type        = sys.intern(typeName)
+        self.path        = sys.intern(path)
+        self.root        = ""
+        self.parentIndex = parentIndex
+        self.parentName  = ""
+        self.parentType  = ""
+        self.parms       = {}
+        self.labels      = {}
+        self.inputs      = None
+        self.flags       = None
+        self.children    = []
+        self.nativeData  = None
+        self.native      = False
+        self.definition  = None
+        self.extra       = None
+
+    @property
+    def fullPath(self):
+        return self.path + self.name
+
+    def __repr__(self):
+        return f"<NodeRecord {self.fullPath} ({self.type})>"
+
+
+class SnapshotModel:
+    """
+    Flat list of NodeRecords built once per loaded snapshot. Children are held as
+    record indices and every record knows its parent index, so lookups never
+    have to search nested dicts or re-check legacy key variants.
+    """
+    def __init__(self):
+        self.records = []
+        self.roots   = []
+        self.byPath  = {}
+        self.meta    = {}
+        self.strings = StringTable()
+        self.blobs   = BlobStore()
+        self.definitions = {}
+        self.labels  = {}
+        self.source  = None
+        self.loaded  = True
+
+    def __len__(self):
+        return len(self.records)
+
+    @classmethod
+    def load(cls, filePath):
+        if nodeSnapStream.isStream(filePath):
+            model = cls.fromStream(nodeSnapStream.readLines(filePath))
+        else:
+            model = cls.fromData(readSnapshot(filePath))
+        model.source = filePath
+        model.blobs.setSnapshotPath(nodeSnapBundle.bundleRoot(filePath))
+        return model
+
+    def labelsFor(self, record, category=None):
+        """
+        Parm labels of ``record``. Native exports keep one label table per "Category/type"
+        instead of labels per node, ``category`` is the network type the record is created in.
+        """
+        if record.labels or not self.labels:
+            return record.labels
+        if category and f"{category}/{record.type}" in self.labels:
+            return self.labels[f"{category}/{record.type}"]
+        # Snapshots written before the tables were keyed with the category
+        return self.labels.get(record.type, {})
+
+    def resolve(self, value):
+        """Value with its out-of-line text and sidecar blobs read back in."""
+        return self.blobs.resolve(self.strings.resolve(value))
+
+    def ensureLoaded(self):
+        """Decode the full snapshot behind a model opened from its skeleton index."""
+        if self.loaded:
+            return self
+
+        full = SnapshotModel.load(self.source)
+        self.records = full.records
+        self.roots   = full.roots
+        self.byPath  = full.byPath
+        self.meta    = full.meta
+        self.strings = full.strings
+        self.blobs   = full.blobs
+        self.definitions = full.definitions
+        self.labels  = full.labels
+        self.loaded  = True
+        return self
+
+    @classmethod
+    def fromData(cls, data):
+        data = migrate(data)
+        model = cls()
+        model.meta = data.get("meta", {})
+        model.strings = StringTable(data.get("strings"))
+        model.blobs = BlobStore(data.get("blobs"))
+        model.definitions = data.get("definitions") or {}
+        model.labels = data.get("labels") or {}
+
+        stack = [(name, nodeData, None) for name, nodeData in reversed(list(data.get("nodes", {}).items()))]
+        while stack:
+            name, nodeData, parentIndex = stack.pop()
+            if not isinstance(nodeData, dict):
+                continue
+
+            record = model.addRecord(name, nodeData, parentIndex)
+            model.attachNative(record, nodeData)
+
+            childDict = nodeData.get("child") or {}
+            stack.extend((childName, childData, record.index) for childName, childData in reversed(list(childDict.items())))
+
+        return model
+
+    @classmethod
+    def fromStream(cls, entries):
+        """Build the model entry by entry, without nesting the stream back into dicts."""
+        entries = iter(entries)
+        header = next(entries, None) or {}
+        version = header.get("version") or 0
+        if version > SCHEMA_VERSION:
+            raise ValueError(f"Snapshot version {version} is newer than {SCHEMA_VERSION}")
+
+        # Older entries can still carry nested levels, those go through the migrations
+        if version < SCHEMA_VERSION:
+            data = {key: header.get(key) for key in SNAPSHOT_TABLES}
+            data.update({"version": version, "nodes": nodeSnapStream.nestNodes(entries), "meta": header.get("meta", {})})
+            return cls.fromData(data)
+
+        model = cls()
+        model.meta = header.get("meta", {})
+        model.strings = StringTable(header.get("strings"))
+        model.blobs = BlobStore(header.get("blobs"))
+        model.definitions = header.get("definitions") or {}
+        model.labels = header.get("labels") or {}
+        for entry in entries:
+            name = entry.pop("name")
+            entry.pop("fullPath", None)
+            parentIndex = model.byPath.get(entry.pop("parentPath", None))
+
+            record = model.addRecord(name, entry, parentIndex)
+            model.attachNative(record, entry)
+
+        return model
+
+    def addRecord(self, name, nodeData, parentIndex=None):
+        parentInfo = nodeData.get("parent") or {}
+        record = NodeRecord(len(self.records), name, nodeData.get("type", ""), nodeData.get("path", ""), parentIndex)
+        record.root       = sys.intern(nodeData.get("root", ""))
+        record.parentName = sys.intern(parentInfo.get("name", ""))
+        record.parentType = sys.intern(parentInfo.get("type", ""))
+        record.parms      = packParms(nodeData.get("parm"))
+        record.labels     = _interned(nodeData.get("parm_label"), internValues=True)
+        record.inputs     = nodeData.get("input")
+        record.flags      = nodeData.get("flag")
+
+        extra = {key: value for key, value in nodeData.items() if key not in NODE_KEYS}
+        record.extra = extra or None
+
+        self.records.append(record)
+        self.byPath[record.fullPath] = record.index
+        if parentIndex is None:
+            self.roots.append(record.index)
+        else:
+            self.records[parentIndex].children.append(record.index)
+        return record
+
+    def attachNative(self, record, nodeData):
+        # Locked HDA instances point at the contents of their definition, stored once
+        definitionKey = nodeData.get("definition")
+        if definitionKey:
+            record.definition = definitionKey
+            record.nativeData = self.definitions.get(definitionKey)
+        elif nodeData.get("children_data"):
+            record.nativeData = nodeData["children_data"]
+
+        if record.nativeData:
+            self.addNativeRecords(record)
+
+    def addNativeRecords(self, ownerRecord):
+        # Display-only records for a childrenAsData() payload, which is applied
+        # back in one setChildrenFromData() call on the owner when importing
+        stack = [(ownerRecord, ownerRecord.nativeData)]
+
+        while stack:
+            parentRecord, childrenData = stack.pop()
+            for childName, childData in (childrenData or {}).items():
+                if not isinstance(childData, dict):
+                    continue
+
+                record = NodeRecord(len(self.records), childName, childData.get("type", ""),
+                                    parentRecord.fullPath + "/", parentRecord.index)
+                record.root       = ownerRecord.root
+                record.parentName = parentRecord.name
+                record.parentType = parentRecord.type
+                record.native     = True
+                record.definition = ownerRecord.definition
+
+                # Share the payload's parm dict so edits flow back into it, these
+                # stay unpacked as the payload goes to setChildrenFromData() as is
+                if isinstance(childData.get("parms"), dict):
+                    childData["parms"] = record.parms = _interned(childData["parms"])
+
+                self.records.append(record)
+                self.byPath[record.fullPath] = record.index
+                parentRecord.children.append(record.index)
+                stack.append((record, childData.get("children")))
+
+    def record(self, fullPath):
+        index = self.byPath.get(fullPath)
+        return self.records[index] if index is not None else None
+
+    def walk(self, index):
+        stack = [index]
+        while stack:
+            currentIndex = stack.pop()
+            yield currentIndex
+            stack.extend(reversed(self.records[currentIndex].children))
+
+    def ancestors(self, index):
+        parentIndex = self.records[index].parentIndex
+        while parentIndex is not None:
+            yield parentIndex
+            parentIndex = self.records[parentIndex].parentIndex
+
+    def recordToData(self, index):
+        record = self.records[index]
+        nodeData = {
+            "path"       : record.path,
+            "type"       : record.type,
+            "parent"     : {"name": record.parentName, "type": record.parentType},
+            "root"       : record.root,
+            "parm"       : unpackParms(record.parms),
+            "parm_label" : record.labels,
+            "input"      : record.inputs,
+            "flag"       : record.flags,
+            "child"      : {
+                self.records[childIndex].name: self.recordToData(childIndex)
+                for childIndex in record.children if not self.records[childIndex].native
+            },
+        }
+        if record.definition:
+            nodeData["definition"] = record.definition
+        elif record.nativeData is not None:
+            nodeData["children_data"] = record.nativeData
+        if record.extra:
+            nodeData.update(record.extra)
+        return nodeData
+
+    def toData(self):
+        data = {
+            "version" : SCHEMA_VERSION,
+            "nodes"   : {self.records[index].name: self.recordToData(index) for index in self.roots},
+            "meta"    : self.meta,
+        }
+        if self.strings:
+            data["strings"] = self.strings.encoded
+        if self.blobs:
+            data["blobs"] = self.blobs.dirName
+        if self.definitions:
+            data["definitions"] = self.definitions
+        if self.labels:
+            data["labels"] = self.labels
+        return data
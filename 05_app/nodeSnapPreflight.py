@@ -0,0 +1,85 @@
+# ****************************************************************************************
+# Content : Resolves every node type of an import up front, installing HDA libraries in bulk
+# -----
+# Date:
+# Created  : 19/10/2026
+# Modified : 19/10/2026
+# -----
+# Dependencies = os, hou
+# -----
+# Author  : Mayank Modi
+# Email   : mayank_modi@outlook.com
+# ****************************************************************************************
+
+# Types missing from the session are looked up in the HDA libraries found on
+# NODESNAP_HDA_PATH (os.pathsep separated folders), each matching library is installed once.
+
+import os
+
+import hou
+
+AVAILABLE = "available"
+INSTALLED = "installed"
+MISSING   = "missing"
+
+HDA_SUFFIXES = (".hda", ".otl", ".hdanc", ".otlnc", ".hdalc", ".otllc")
+
+
+def hdaSearchPaths():
+    return [path for path in os.environ.get("NODESNAP_HDA_PATH", "").split(os.pathsep) if os.path.isdir(path)]
+
+
+def findLibraries(typeKeys, searchPaths=None):
+    """Map each "Category/type" key to the first library file on the search paths that defines it."""
+    libraries = {}
+    wanted = set(typeKeys)
+
+    for searchPath in searchPaths if searchPaths is not None else hdaSearchPaths():
+        for fileName in sorted(os.listdir(searchPath)):
+            if not wanted or not fileName.lower().endswith(HDA_SUFFIXES):
+                continue
+            libraryPath = os.path.join(searchPath, fileName)
+            try:
+                definitions = hou.hda.definitionsInFile(libraryPath)
+            except hou.Error:
+                continue
+            for definition in definitions:
+                typeKey = f"{definition.nodeTypeCategory().name()}/{definition.nodeTypeName()}"
+                if typeKey in wanted:
+                    libraries[typeKey] = libraryPath
+                    wanted.discard(typeKey)
+
+    return libraries
+
+
+def nodeType(typeKey):
+    category, _, typeName = typeKey.partition("/")
+    houCategory = hou.nodeTypeCategories().get(category)
+    return houCategory.nodeType(typeName) if houCategory else None
+
+
+def resolveTypes(typeKeys):
+    """
+    Resolve every "Category/type" key once, before any node is created.
+    Returns {typeKey: AVAILABLE | INSTALLED | MISSING}.
+    """
+    status = {}
+    missing = []
+
+    # Available types are left alone, their libraries are already loaded in the session
+    for typeKey in typeKeys:
+        if nodeType(typeKey) is None:
+            missing.append(typeKey)
+        else:
+            status[typeKey] = AVAILABLE
+
+    libraries = findLibraries(missing) if missing else {}
+    for libraryPath in set(libraries.values()):
+        try:
+            hou.hda.installFile(libraryPath)
+        except hou.Error:
+            continue
+
+    for typeKey in missing:
+        status[typeKey] = INSTALLED if typeKey in libraries and nodeType(typeKey) is not None else MISSING
+    return status
@@ -0,0 +1,97 @@
+# ****************************************************************************************
+# Content : Per-node timing of snapshot imports, and the cook stats stored by exports
+# -----
+# Date:
+# Created  : 19/10/2026
+# Modified : 19/10/2026
+# -----
+# Dependencies = time, nodeJsonCodec
+# -----
+# Author  : Mayank Modi
+# Email   : mayank_modi@outlook.com
+# ****************************************************************************************
+
+from time import perf_counter
+
+import nodeJsonCodec
+
+PHASES = ("create", "parms", "children", "inputs", "flags", "layout")
+
+
+class ImportProfiler:
+    """
+    Collects seconds per node path and phase. A disabled profiler only costs a
+    method call per phase, mark() returns 0 and add() returns straight away.
+    """
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.nodes = {}
+
+    def __bool__(self):
+        return self.enabled
+
+    def mark(self):
+        return perf_counter() if self.enabled else 0
+
+    def add(self, path, phase, since, typeName=""):
+        # Returns a new mark, so consecutive phases chain without extra clock reads
+        if not self.enabled:
+            return 0
+        now = perf_counter()
+        entry = self.nodes.get(path)
+        if entry is None:
+            entry = self.nodes[path] = {"type": typeName}
+        elif typeName and not entry["type"]:
+            entry["type"] = typeName
+        entry[phase] = entry.get(phase, 0.0) + now - since
+        return now
+
+    def rows(self, sortBy="total"):
+        rows = []
+        for path, entry in self.nodes.items():
+            row = {"path": path, "type": entry.get("type", "")}
+            row.update((phase, entry.get(phase, 0.0)) for phase in PHASES)
+            row["total"] = sum(row[phase] for phase in PHASES)
+            rows.append(row)
+        rows.sort(key=lambda row: row[sortBy], reverse=sortBy not in ("path", "type"))
+        return rows
+
+    def totals(self):
+        rows = self.rows()
+        totals = {phase: sum(row[phase] for row in rows) for phase in PHASES}
+        totals["total"] = sum(totals.values())
+        return totals
+
+    def toData(self):
+        return {"phases": list(PHASES), "totals": self.totals(), "nodes": self.rows()}
+
+    def write(self, filePath):
+        nodeJsonCodec.dump(self.toData(), filePath)
+        return filePath
+
+
+# Shared by NodeSnapLogic when profiling is off
+DISABLED = ImportProfiler(enabled=False)
+
+# Snapshot meta key of the cook stats, {node path: {"time": ms, "cooks": count, "memory": bytes}}
+COOK_STATS_KEY = "Cook Stats"
+
+
+def summarizeCookStats(stats):
+    if not stats:
+        return "No cook stats"
+    slowestPath = max(stats, key=lambda path: stats[path].get("time", 0.0))
+    totalTime = sum(entry.get("time", 0.0) for entry in stats.values())
+    totalMemory = sum(entry.get("memory", 0) for entry in stats.values())
+    return (
+        f"{len(stats)} nodes, {totalTime:.1f} ms, {totalMemory / (1024.0 * 1024.0):.1f} MB\n"
+        f"Slowest: {slowestPath} ({stats[slowestPath].get('time', 0.0):.1f} ms)"
+    )
+
+
+def heatLevels(stats):
+    """Cook time of every node relative to the slowest one, 0 to 1."""
+    slowest = max((entry.get("time", 0.0) for entry in stats.values()), default=0.0)
+    if slowest <= 0:
+        return {path: 0.0 for path in stats}
+    return {path: entry.get("time", 0.0) / slowest for path, entry in stats.items()}
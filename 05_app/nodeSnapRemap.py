@@ -0,0 +1,111 @@
+# ****************************************************************************************
+# Content : Remaps absolute node paths of a snapshot onto another network when importing
+# -----
+# Date:
+# Created  : 19/10/2026
+# Modified : 19/10/2026
+# -----
+# Dependencies = string, nodeSnapChannels
+# -----
+# Author  : Mayank Modi
+# Email   : mayank_modi@outlook.com
+# ****************************************************************************************
+
+# Source prefixes are compiled into one character trie, so every parm string is scanned
+# once for all of them. Only absolute paths are rewritten, relative references such as
+# ch("../null1/tx") stay valid as the imported nodes move together.
+
+import string
+
+from nodeSnapChannels import CHANNEL_KEY, isChannel
+
+# Characters of a node name, a path only matches a prefix up to one of these boundaries
+NAME_CHARS = frozenset(string.ascii_letters + string.digits + "_")
+
+_END = None
+
+
+def normalizePath(path):
+    return "/" + path.strip().strip("/")
+
+
+class PathRemapper:
+    """Rewrites absolute paths below the source prefixes of ``mapping`` to their targets."""
+    def __init__(self, mapping):
+        self.mapping = {
+            normalizePath(source): normalizePath(target)
+            for source, target in mapping.items() if source.strip("/") and target.strip("/")
+        }
+
+        self.trie = {}
+        for source, target in self.mapping.items():
+            trieNode = self.trie
+            for char in source:
+                trieNode = trieNode.setdefault(char, {})
+            trieNode[_END] = target
+
+    def __bool__(self):
+        return bool(self.mapping)
+
+    def match(self, text, start):
+        # Longest prefix starting at ``start`` that ends on a name boundary
+        trieNode = self.trie
+        found = None
+        position = start
+        length = len(text)
+
+        while position < length:
+            trieNode = trieNode.get(text[position])
+            if trieNode is None:
+                break
+            position += 1
+            if _END in trieNode and (position == length or text[position] not in NAME_CHARS):
+                found = (position, trieNode[_END])
+        return found
+
+    def remapPath(self, path):
+        found = self.match(path, 0) if path else None
+        return found[1] + path[found[0]:] if found else path
+
+    def remapText(self, text):
+        pieces = []
+        last = 0
+        position = text.find("/")
+
+        while position != -1:
+            # Paths start at the beginning of a token, not inside a name or after "../"
+            found = None
+            if position == 0 or text[position - 1] not in NAME_CHARS and text[position - 1] not in "./":
+                found = self.match(text, position)
+
+            if found:
+                end, target = found
+                pieces.append(text[last:position])
+                pieces.append(target)
+                last = end
+                position = text.find("/", end)
+            else:
+                position = text.find("/", position + 1)
+
+        if not pieces:
+            return text
+        pieces.append(text[last:])
+        return "".join(pieces)
+
+    def remapValue(self, value):
+        if not self.mapping:
+            return value
+        if isinstance(value, str):
+            return self.remapText(value) if "/" in value else value
+        if isinstance(value, list):
+            return [self.remapValue(item) for item in value]
+        if isinstance(value, dict):
+            # The packed numeric columns of a channel are base64, never paths
+            if isChannel(value):
+                channel = dict(value[CHANNEL_KEY])
+                for section in ("constants", "tables", "other"):
+                    if section in channel:
+                        channel[section] = self.remapValue(channel[section])
+                return {CHANNEL_KEY: channel}
+            return {key: self.remapValue(item) for key, item in value.items()}
+        return value
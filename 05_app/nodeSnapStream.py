@@ -0,0 +1,245 @@
+# ****************************************************************************************
+# Content : Line-delimited (NDJSON) snapshot format, read and written as generators
+# -----
+# Date:
+# Created  : 19/10/2026
+# Modified : 19/10/2026
+# -----
+# Dependencies = os, sys, shutil, argparse, nodeJsonCodec, nodeSnapBundle
+# -----
+# Author  : Mayank Modi
+# Email   : mayank_modi@outlook.com
+# ****************************************************************************************
+
+# Line 1 is a header {"format", "version", "meta", <SNAPSHOT_TABLES>}, every following
+# line is one node entry without its "child" dict, plus "name", "fullPath" and
+# "parentPath" (None for top-level nodes). Parents are always written before their children.
+#
+# Pipeline use, all streaming with constant memory:
+#   python nodeSnapStream.py split template.json > template.ndjson
+#   python nodeSnapStream.py merge a.ndjson b.ndjson > ab.ndjson
+#   cat ab.ndjson | python nodeSnapStream.py join - > ab.json
+# Inputs with sidecar blobs in different folders need --blobs, a folder next to the output
+# that all of their blobs are copied into:
+#   python nodeSnapStream.py merge a.ndjson b.ndjson --blobs ab.blobs > ab.ndjson
+
+import os
+import sys
+import shutil
+import argparse
+
+import nodeJsonCodec
+from nodeSnapBundle import SNAPSHOT_TABLES
+
+STREAM_SUFFIX = ".ndjson"
+STREAM_FORMAT = "nodesnap-ndjson"
+STREAM_KEYS   = ("name", "fullPath", "parentPath")
+
+
+def isStream(filePath):
+    return filePath.lower().endswith(STREAM_SUFFIX)
+
+
+def encodeLine(entry):
+    # compatible=False, an indented line would break the format
+    return nodeJsonCodec.dumpsBytes(entry, pretty=False, compatible=False) + b"\n"
+
+
+def header(meta=None, version=None, tables=None):
+    headerEntry = {"format": STREAM_FORMAT, "version": version, "meta": meta or {}}
+    headerEntry.update((key, tables[key]) for key in SNAPSHOT_TABLES if tables and tables.get(key))
+    return headerEntry
+
+
+def parseLines(lines):
+    """Yield the header and then every node entry of an iterable of lines."""
+    headerEntry = None
+    for line in lines:
+        if not line.strip():
+            continue
+        entry = nodeJsonCodec.loads(line)
+
+        if headerEntry is None:
+            if not isinstance(entry, dict) or entry.get("format") != STREAM_FORMAT:
+                raise ValueError("Missing node snapshot stream header")
+            headerEntry = entry
+        yield entry
+
+
+def readLines(filePath):
+    if filePath == "-":
+        yield from parseLines(sys.stdin.buffer)
+        return
+    with open(filePath, "rb") as f:
+        yield from parseLines(f)
+
+
+def flattenNodes(nodesData, parentPath=None):
+    """Yield stream entries for a nested "nodes" dict, parents first."""
+    stack = [(nodeName, nodeData, parentPath) for nodeName, nodeData in reversed(list(nodesData.items()))]
+
+    while stack:
+        nodeName, nodeData, currentParent = stack.pop()
+        if not isinstance(nodeData, dict):
+            continue
+
+        fullPath = nodeData.get("path", "") + nodeName
+        entry = {"name": nodeName, "fullPath": fullPath, "parentPath": currentParent}
+        entry.update((key, value) for key, value in nodeData.items() if key != "child")
+        yield entry
+
+        childDict = nodeData.get("child") or {}
+        stack.extend((childName, childData, fullPath) for childName, childData in reversed(list(childDict.items())))
+
+
+def nestNodes(entries):
+    """Build a nested "nodes" dict back from stream entries."""
+    nodesData = {}
+    byPath = {}
+
+    for entry in entries:
+        nodeData = {key: value for key, value in entry.items() if key not in STREAM_KEYS}
+        nodeData["child"] = {}
+        byPath[entry["fullPath"]] = nodeData
+
+        # Parents filtered out of a stream leave their children at the top level
+        parentData = byPath.get(entry.get("parentPath"))
+        siblings = parentData["child"] if parentData is not None else nodesData
+        siblings[entry["name"]] = nodeData
+
+    return nodesData
+
+
+def writeLines(stream, headerEntry, entries):
+    stream.write(encodeLine(headerEntry))
+    for entry in entries:
+        stream.write(encodeLine(entry))
+
+
+def writeStream(data, filePath):
+    with open(filePath, "wb") as f:
+        writeLines(f, header(data.get("meta"), data.get("version"), data), flattenNodes(data.get("nodes", {})))
+    return filePath
+
+
+def readStream(filePath):
+    entries = readLines(filePath)
+    headerEntry = next(entries, None)
+    if headerEntry is None:
+        raise ValueError(f"{filePath} is empty")
+
+    data = {"nodes": nestNodes(entries), "meta": headerEntry.get("meta", {})}
+    data.update((key, headerEntry[key]) for key in SNAPSHOT_TABLES if headerEntry.get(key))
+    if headerEntry.get("version") is not None:
+        data["version"] = headerEntry["version"]
+    return data
+
+
+def appendNodes(filePath, nodesData, parentPath=None, meta=None, version=None):
+    """Append nodes to a stream without rewriting it, creating it when missing."""
+    isNew = not os.path.exists(filePath) or os.path.getsize(filePath) == 0
+    with open(filePath, "ab") as f:
+        if isNew:
+            f.write(encodeLine(header(meta, version)))
+        for entry in flattenNodes(nodesData, parentPath):
+            f.write(encodeLine(entry))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert and merge node snapshot streams, writing to stdout.")
+    parser.add_argument("mode", choices=("split", "join", "merge"),
+                        help="split: json to ndjson, join: ndjson to json, merge: ndjson files into one stream")
+    parser.add_argument("files", nargs="+", help="input files, '-' reads stdin")
+    parser.add_argument("--blobs", help="folder next to the output that the sidecar blobs of all inputs are copied into")
+    args = parser.parse_args(argv)
+    out = sys.stdout.buffer
+
+    if args.mode == "split":
+        for filePath in args.files:
+            data = nodeJsonCodec.loads(sys.stdin.buffer.read()) if filePath == "-" else nodeJsonCodec.load(filePath)
+            writeLines(out, header(data.get("meta"), data.get("version"), data), flattenNodes(data.get("nodes", {})))
+        return 0
+
+    if args.mode == "join":
+        headers = []
+
+        def entries():
+            for filePath in args.files:
+                fileEntries = readLines(filePath)
+                headers.append(next(fileEntries, header()))
+                yield from fileEntries
+
+        nodesData = nestNodes(entries())
+        data = {"version": headers[0].get("version"), "nodes": nodesData, "meta": headers[0].get("meta", {})}
+        try:
+            data.update(mergedTables(headers, args.files, args.blobs))
+        except ValueError as error:
+            parser.error(str(error))
+        out.write(nodeJsonCodec.dumpsBytes(data))
+        return 0
+
+    # merge keeps the first header's meta, side tables are combined up front
+    streams = [readLines(filePath) for filePath in args.files]
+    headers = [next(entries, header()) for entries in streams]
+    try:
+        tables = mergedTables(headers, args.files, args.blobs)
+    except ValueError as error:
+        parser.error(str(error))
+    out.write(encodeLine(dict(headers[0], **tables)))
+    for entries in streams:
+        for entry in entries:
+            out.write(encodeLine(entry))
+    return 0
+
+
+def mergedTables(headers, filePaths=None, blobDir=None):
+    # Keys are content hashes, definition versions or type names, so tables merge without conflicts
+    tables = {}
+    for key in ("strings", "definitions", "labels"):
+        merged = {}
+        for headerEntry in headers:
+            merged.update(headerEntry.get(key) or {})
+        if merged:
+            tables[key] = merged
+
+    blobsName = mergeBlobs(headers, filePaths or ["-"] * len(headers), blobDir)
+    if blobsName:
+        tables["blobs"] = blobsName
+    return tables
+
+
+def mergeBlobs(headers, filePaths, blobDir=None):
+    """
+    Blob folder name for the header of merged streams. Blobs are content hashed, so the
+    folders of all inputs are copied into ``blobDir`` without conflicts. Without ``blobDir``
+    the inputs have to share one folder.
+    """
+    sourceDirs = []
+    for headerEntry, filePath in zip(headers, filePaths):
+        if not headerEntry.get("blobs"):
+            continue
+        # Blob folders are stored relative to their snapshot
+        baseDir = os.getcwd() if filePath == "-" else os.path.dirname(os.path.abspath(filePath))
+        sourceDir = os.path.normpath(os.path.join(baseDir, headerEntry["blobs"]))
+        if sourceDir not in sourceDirs:
+            sourceDirs.append(sourceDir)
+
+    if blobDir is None:
+        if len(sourceDirs) > 1:
+            raise ValueError("The inputs keep their blobs in different folders, pass a folder to merge them into")
+        return os.path.basename(sourceDirs[0]) if sourceDirs else None
+
+    blobDir = os.path.normpath(os.path.abspath(blobDir))
+    os.makedirs(blobDir, exist_ok=True)
+    for sourceDir in sourceDirs:
+        if sourceDir == blobDir or not os.path.isdir(sourceDir):
+            continue
+        for fileName in os.listdir(sourceDir):
+            targetPath = os.path.join(blobDir, fileName)
+            if fileName.endswith(".blob") and not os.path.exists(targetPath):
+                shutil.copy2(os.path.join(sourceDir, fileName), targetPath)
+    return os.path.basename(blobDir)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+# ****************************************************************************************
+# Content : Out-of-line string table for large text parms (VEX, Python, expressions)
+# -----
+# Date:
+# Created  : 19/10/2026
+# Modified : 19/10/2026
+# -----
+# Dependencies = zlib, base64, hashlib, nodeSnapChannels
+# -----
+# Author  : Mayank Modi
+# Email   : mayank_modi@outlook.com
+# ****************************************************************************************
+
+# Text values longer than TEXT_THRESHOLD are replaced by {"$text": <sha1>} and stored
+# once, zlib compressed, in the snapshot's top-level "strings" table.
+
+import zlib
+import base64
+import hashlib
+
+from nodeSnapChannels import isChannel
+
+TEXT_THRESHOLD = 512
+TEXT_KEY = "$text"
+
+
+def isTextRef(value):
+    return isinstance(value, dict) and len(value) == 1 and TEXT_KEY in value
+
+
+def encodeText(text):
+    return base64.b64encode(zlib.compress(text.encode("utf-8"), 6)).decode("ascii")
+
+
+def decodeText(encoded):
+    return zlib.decompress(base64.b64decode(encoded)).decode("utf-8")
+
+
+def outlineValue(value, table, threshold=TEXT_THRESHOLD):
+    if isinstance(value, str):
+        if len(value) <= threshold:
+            return value
+        key = hashlib.sha1(value.encode("utf-8")).hexdigest()
+        if key not in table:
+            table[key] = encodeText(value)
+        return {TEXT_KEY: key}
+    if isinstance(value, list):
+        return [outlineValue(item, table, threshold) for item in value]
+    if isinstance(value, dict):
+        # Packed keyframe columns are already compact, and stay readable for summaries
+        if isChannel(value):
+            return value
+        return {key: outlineValue(item, table, threshold) for key, item in value.items()}
+    return value
+
+
+def outlineStrings(data, threshold=TEXT_THRESHOLD):
+    """Move large parm text of every node (and childrenAsData payloads, shared definitions) into data["strings"]."""
+    table = data.setdefault("strings", {})
+    stack = list(data.get("nodes", {}).values())
+
+    while stack:
+        nodeData = stack.pop()
+        if not isinstance(nodeData, dict):
+            continue
+        if isinstance(nodeData.get("parm"), dict):
+            nodeData["parm"] = outlineValue(nodeData["parm"], table, threshold)
+        if nodeData.get("children_data"):
+            nodeData["children_data"] = outlineValue(nodeData["children_data"], table, threshold)
+        stack.extend((nodeData.get("child") or {}).values())
+
+    for definitionKey, payload in (data.get("definitions") or {}).items():
+        data["definitions"][definitionKey] = outlineValue(payload, table, threshold)
+
+    if not table:
+        del data["strings"]
+    return data
+
+
+class StringTable:
+    """Snapshot string table, entries are only decompressed when first resolved."""
+    def __init__(self, encoded=None):
+        self.encoded = encoded or {}
+        self._decoded = {}
+
+    def __bool__(self):
+        return bool(self.encoded)
+
+    def text(self, key):
+        if key not in self._decoded:
+            self._decoded[key] = decodeText(self.encoded[key])
+        return self._decoded[key]
+
+    def resolve(self, value):
+        if not self.encoded:
+            return value
+        if isTextRef(value):
+            return self.text(value[TEXT_KEY])
+        if isinstance(value, list):
+            return [self.resolve(item) for item in value]
+        if isinstance(value, dict):
+            return {key: self.resolve(item) for key, item in value.items()}
+        return value
@@ -0,0 +1,421 @@
+# ****************************************************************************************
+# Content : Validates node snapshots against a cached node type/parm schema
+# -----
+# Date:
+# Created  : 19/10/2026
+# Modified : 19/10/2026
+# -----
+# Dependencies = os, re, sys, array, zipfile, nodeJsonCodec, argparse, concurrent.futures, multiprocessing,
+#                nodeSnapModel, nodeSnapBundle, hou (only to build the schema cache)
+# -----
+# Author  : Mayank Modi
+# Email   : mayank_modi@outlook.com
+# ****************************************************************************************
+
+import os
+import re
+import sys
+import zipfile
+import argparse
+import multiprocessing
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import nodeJsonCodec
+from nodeSnapModel import SnapshotModel
+from nodeSnapBundle import BUNDLE_SUFFIX
+
+# hou is imported lazily: worker processes only read the cached schema and
+# must not pull in (and license) Houdini just to lint a file. Workers are plain
+# Python processes, inside Houdini or hython the files are checked in-process.
+
+NUMERIC_KINDS = ("Float", "Int", "Toggle")
+
+# Network roots a snapshot can be saved from, cached so workers can resolve them without hou
+ROOT_PATHS = ("/obj", "/out", "/mat", "/stage", "/ch", "/shop", "/img", "/tasks")
+
+ERROR   = "error"
+WARNING = "warning"
+
+
+def libraryModified(libraryFile):
+    # Embedded definitions have no file, their entries never match and are read again
+    try:
+        return os.path.getmtime(libraryFile)
+    except (OSError, TypeError):
+        return None
+
+
+def parmTemplateEntries(templates):
+    stack = list(templates)
+
+    while stack:
+        template = stack.pop()
+        kind = template.type().name()
+        yield template.name(), kind
+
+        if kind == "Folder":
+            stack.extend(template.parmTemplates())
+
+
+class NodeSchema:
+    """
+    Node types keyed by "Category/type" with their parm kinds and child category.
+    When ``live`` is set, types missing from the cache are read from hou on demand.
+    Types not installed are only remembered for the session, HDA types carry their
+    library file and its mtime and are read again once that file changes.
+    """
+    def __init__(self, data=None, live=False):
+        self.data = data or {"houdini": "", "roots": {}, "types": {}}
+        self.live = live
+        self.dirty = False
+        self.missing = set()
+        self._multiparmPatterns = {}
+
+    @classmethod
+    def cachePath(cls, version=None):
+        import hou
+        version = version or hou.applicationVersionString()
+        return os.path.join(hou.homeHoudiniDirectory(), "nodeSnap", f"schema_{version}.json")
+
+    @classmethod
+    def load(cls, path=None, live=True):
+        if live:
+            import hou
+            path = path or cls.cachePath()
+
+        data = None
+        if path and os.path.exists(path):
+            data = nodeJsonCodec.load(path)
+
+        schema = cls(data, live)
+        if live:
+            schema.data["houdini"] = hou.applicationVersionString()
+            schema.dropStaleTypes()
+        return schema
+
+    def dropStaleTypes(self):
+        types = self.data["types"]
+        for key, entry in list(types.items()):
+            library = entry.get("library") if entry else None
+            if entry is None or (library and (library[1] is None or libraryModified(library[0]) != library[1])):
+                del types[key]
+                self.dirty = True
+
+    def save(self, path=None):
+        path = path or self.cachePath(self.data.get("houdini") or None)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        nodeJsonCodec.dump(self.data, path, pretty=False)
+        self.dirty = False
+
+    def rootCategory(self, rootPath):
+        roots = self.data["roots"]
+        if rootPath not in roots and self.live:
+            import hou
+            rootNode = hou.node(rootPath)
+            category = rootNode.childTypeCategory() if rootNode else None
+            roots[rootPath] = category.name() if category else None
+            self.dirty = True
+        return roots.get(rootPath)
+
+    def lookup(self, category, typeName):
+        key = f"{category}/{typeName}"
+        types = self.data["types"]
+
+        if key not in types and key not in self.missing and self.live:
+            entry = self._readType(category, typeName)
+            if entry is None:
+                self.missing.add(key)
+            else:
+                types[key] = entry
+                self.dirty = True
+
+        return types.get(key)
+
+    def forget(self, key):
+        # Read again on the next lookup, e.g. after its HDA library was installed
+        self.missing.discard(key)
+        self.data["types"].pop(key, None)
+
+    def _readType(self, category, typeName):
+        import hou
+        houCategory = hou.nodeTypeCategories().get(category)
+        nodeType = houCategory.nodeType(typeName) if houCategory else None
+        if nodeType is None:
+            return None
+
+        childCategory = nodeType.childTypeCategory()
+        entry = {
+            "parms"    : dict(parmTemplateEntries(nodeType.parmTemplateGroup().parmTemplates())),
+            "children" : childCategory.name() if childCategory else None,
+        }
+
+        definition = nodeType.definition()
+        if definition is not None:
+            libraryFile = definition.libraryFilePath()
+            entry["library"] = [libraryFile, libraryModified(libraryFile)]
+        return entry
+
+    def buildAll(self):
+        """Cache every network root and installed node type, used before validating a whole directory."""
+        import hou
+        for rootPath in ROOT_PATHS:
+            self.rootCategory(rootPath)
+
+        for category in hou.nodeTypeCategories().values():
+            for typeName in category.nodeTypes():
+                self.lookup(category.name(), typeName)
+
+    def parmKind(self, typeEntry, typeKey, parmName):
+        parms = typeEntry["parms"]
+        if parmName in parms:
+            return parms[parmName]
+
+        # Multiparm instances are stored as "name#" templates
+        if typeKey not in self._multiparmPatterns:
+            self._multiparmPatterns[typeKey] = [
+                (re.compile(re.escape(name).replace("\\#", "#").replace("#", r"\d+") + "$"), kind)
+                for name, kind in parms.items() if "#" in name
+            ]
+        for pattern, kind in self._multiparmPatterns[typeKey]:
+            if pattern.match(parmName):
+                return kind
+
+        return None
+
+
+class SnapshotValidator:
+    def __init__(self, schema):
+        self.schema = schema
+
+    def validateFile(self, filePath):
+        report = {"file": filePath, "issues": []}
+        try:
+            model = SnapshotModel.load(filePath)
+        except (OSError, ValueError, KeyError, AttributeError, zipfile.BadZipFile) as error:
+            report["issues"].append(self.issue(ERROR, "unreadable", "", str(error)))
+            return self.summarize(report)
+
+        report["issues"] = self.validateModel(model)
+        report["houdini"] = model.meta.get("Houdini Version", "")
+        return self.summarize(report)
+
+    def validateModel(self, model, indices=None):
+        """Validate ``indices`` (every record when None) of a SnapshotModel."""
+        issues = []
+        selected = None if indices is None else set(indices)
+
+        # Records are stored parents first, so a child's category is always resolved already
+        categories = [None] * len(model)
+        typeEntries = [None] * len(model)
+        for record in model.records:
+            report = selected is None or record.index in selected
+            nodePath = record.fullPath
+
+            if record.parentIndex is None:
+                category = self.topLevelCategory(record, issues if report else [])
+            else:
+                parentEntry = typeEntries[record.parentIndex]
+                category = parentEntry.get("children") if parentEntry else None
+            categories[record.index] = category
+
+            if not record.type:
+                if report:
+                    issues.append(self.issue(ERROR, "malformed", nodePath, "Node entry has no type"))
+                continue
+
+            typeEntry = self.schema.lookup(category, record.type) if category else None
+            typeEntries[record.index] = typeEntry
+            if not report or not category:
+                continue
+
+            if typeEntry is None:
+                issues.append(self.issue(
+                    ERROR, "unknown_type", nodePath,
+                    f"Node type '{record.type}' does not exist in {category} for this Houdini version"
+                ))
+            elif record.parms:
+                issues.extend(self.validateParms(nodePath, f"{category}/{record.type}", typeEntry, record.parms))
+
+            if record.inputs:
+                issues.extend(self.validateInputs(nodePath, record.path, record.inputs, model.byPath))
+
+        return issues
+
+    def recordCategories(self, model):
+        """Network category every record is created in, None where it cannot be resolved."""
+        categories = [None] * len(model)
+        for record in model.records:
+            if record.parentIndex is None:
+                categories[record.index] = self.topLevelCategory(record, [])
+                continue
+
+            parentCategory = categories[record.parentIndex]
+            parentEntry = self.schema.lookup(parentCategory, model.records[record.parentIndex].type) if parentCategory else None
+            categories[record.index] = parentEntry.get("children") if parentEntry else None
+        return categories
+
+    def topLevelCategory(self, record, issues):
+        rootPath = record.root
+        rootCategory = self.schema.rootCategory(rootPath) if rootPath else None
+        if not rootCategory:
+            issues.append(self.issue(WARNING, "unknown_root", record.name, f"Cannot resolve network root '{rootPath}'"))
+            return None
+
+        # Nodes saved below the root need their parent network recreated first
+        if record.path.rstrip("/") == rootPath.rstrip("/"):
+            return rootCategory
+
+        if not record.parentType:
+            issues.append(self.issue(ERROR, "missing_parent_type", record.name, f"No parent type recorded for '{record.path}'"))
+            return None
+
+        parentEntry = self.schema.lookup(rootCategory, record.parentType)
+        if parentEntry is None:
+            issues.append(self.issue(
+                ERROR, "missing_parent_type", record.name,
+                f"Parent type '{record.parentType}' does not exist in {rootCategory}"
+            ))
+            return None
+
+        return parentEntry.get("children")
+
+    def validateParms(self, nodePath, typeKey, typeEntry, parmData):
+        issues = []
+        for parmName, value in parmData.items():
+            kind = self.schema.parmKind(typeEntry, typeKey, parmName)
+            if kind is None:
+                issues.append(self.issue(WARNING, "unknown_parm", nodePath, f"Parameter '{parmName}' does not exist"))
+                continue
+
+            # Packed float vectors can never hold strings
+            if isinstance(value, array):
+                continue
+
+            values = value if isinstance(value, list) else [value]
+            if kind in NUMERIC_KINDS and any(isinstance(v, str) for v in values):
+                issues.append(self.issue(
+                    ERROR, "wrong_parm_type", nodePath,
+                    f"Parameter '{parmName}' expects {kind.lower()} values, got {value!r}"
+                ))
+            elif kind == "Ramp" and not isinstance(value, (dict, list)):
+                issues.append(self.issue(
+                    ERROR, "wrong_parm_type", nodePath,
+                    f"Ramp parameter '{parmName}' has a scalar value {value!r}"
+                ))
+        return issues
+
+    def validateInputs(self, nodePath, parentPath, inputData, knownPaths):
+        issues = []
+        # Sources outside the snapshot can only be checked against a live scene
+        if not self.schema.live:
+            return issues
+
+        import hou
+        for connection in inputData if isinstance(inputData, list) else []:
+            source = connection.get("from") if isinstance(connection, dict) else None
+            if not source:
+                continue
+
+            sourcePath = source if source.startswith("/") else parentPath + source
+            if sourcePath not in knownPaths and hou.node(sourcePath) is None:
+                issues.append(self.issue(
+                    WARNING, "dangling_input", nodePath,
+                    f"Input source '{source}' is neither in the snapshot nor in the scene"
+                ))
+        return issues
+
+    @staticmethod
+    def issue(severity, code, node, message):
+        return {"severity": severity, "code": code, "node": node, "message": message}
+
+    @staticmethod
+    def summarize(report):
+        report["errors"]   = sum(1 for issue in report["issues"] if issue["severity"] == ERROR)
+        report["warnings"] = len(report["issues"]) - report["errors"]
+        return report
+
+
+# Process pool workers get the schema once through the initializer
+_workerValidator = None
+
+
+def _initWorker(schemaData):
+    global _workerValidator
+    _workerValidator = SnapshotValidator(NodeSchema(schemaData, live=False))
+
+
+def _validateInWorker(filePath):
+    return _workerValidator.validateFile(filePath)
+
+
+def findSnapshotFiles(dirPath):
+    for currentDir, dirNames, fileNames in os.walk(dirPath):
+        # Bundles are validated as one snapshot, never walked into
+        for dirName in sorted(dirNames):
+            if dirName.endswith(BUNDLE_SUFFIX) and not dirName.endswith("_backup" + BUNDLE_SUFFIX):
+                yield os.path.join(currentDir, dirName)
+        dirNames[:] = [dirName for dirName in dirNames if not dirName.endswith(BUNDLE_SUFFIX)]
+
+        for fileName in sorted(fileNames):
+            lowerName = fileName.lower()
+            if lowerName.endswith((".json", ".zip", ".ndjson")) and not lowerName.endswith(("_backup.json", "_backup.zip", "_backup.ndjson")):
+                yield os.path.join(currentDir, fileName)
+
+
+def validateDirectory(dirPath, schema, workers=None):
+    filePaths = list(findSnapshotFiles(dirPath))
+
+    if "hou" in sys.modules:
+        # sys.executable is Houdini or hython here, every spawned worker would be another licensed session
+        validator = SnapshotValidator(schema)
+        reports = [validator.validateFile(filePath) for filePath in filePaths]
+    else:
+        reports = []
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                                 initializer=_initWorker, initargs=(schema.data,)) as pool:
+            futures = [pool.submit(_validateInWorker, filePath) for filePath in filePaths]
+            for future in as_completed(futures):
+                reports.append(future.result())
+
+    reports.sort(key=lambda report: report["file"])
+    return {
+        "root"     : dirPath,
+        "houdini"  : schema.data.get("houdini", ""),
+        "files"    : reports,
+        "errors"   : sum(report["errors"] for report in reports),
+        "warnings" : sum(report["warnings"] for report in reports),
+    }
+
+
+def writeReport(report, reportPath):
+    nodeJsonCodec.dump(report, reportPath, pretty=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate node snapshot files in a template directory.")
+    parser.add_argument("directory")
+    parser.add_argument("--schema", help="schema cache file; built from hou when omitted (requires hython)")
+    parser.add_argument("--report", help="write the JSON report here instead of stdout")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    if args.schema:
+        schema = NodeSchema.load(args.schema, live=False)
+    else:
+        schema = NodeSchema.load(live=True)
+        schema.buildAll()
+        if schema.dirty:
+            schema.save()
+
+    report = validateDirectory(args.directory, schema, args.workers)
+    if args.report:
+        writeReport(report, args.report)
+    else:
+        print(nodeJsonCodec.dumps(report, pretty=True))
+
+    return 1 if report["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
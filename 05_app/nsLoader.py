@@ -3,10 +3,13 @@
 # -----
 # Date:
 # Created  : 22/05/2025
-# Modified : 13/06/2025
+# Modified : 19/10/2026
 # -----
-# Dependencies = os, ast, hou, copy, json, collections.deque, QtWidgets, QtCompat, QtCore,
-#               QtGui, functools.wraps, nodeTreeLogic, nodeSnapLogic, webbrowser
+# Dependencies = os, ast, hou, copy, shutil, QtWidgets, QtCompat, QtCore, QtGui,
+#               functools.wraps, nodeTreeLogic, nodeSnapLogic, nodeSnapModel, nodeSnapIndex, nodeSnapCache,
+#               nodeSnapBundle, nodeSnapChannels, nodeSnapBlobs, nodeSnapRemap, nodeSearchLogic,
+#               nodeSnapProfile, nodeSnapCheckpoint, nodeSnapPreflight, nodeValidateLogic, nsUiCache,
+#               webbrowser
 # -----
 # Author  : Mayank Modi
 # Email   : mayank_modi@outlook.com
@@ -15,27 +18,56 @@
 import os
 import ast
 import copy
-import json
+import shutil
 import webbrowser
 from functools import wraps
-from collections import deque
 
 from Qt import QtWidgets, QtCompat, QtCore, QtGui
 
 import hou
+import nsUiCache
 import nodeTreeLogic
+import nodeSnapIndex
+import nodeSnapCache
+import nodeSnapProfile
+import nodeSnapPreflight
 from nodeSnapLogic import NodeSnapLogic
+from nodeSnapModel import SnapshotModel, writeSnapshot, packValue, unpackValue
+from nodeSnapBundle import bundleRoot
+from nodeSnapChannels import hasChannels, summarizeChannels
+from nodeSnapBlobs import hasBlobs, summarizeBlobs
+from nodeSnapRemap import PathRemapper
+from nodeSnapProfile import ImportProfiler
+from nodeSnapCheckpoint import Checkpoint
+from nodeSearchLogic import NodeSearchIndex
+from nodeValidateLogic import NodeSchema, SnapshotValidator
 
 TITLE = os.path.splitext(os.path.basename(__file__))[0]
 PARENT = hou.ui.mainQtWindow()
+ENTRY_ID_ROLE = QtCore.Qt.UserRole + 1
+MAX_LISTED_ISSUES = 15
+
+# Records imported between two checkpoints and progress updates
+IMPORT_CHUNK_SIZE = 200
+
+_instance = None
+
 class NsLoader(QtCore.QObject):
     def __init__(self, parent=None):
             super(NsLoader, self).__init__(parent)
             self.ui_path  = os.path.join(os.path.dirname(__file__), "ui", TITLE + ".ui")
-            self.wgLoader = QtCompat.loadUi(self.ui_path)
+            self.wgLoader = nsUiCache.loadUi(self.ui_path)
             self.logic = NodeSnapLogic()
-            self.nodesDict = {}
+            self.schema = None
+            self.model = SnapshotModel()
+            self.searchIndex = NodeSearchIndex()
+            self._originalParms = {}
+            self._treeItems = []
+            self._hiddenIds = set()
+            self._checkedPaths = set()
             self._editInProgress = False
+            self._loading = False
+            self._recordCategories = None
             self._previousTreeSelection = None
             self._currentJsonPath = ""
 
@@ -55,6 +87,7 @@ class NsLoader(QtCore.QObject):
 
     def loadWidgets(self):
         self.lineEdit = self.wgLoader.findChild(QtWidgets.QLineEdit, "filePath")
+        self.leSearch = self.wgLoader.findChild(QtWidgets.QLineEdit, "le_Search")
         self.splitter = self.wgLoader.findChild(QtWidgets.QSplitter, "splitter")
         self.parmView = self.wgLoader.findChild(QtWidgets.QTableView, "parmView")
         self.treeWidget = self.wgLoader.findChild(QtWidgets.QTreeWidget, "nodeTree")
@@ -69,6 +102,10 @@ class NsLoader(QtCore.QObject):
         self.tabsmetaData = self.wgLoader.findChild(QtWidgets.QTabWidget, "tabs_metaData")
         self.btnInfoTabShow  = self.wgLoader.findChild(QtWidgets.QPushButton, "btn_infoTabShow")
         self.btnLoadSelected = self.wgLoader.findChild(QtWidgets.QPushButton, "btn_LoadSelected")
+        self.cbNativeImport  = self.wgLoader.findChild(QtWidgets.QCheckBox, "cb_NativeImport")
+        self.cbUseCache      = self.wgLoader.findChild(QtWidgets.QCheckBox, "cb_UseCache")
+        self.leTargetNetwork = self.wgLoader.findChild(QtWidgets.QLineEdit, "le_TargetNetwork")
+        self.cbProfile       = self.wgLoader.findChild(QtWidgets.QCheckBox, "cb_Profile")
         
         self.rightPaneWidget = self.splitter.widget(1)
 
@@ -158,6 +195,13 @@ class NsLoader(QtCore.QObject):
         self.btnHelp.setToolTip("Open wiki")
         self.btnInfoTabShow.setToolTip("show/hide right panel")
         self.btnBrowse.setToolTip("open file browser to select a JSON file")                            
+        self.leTargetNetwork.setPlaceholderText("Target network")
+        self.leTargetNetwork.setToolTip("Create the checked nodes under this network instead of where they were saved, "
+                                        "absolute paths in their parms are remapped as well")
+        self.cbProfile.setToolTip("Time every imported node and show where the load spent its time")
+        self.cbUseCache.setToolTip("Keep a hidden copy of the imported nodes and copy it on the next load of the same selection")
+        self.cbNativeImport.setToolTip("Create checked subtrees with one setChildrenFromData() call per parent")
+        self.leSearch.setToolTip("Show only nodes whose name, type or parameter names contain every typed word")
             
     def setConnections(self):
         self.btnSave.clicked.connect(self.btn_Save)
@@ -167,6 +211,7 @@ class NsLoader(QtCore.QObject):
         self.btnBrowse.clicked.connect(self.browseJsonFile)
         self.btnEdit.clicked.connect(self.set_btnEditEnabled)
         self.lineEdit.returnPressed.connect(self.loadFromlineEdit)
+        self.leSearch.textChanged.connect(self.filterTree)
         self.treeWidget.itemChanged.connect(self.onTreeItemChanged)
         self.btnLoadSelected.clicked.connect(self.btn_LoadSelected)
         self.btnInfoTabShow.clicked.connect(self.toggleRightPane)
@@ -233,24 +278,41 @@ class NsLoader(QtCore.QObject):
         return False
             
     def loadJsonFile(self, filePath):
-        with open(filePath, "r") as f:
-            data = json.load(f)
+        # Opens from the sidecar index when it is current, parms are decoded on first use
+        try:
+            model = nodeSnapIndex.openModel(filePath)
+        except ValueError as error:
+            QtWidgets.QMessageBox.warning(self.wgLoader, "Cannot Open Snapshot", f"{filePath}\n\n{error}")
+            return self.model
+
+        self.model.blobs.close()
+        self.model = model
+        self._recordCategories = None
 
         self._currentJsonPath = filePath 
-        nodesData = data.get("nodes", {})
-        self.nodesDict = nodesData
-        self.workingNodesDict = copy.deepcopy(nodesData)
+        self._originalParms = {}
         self.treeWidget.clear()
-        hierarchy = nodeTreeLogic.buildNodeHierarchy(nodesData)
-        self.add_ItemsToTree(hierarchy)
+        self.searchIndex.clear()
+        self._treeItems = []
+        self._hiddenIds = set()
+        self._checkedPaths = set()
+        self.treeWidget.blockSignals(True)
+        self.add_ItemsToTree(nodeTreeLogic.buildNodeHierarchy(self.model))
+        self.treeWidget.blockSignals(False)
+        self.searchIndex.finalize()
+        self.updateSelectAllCheckbox()
+        self.showCookHeat(self.model.meta.get(nodeSnapProfile.COOK_STATS_KEY))
+
+        self.leSearch.blockSignals(True)
+        self.leSearch.clear()
+        self.leSearch.blockSignals(False)
         
         if self.treeWidget.topLevelItemCount() > 0:
             self.btnEdit.setEnabled(True)
         
-        meta = data.get("meta", {})
-        self.populateMetaLabels(meta)
+        self.populateMetaLabels(self.model.meta)
         
-        return nodesData
+        return self.model
     
     def browseJsonFile(self):
         hip_dir = os.path.dirname(hou.hipFile.path()) or os.getcwd()
@@ -258,7 +320,7 @@ class NsLoader(QtCore.QObject):
             self.wgLoader,
             "Select JSON File",
             hip_dir,
-            "JSON Files (*.json);;All Files (*)"
+            "JSON Files (*.json);;Snapshot Bundles (manifest.json *.zip);;Snapshot Streams (*.ndjson);;All Files (*)"
         )
         self._currentJsonPath = filePath 
         if filePath:
@@ -274,6 +336,26 @@ class NsLoader(QtCore.QObject):
         if self.treeWidget.topLevelItemCount() > 0:
             self.btnEdit.setEnabled(True)
             
+    def showCookHeat(self, stats):
+        # Second tree column with each node's cook time, shaded by how close it is to the slowest
+        if not stats:
+            self.treeWidget.setColumnCount(1)
+            return
+
+        self.treeWidget.setColumnCount(2)
+        self.treeWidget.headerItem().setText(1, "Cook (ms)")
+        self.treeWidget.header().setSectionResizeMode(1, QtWidgets.QHeaderView.ResizeToContents)
+
+        levels = nodeSnapProfile.heatLevels(stats)
+        for item in self._treeItems:
+            fullPath = self.model.records[item.data(0, ENTRY_ID_ROLE)].fullPath
+            if fullPath not in stats:
+                continue
+            item.setText(1, f"{stats[fullPath].get('time', 0.0):.1f}")
+            item.setToolTip(1, f"{stats[fullPath].get('cooks', 0)} cook(s), "
+                               f"{stats[fullPath].get('memory', 0) / (1024.0 * 1024.0):.1f} MB")
+            item.setBackground(1, QtGui.QColor(200, 60, 40, int(40 + 180 * levels[fullPath])))
+
     def populateMetaLabels(self, metaDict):
         while self.metaDataLayout.count():
             item = self.metaDataLayout.takeAt(0)
@@ -282,6 +364,9 @@ class NsLoader(QtCore.QObject):
                 widget.deleteLater()
 
         for key, value in metaDict.items():
+            if key == nodeSnapProfile.COOK_STATS_KEY:
+                value = nodeSnapProfile.summarizeCookStats(value)
+
             labelKey = QtWidgets.QLabel(f"{key}:")
             labelKey.setStyleSheet("font-weight: bold; color: #DDDDDD;")
             labelKey.setAlignment(QtCore.Qt.AlignTop)
@@ -293,101 +378,157 @@ class NsLoader(QtCore.QObject):
             self.metaDataLayout.addRow(labelKey, labelValue)
             self.metaDataLayout.addRow(QtWidgets.QLabel(""))
 
-    def add_ItemsToTree(self, nodes):
-        queue = deque()
-        queue.append((nodes, None, 0))
+    def add_ItemsToTree(self, rows):
+        for record, label, checkable in rows:
+            item = QtWidgets.QTreeWidgetItem([label])
+            item.setData(0, QtCore.Qt.UserRole, record.name)
 
-        while queue:
-            currentNodes, currentParent, depth = queue.popleft()
+            # Record indices double as search entry ids
+            self.searchIndex.addNode(record.name, record.type, record.parms, record.parentIndex)
+            item.setData(0, ENTRY_ID_ROLE, record.index)
+            self._treeItems.append(item)
 
-            for node in currentNodes:
-                label = f"{node['name']} ({node['type']})"
-                item = QtWidgets.QTreeWidgetItem([label])
+            if record.parentIndex is None:
+                self.treeWidget.addTopLevelItem(item)
+            else:
+                self._treeItems[record.parentIndex].addChild(item)
+
+            if checkable:
                 item.setCheckState(0, QtCore.Qt.Unchecked)
-                item.setData(0, QtCore.Qt.UserRole, node['name'])
+            else:
+                item.setFlags(item.flags() & ~QtCore.Qt.ItemIsUserCheckable)
 
-                if currentParent is None:
-                    self.treeWidget.addTopLevelItem(item)
-                else:
-                    currentParent.addChild(item)
+    def filterTree(self, text):
+        visibleIds = self.searchIndex.visibleIds(text)
+        if visibleIds is None:
+            hiddenIds = set()
+        else:
+            hiddenIds = set(range(len(self._treeItems)))
+            hiddenIds -= visibleIds
+
+        # Only touch items whose visibility actually changes
+        self.treeWidget.setUpdatesEnabled(False)
+        for entryId in hiddenIds - self._hiddenIds:
+            self._treeItems[entryId].setHidden(True)
+        for entryId in self._hiddenIds - hiddenIds:
+            self._treeItems[entryId].setHidden(False)
+
+        if visibleIds:
+            for entryId in visibleIds:
+                item = self._treeItems[entryId]
+                if item.childCount() and not item.isExpanded():
+                    item.setExpanded(True)
+        self.treeWidget.setUpdatesEnabled(True)
+
+        self._hiddenIds = hiddenIds
+
+    def setItemCheckState(self, item, state):
+        item.setCheckState(0, state)
+        path = self.model.records[item.data(0, ENTRY_ID_ROLE)].fullPath
+        if state == QtCore.Qt.Checked:
+            self._checkedPaths.add(path)
+        else:
+            self._checkedPaths.discard(path)
 
-                if depth < 2:
-                    item.setCheckState(0, QtCore.Qt.Unchecked)
-                else:
-                    item.setFlags(item.flags() & ~QtCore.Qt.ItemIsUserCheckable)
-                    item.setData(0, QtCore.Qt.CheckStateRole, None) 
-                        
-                if node.get("children"):
-                    queue.append((node["children"], item, depth + 1))
+    def setSubtreeCheckState(self, item, state):
+        stack = [item]
 
-    def onSelectAllToggled(self, state):
-        self.treeWidget.blockSignals(True)
-        checkState = QtCore.Qt.Checked if state == QtCore.Qt.Checked else QtCore.Qt.Unchecked
+        while stack:
+            currentItem = stack.pop()
+            if not currentItem.flags() & QtCore.Qt.ItemIsUserCheckable:
+                continue
+
+            self.setItemCheckState(currentItem, state)
+            for childIndex in range(currentItem.childCount()):
+                stack.append(currentItem.child(childIndex))
+
+    def updateAncestorCheckStates(self, item):
+        parentItem = item.parent()
+
+        while parentItem is not None:
+            childStates = {
+                parentItem.child(childIndex).checkState(0)
+                for childIndex in range(parentItem.childCount())
+                if parentItem.child(childIndex).flags() & QtCore.Qt.ItemIsUserCheckable
+            }
+            newState = childStates.pop() if len(childStates) == 1 else QtCore.Qt.PartiallyChecked
+
+            # Ancestors above an unchanged parent are already correct
+            if newState == parentItem.checkState(0):
+                break
+
+            self.setItemCheckState(parentItem, newState)
+            parentItem = parentItem.parent()
+
+    def updateSelectAllCheckbox(self):
         topLevelCount = self.treeWidget.topLevelItemCount()
+        allChecked = topLevelCount > 0 and all(
+            self.treeWidget.topLevelItem(topIndex).checkState(0) == QtCore.Qt.Checked
+            for topIndex in range(topLevelCount)
+        )
 
-        for topIndex in range(topLevelCount):
-            topItem = self.treeWidget.topLevelItem(topIndex)
-            topItem.setCheckState(0, checkState)
+        self.selectAllCheckbox.blockSignals(True)
+        self.selectAllCheckbox.setChecked(allChecked)
+        self.selectAllCheckbox.blockSignals(False)
 
-            childCount = topItem.childCount()
-            for childIndex in range(childCount):
-                childItem = topItem.child(childIndex)
-                childItem.setCheckState(0, checkState)
+    def onSelectAllToggled(self, state):
+        self.treeWidget.blockSignals(True)
+        self.treeWidget.setUpdatesEnabled(False)
+        checkState = QtCore.Qt.Checked if state == QtCore.Qt.Checked else QtCore.Qt.Unchecked
 
-                grandChildCount = childItem.childCount()
-                for grandChildIndex in range(grandChildCount):
-                    grandChildItem = childItem.child(grandChildIndex)
-                    grandChildItem.setCheckState(0, checkState)
+        for topIndex in range(self.treeWidget.topLevelItemCount()):
+            self.setSubtreeCheckState(self.treeWidget.topLevelItem(topIndex), checkState)
 
+        self.treeWidget.setUpdatesEnabled(True)
         self.treeWidget.blockSignals(False)
 
     def onTreeItemChanged(self, changedItem):
+        if not changedItem.flags() & QtCore.Qt.ItemIsUserCheckable:
+            return
+
         self.treeWidget.blockSignals(True)
-        newState = changedItem.checkState(0)
+        self.treeWidget.setUpdatesEnabled(False)
 
-        for childIndex in range(changedItem.childCount()):
-            childItem = changedItem.child(childIndex)
-            childItem.setCheckState(0, newState)
+        # Clicking a partially checked parent selects its whole subtree
+        newState = changedItem.checkState(0)
+        if newState == QtCore.Qt.PartiallyChecked:
+            newState = QtCore.Qt.Checked
 
-            for grandchildIndex in range(childItem.childCount()):
-                grandchildItem = childItem.child(grandchildIndex)
-                grandchildItem.setCheckState(0, newState)
+        self.setSubtreeCheckState(changedItem, newState)
+        self.updateAncestorCheckStates(changedItem)
 
+        self.treeWidget.setUpdatesEnabled(True)
         self.treeWidget.blockSignals(False)
+        self.updateSelectAllCheckbox()
         
+    def selectedRecord(self):
+        selectedItems = self.treeWidget.selectedItems()
+        if not selectedItems:
+            return None
+        return self.model.records[selectedItems[0].data(0, ENTRY_ID_ROLE)]
+
     def resolvedNodeData(func):
         @wraps(func)
         def wrapper(self, *args, **kwargs):
-            selectedItems = self.treeWidget.selectedItems()
-            nodeName = selectedItems[0].data(0, QtCore.Qt.UserRole) if selectedItems else None
-
-            parmData = {}
-            labelData = {}
-
-            if nodeName:
-                nodeData = self.workingNodesDict.get(nodeName)
-                if nodeData:
-                    parmData = nodeData.get("parm", {}) or nodeData.get("parms", {})
-                    labelData = nodeData.get("parm_label", {}) or nodeData.get("label", {})
-                else:
-                    for parentData in self.workingNodesDict.values():
-                        childData = parentData.get("child", {}).get(nodeName)
-                        if childData:
-                            parmData = childData.get("parm", {}) or childData.get("parms", {})
-                            labelData = childData.get("parm_label", {}) or childData.get("label", {})
-                            break
-                        for child in parentData.get("child", {}).values():
-                            grandchildDict = child.get("grandchild")
-                            if isinstance(grandchildDict, dict):
-                                grandchildData = grandchildDict.get(nodeName)
-                                if grandchildData:
-                                    parmData = grandchildData.get("parm", {}) or grandchildData.get("parms", {})
-                                    labelData = grandchildData.get("parm_label", {})
-                                    break
+            if self.treeWidget.selectedItems():
+                self.model.ensureLoaded()
+            record = self.selectedRecord()
+            parmData = record.parms if record else {}
+            labelData = self.model.labelsFor(record, self.recordCategory(record)) if record else {}
 
             return func(self, parmData, labelData, *args, **kwargs)
         return wrapper
     
+    def recordCategory(self, record):
+        # Only type-wide label tables need the category, resolved once per snapshot
+        if record.labels or not self.model.labels:
+            return None
+        if self._recordCategories is None:
+            if self.schema is None:
+                self.schema = NodeSchema.load(live=True)
+            self._recordCategories = SnapshotValidator(self.schema).recordCategories(self.model)
+        return self._recordCategories[record.index]
+
     @resolvedNodeData           
     def onTreeItemSelected(self, parmData, labelData, editable=False):
         selectedItems = self.treeWidget.selectedItems()
@@ -404,6 +545,7 @@ class NsLoader(QtCore.QObject):
         self.parmModel.setRowCount(0)
 
         for key, value in parmData.items():
+            value = self.model.strings.resolve(unpackValue(value))
             label = labelData.get(key)
             isVector = isinstance(value, list) and all(isinstance(v, (int, float)) for v in value)
 
@@ -423,7 +565,7 @@ class NsLoader(QtCore.QObject):
             if not isVector:
                 label = label or key
 
-            valueStr = str(value)
+            valueStr = str(summarizeBlobs(summarizeChannels(value)))
 
             labelItem = QtGui.QStandardItem(label)
             valueItem = QtGui.QStandardItem(valueStr)
@@ -464,56 +606,331 @@ class NsLoader(QtCore.QObject):
         self._previousTreeSelection = self.treeWidget.currentItem()
         self.onTreeItemSelected(editable=False)
 
-    def findNodeByName(self, name, sourceDict):
-        stack = list(sourceDict.items())
+    def btn_LoadSelected(self):
+        # The chunked import processes events, a second Create or a close must wait for it
+        if self._loading:
+            return
 
-        while stack:
-            current_name, current_data = stack.pop()
-            if current_name == name:
-                return current_data
+        self._loading = True
+        try:
+            finished = self.loadSelected()
+        finally:
+            self._loading = False
+
+        if finished:
+            self.cleanup()
+
+    def loadSelected(self):
+        """Import the checked nodes, True once they are in the scene and the loader can close."""
+        targetNetwork = self.leTargetNetwork.text().strip()
+        if targetNetwork and hou.node(targetNetwork) is None:
+            QtWidgets.QMessageBox.warning(self.wgLoader, "Target Network", f"{targetNetwork} does not exist.")
+            return False
+        self.logic.remapper = PathRemapper(self.remapMapping(targetNetwork))
+        self.logic.profiler = ImportProfiler() if self.cbProfile.isChecked() else nodeSnapProfile.DISABLED
+
+        snapshotHash = nodeSnapIndex.snapshotHash(self.model.source) if self.model.source else ""
+
+        # A cached prototype is copied without decoding or validating the snapshot again
+        cacheKey = None
+        if self.cbUseCache.isChecked() and snapshotHash:
+            cacheKey = nodeSnapCache.cacheKey(snapshotHash, self._checkedPaths, targetNetwork, self.editedParms())
+            if nodeSnapCache.instantiate(cacheKey) is not None:
+                return True
+
+        checkpoint = self.resolveCheckpoint(snapshotHash, targetNetwork)
+        if checkpoint is None:
+            return False
+
+        self.model.ensureLoaded()
+
+        # Record order puts parents before their children so they are created first
+        records = sorted(
+            (self.model.record(path) for path in self._checkedPaths),
+            key=lambda record: record.index
+        )
+
+        records = self.preflightTypes(records)
+        if records is None:
+            return False
 
-            for child_name, child_data in current_data.get("child", {}).items():
-                if child_name == name:
-                    return child_data
+        if not checkpoint.done and not self.confirmValidation([record.index for record in records]):
+            return False
+
+        unresolved = self.importChunked(records, checkpoint)
+        if unresolved is None:
+            return False
+
+        checkpoint.remove()
+        if unresolved:
+            self.reportUnresolvedInputs(unresolved)
+        if self.logic.profiler:
+            self.showProfile(self.logic.profiler)
+
+        # Only a complete import is cached, a partial one would be copied as the whole template
+        if cacheKey:
+            topNodes = [hou.node(self.logic.targetPath(path)) for path in self.topCheckedPaths()]
+            if topNodes and None not in topNodes:
+                nodeSnapCache.store(cacheKey, self.model.source, snapshotHash, topNodes)
+
+        return True
+
+    def preflightTypes(self, records):
+        """
+        Resolve every node type of ``records`` in one pass before anything is created, mark the
+        unavailable ones in the tree and return the records that can be imported, None to cancel.
+        """
+        if self.schema is None:
+            self.schema = NodeSchema.load(live=True)
+
+        validator = SnapshotValidator(self.schema)
+        status = {}
+        while True:
+            categories = validator.recordCategories(self.model)
+            typeKeys = {f"{categories[record.index]}/{record.type}" for record in records if categories[record.index]}
+            resolved = nodeSnapPreflight.resolveTypes(typeKeys - set(status))
+            status.update(resolved)
+
+            # Types installed just now may be remembered as missing by the schema, and the
+            # children of an installed network type only get their category now
+            installed = [typeKey for typeKey, state in resolved.items() if state == nodeSnapPreflight.INSTALLED]
+            if not installed:
+                break
+            for typeKey in installed:
+                self.schema.forget(typeKey)
+            self._recordCategories = None
+
+        skipped = set()
+        importable = []
+        for record in records:
+            typeKey = f"{categories[record.index]}/{record.type}"
+            item = self._treeItems[record.index]
+            if status.get(typeKey) == nodeSnapPreflight.MISSING or record.parentIndex in skipped:
+                # Nothing below an unavailable node can be created either
+                skipped.add(record.index)
+                item.setForeground(0, QtGui.QColor(220, 80, 80))
+                item.setToolTip(0, f"Node type '{typeKey}' is not available in this session")
+                continue
+            importable.append(record)
+
+        missingTypes = sorted(typeKey for typeKey, state in status.items() if state == nodeSnapPreflight.MISSING)
+        if not missingTypes:
+            return importable
+
+        lines = missingTypes[:MAX_LISTED_ISSUES]
+        if len(missingTypes) > MAX_LISTED_ISSUES:
+            lines.append(f"... and {len(missingTypes) - MAX_LISTED_ISSUES} more")
+        reply = QtWidgets.QMessageBox.warning(
+            self.wgLoader,
+            "Unavailable Node Types",
+            f"{len(skipped)} node(s) use types that are not available in this session:\n\n"
+            + "\n".join(lines)
+            + "\n\nThey are marked in the tree and will be skipped. Load the rest?",
+            QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No,
+            QtWidgets.QMessageBox.No
+        )
+        return importable if reply == QtWidgets.QMessageBox.Yes else None
+
+    def resolveCheckpoint(self, snapshotHash, targetNetwork):
+        """
+        Checkpoint for this load, resumed from an unfinished one when the user picks that.
+        Returns None when the load should not go ahead.
+        """
+        source = self.model.source or ""
+        checkpoint = Checkpoint.load(source) if source else None
+        fresh = Checkpoint(source, snapshotHash, self._checkedPaths, targetNetwork)
+        if checkpoint is None:
+            return fresh
+
+        box = QtWidgets.QMessageBox(self.wgLoader)
+        box.setWindowTitle("Unfinished Load")
+        box.setText(f"A previous load of this snapshot stopped after {len(checkpoint.done)} node(s).")
+        btnResume = None
+        if checkpoint.matches(snapshotHash, self._checkedPaths, targetNetwork):
+            btnResume = box.addButton("Resume", QtWidgets.QMessageBox.AcceptRole)
+        btnRollback = box.addButton("Roll Back", QtWidgets.QMessageBox.DestructiveRole)
+        btnRestart = box.addButton("Start Over", QtWidgets.QMessageBox.ResetRole)
+        box.addButton(QtWidgets.QMessageBox.Cancel)
+        box.exec_()
+
+        clicked = box.clickedButton()
+        if btnResume is not None and clicked == btnResume:
+            return checkpoint
+        if clicked == btnRollback:
+            self.rollback(checkpoint)
+            return None
+        if clicked == btnRestart:
+            checkpoint.remove()
+            return fresh
         return None
-        
-    def btn_LoadSelected(self):
-        checkedNodeData = {}
-        treeItemsToProcess = [
-            self.treeWidget.topLevelItem(index)
-            for index in range(self.treeWidget.topLevelItemCount())
-        ]
 
-        while treeItemsToProcess:
-            currentItem = treeItemsToProcess.pop()
-            nodeName = currentItem.data(0, QtCore.Qt.UserRole)
+    def rollback(self, checkpoint):
+        # Children before parents, destroying a parent first would leave stale paths
+        with hou.undos.group("Roll back snapshot load"):
+            for path in sorted(checkpoint.created, key=lambda path: path.count("/"), reverse=True):
+                node = hou.node(path)
+                if node is not None:
+                    node.destroy()
+        checkpoint.remove()
+
+    def importChunked(self, records, checkpoint):
+        """
+        Import ``records`` in chunks of IMPORT_CHUNK_SIZE under an interruptible operation,
+        saving ``checkpoint`` after every chunk. Returns the unresolved inputs, or None when
+        the load was cancelled or failed.
+        """
+        done = set(checkpoint.done)
+        previous = [record for record in records if record.fullPath in done]
+        remaining = [record for record in records if record.fullPath not in done]
+        nodeIndex = {}
+        pendingInputs = []
+        total = len(remaining)
+
+        # Only the interrupt dialog takes input while chunks are applied, the window stays disabled
+        self.wgLoader.setEnabled(False)
+        try:
+            operation = hou.InterruptableOperation("Loading snapshot", "Loading snapshot nodes", open_interrupt_dialog=True)
+            with operation:
+                # Native import hands whole subtrees to setChildrenFromData(), the rest goes node by node
+                if self.cbNativeImport.isChecked() and remaining:
+                    fallback = self.logic.importRecordsNative(self.model, remaining, checkpoint.created)
+                    fallbackPaths = {record.fullPath for record in fallback}
+                    checkpoint.done.extend(record.fullPath for record in remaining if record.fullPath not in fallbackPaths)
+                    checkpoint.save()
+                    remaining = sorted(fallback, key=lambda record: record.index)
+
+                # Out-of-line text and blobs are resolved chunk by chunk, only for the nodes being imported
+                loaded = 0
+                for start in range(0, len(remaining), IMPORT_CHUNK_SIZE):
+                    chunk = remaining[start:start + IMPORT_CHUNK_SIZE]
+                    nodeIndex.update(self.logic.createNodesFromRecords(chunk, checkpoint.created))
+                    self.logic.setNodeDataFromRecords(chunk, self.model.resolve, nodeIndex, pendingInputs)
+
+                    checkpoint.done.extend(record.fullPath for record in chunk)
+                    checkpoint.save()
+
+                    loaded += len(chunk)
+                    operation.updateLongProgress(loaded / float(total or 1), f"{loaded} of {total} nodes")
+                    QtWidgets.QApplication.processEvents()
+
+                operation.updateLongProgress(1.0, "Connecting inputs")
+                pendingInputs.extend(self.logic.queueInputs(previous, nodeIndex))
+                return self.logic.connectInputs(pendingInputs, nodeIndex)
+
+        except Exception as error:
+            # Nodes created partway through the failed chunk are only in memory so far,
+            # Roll Back reads them from the saved checkpoint
+            checkpoint.save()
+            failure = error
+        finally:
+            self.wgLoader.setEnabled(True)
+
+        # The checkpoint stays, Load Selected offers to resume or roll back
+        reason = "was cancelled" if isinstance(failure, hou.OperationInterrupted) else f"failed: {failure}"
+        QtWidgets.QMessageBox.warning(
+            self.wgLoader,
+            "Load Interrupted",
+            f"Loading {reason}\n\n{len(checkpoint.done)} of {len(records)} node(s) are in the scene. "
+            "Press Create again to resume or roll back."
+        )
+        return None
+
+    def showProfile(self, profiler):
+        columns = ["path", "type", *nodeSnapProfile.PHASES, "total"]
+        rows = profiler.rows()
+
+        # Parented to Houdini, the loader closes right after the import
+        dialog = QtWidgets.QDialog(PARENT)
+        dialog.setWindowTitle("Import Profile")
+        dialog.resize(900, 500)
+        layout = QtWidgets.QVBoxLayout(dialog)
+
+        totals = profiler.totals()
+        summary = ", ".join(f"{phase} {totals[phase]:.3f}s" for phase in nodeSnapProfile.PHASES)
+        layout.addWidget(QtWidgets.QLabel(f"{len(rows)} nodes in {totals['total']:.3f}s ({summary})"))
+
+        table = QtWidgets.QTableWidget(len(rows), len(columns))
+        table.setHorizontalHeaderLabels(columns)
+        table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        for rowIndex, row in enumerate(rows):
+            for columnIndex, column in enumerate(columns):
+                item = QtWidgets.QTableWidgetItem()
+                # Seconds are stored as numbers so the columns sort numerically
+                value = row[column] if column in ("path", "type") else round(row[column], 4)
+                item.setData(QtCore.Qt.DisplayRole, value)
+                table.setItem(rowIndex, columnIndex, item)
+        table.setSortingEnabled(True)
+        table.sortByColumn(len(columns) - 1, QtCore.Qt.DescendingOrder)
+        table.horizontalHeader().setSectionResizeMode(0, QtWidgets.QHeaderView.Stretch)
+        layout.addWidget(table)
+
+        btnSaveJson = QtWidgets.QPushButton("Save JSON")
+        startDir = os.path.dirname(self.model.source or "") or os.getcwd()
+        btnSaveJson.clicked.connect(lambda: self.saveProfile(profiler, dialog, startDir))
+        layout.addWidget(btnSaveJson, alignment=QtCore.Qt.AlignRight)
+
+        dialog.show()
+
+    def saveProfile(self, profiler, parent, startDir):
+        filePath, _ = QtWidgets.QFileDialog.getSaveFileName(
+            parent, "Save Import Profile", os.path.join(startDir, "import_profile.json"), "JSON Files (*.json)"
+        )
+        if filePath:
+            profiler.write(filePath)
+
+    def reportUnresolvedInputs(self, unresolved):
+        lines = [f"{nodePath} input {inputIndex}: {source}" for nodePath, inputIndex, source in unresolved]
+        if len(lines) > MAX_LISTED_ISSUES:
+            lines = lines[:MAX_LISTED_ISSUES] + [f"... and {len(lines) - MAX_LISTED_ISSUES} more"]
 
-            if currentItem.checkState(0) == QtCore.Qt.Checked:
-                nodeInfo = self.findNodeByName(nodeName, self.workingNodesDict)
-                if nodeInfo:
-                    checkedNodeData[nodeName] = nodeInfo
+        QtWidgets.QMessageBox.warning(
+            self.wgLoader,
+            "Unconnected Inputs",
+            f"{len(unresolved)} input(s) could not be connected:\n\n" + "\n".join(lines)
+        )
 
-            for childIndex in range(currentItem.childCount()):
-                treeItemsToProcess.append(currentItem.child(childIndex))
+    def remapMapping(self, targetNetwork):
+        # Each checked top-level node moves under the target network, paths to anything
+        # that is not imported keep pointing at the original nodes
+        if not targetNetwork:
+            return {}
+        targetNetwork = targetNetwork.rstrip("/")
+        return {path: f"{targetNetwork}/{self.model.record(path).name}" for path in self.topCheckedPaths()}
+
+    def topCheckedPaths(self):
+        # Checked nodes whose parent is not checked, the roots of what was imported
+        return [
+            path for path in self._checkedPaths
+            if path.rsplit("/", 1)[0] not in self._checkedPaths and not self.model.record(path).native
+        ]
 
-        # Flatten selected nodes and all nested children
-        allNodeData = {}
-        nodesToProcess = list(checkedNodeData.items())
+    def confirmValidation(self, indices):
+        if self.schema is None:
+            self.schema = NodeSchema.load(live=True)
 
-        while nodesToProcess:
-            currentName, currentInfo = nodesToProcess.pop()
-            allNodeData[currentName] = currentInfo
+        validator = SnapshotValidator(self.schema)
+        report = validator.summarize({"issues": validator.validateModel(self.model, indices)})
+        if self.schema.dirty:
+            self.schema.save()
 
-            for childName, childInfo in currentInfo.get("child", {}).items():
-                nodesToProcess.append((childName, childInfo))
+        if not report["errors"]:
+            return True
 
-        nodeDataDict = {"nodes": allNodeData}
+        lines = [f"[{issue['severity']}] {issue['node']}: {issue['message']}" for issue in report["issues"]]
+        if len(lines) > MAX_LISTED_ISSUES:
+            lines = lines[:MAX_LISTED_ISSUES] + [f"... and {len(lines) - MAX_LISTED_ISSUES} more"]
 
-        self.logic.importNodesFromJson(allNodeData, nodeDataDict)
-        self.logic.setNodeDataFromJson(allNodeData, nodeDataDict)
+        reply = QtWidgets.QMessageBox.warning(
+            self.wgLoader,
+            "Snapshot Problems Found",
+            f"Found {report['errors']} error(s) and {report['warnings']} warning(s) in the selected nodes:\n\n"
+            + "\n".join(lines)
+            + "\n\nNodes that cannot be created will be skipped. Load anyway?",
+            QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No,
+            QtWidgets.QMessageBox.No
+        )
+        return reply == QtWidgets.QMessageBox.Yes
 
-        self.cleanup()
-        
     def btn_Edit(self, enabled):
         self.btnEdit.setVisible(not enabled)
         self.btnSave.setVisible(enabled)
@@ -531,51 +948,33 @@ class NsLoader(QtCore.QObject):
         self._editInProgress = enabled
         
     def set_btnEditEnabled(self):
+        record = self.selectedRecord()
+        if record is not None and record.index not in self._originalParms:
+            self._originalParms[record.index] = copy.deepcopy(record.parms)
         self.btn_Edit(True)
         
-        
-    def findAndUpdateNode(self, container, targetName):
-        stack = [container]
-
-        while stack:
-            current = stack.pop()
-
-            if targetName in current:
-                return current[targetName]
-
-            for nodeData in current.values():
-                childDict = nodeData.get("child", {})
-                if targetName in childDict:
-                    return childDict[targetName]
-
-                for grandchildData in childDict.values():
-                    grandchildDict = grandchildData.get("grandchild", {})
-                    if targetName in grandchildDict:
-                        return grandchildDict[targetName]
-                    stack.append(grandchildDict)
-
-                stack.append(childDict)
-
-        return None
-        
     def btn_Save(self):
         selectedItems = self.treeWidget.selectedItems()
         if not selectedItems:
             return
 
         item = selectedItems[0]
-        nodeName = item.data(0, QtCore.Qt.UserRole)
+        record = self.model.records[item.data(0, ENTRY_ID_ROLE)]
+        parmData = record.parms
 
-        nodeDataRef = self.findAndUpdateNode(self.workingNodesDict, nodeName)
-        if nodeDataRef is None:
+        # Contents of a locked HDA are shared by every instance of its definition
+        if record.native and record.definition:
+            QtWidgets.QMessageBox.information(self.wgLoader, "Locked HDA", "Contents of a locked HDA definition cannot be edited.")
             return
 
-        parmData = nodeDataRef.get("parm", {})
-
         for row in range(self.parmModel.rowCount()):
             key = self.parmModel.item(row, 0).data(QtCore.Qt.UserRole)
             valueStr = self.parmModel.item(row, 1).text()
-            original = parmData.get(key)
+            original = self.model.strings.resolve(unpackValue(parmData.get(key)))
+
+            # Animated parms and geometry are shown as a summary and cannot be edited as text
+            if hasChannels(original) or hasBlobs(original):
+                continue
 
             if isinstance(original, list):
                 parsed = ast.literal_eval(valueStr)
@@ -590,9 +989,10 @@ class NsLoader(QtCore.QObject):
                     float: float
                 }.get(type(original), str)(valueStr)
 
-            parmData[key] = value
-
-        nodeDataRef["parm"] = parmData
+            # Untouched values keep their packed or out-of-line form
+            if value == original:
+                continue
+            parmData[key] = value if record.native else packValue(value)
 
         self._editInProgress = False
         self.btn_Edit(False)
@@ -612,26 +1012,17 @@ class NsLoader(QtCore.QObject):
 
         if reply == QtWidgets.QMessageBox.Yes and self._currentJsonPath:
             # --- Create backup file ---
-            base, ext = os.path.splitext(self._currentJsonPath)
+            snapshotPath = bundleRoot(self._currentJsonPath)
+            base, ext = os.path.splitext(snapshotPath.rstrip("/\\"))
             backupPath = f"{base}_backup{ext}"
 
-            with open(self._currentJsonPath, "r") as originalFile:
-                originalData = originalFile.read()
-
-            with open(backupPath, "w") as backup_file:
-                backup_file.write(originalData)
-
-            # --- Prepare updated data ---
-            originalJson = json.loads(originalData)
-            metaData = originalJson.get("meta", {})
-
-            updated_data = {
-                "nodes": self.workingNodesDict,
-                "meta": metaData
-            }
+            if os.path.isdir(snapshotPath):
+                shutil.copytree(snapshotPath, backupPath, dirs_exist_ok=True)
+            else:
+                shutil.copyfile(snapshotPath, backupPath)
 
-            with open(self._currentJsonPath, "w") as json_file:
-                json.dump(updated_data, json_file, indent=4)
+            writeSnapshot(self.model.toData(), snapshotPath)
+            nodeSnapIndex.writeIndex(self.model, self._currentJsonPath)
 
             QtWidgets.QMessageBox.information(
                 self.wgLoader,
@@ -645,17 +1036,7 @@ class NsLoader(QtCore.QObject):
             return
 
         item = selectedItems[0]
-        nodeName = item.data(0, QtCore.Qt.UserRole)
-
-        # Get original and working node references
-        originalNodeRef = self.findAndUpdateNode(self.nodesDict, nodeName)
-        workingNodeRef  = self.findAndUpdateNode(self.workingNodesDict, nodeName)
-
-        if not originalNodeRef or not workingNodeRef:
-            return
-
-        # Reset parameters
-        workingNodeRef["parm"] = copy.deepcopy(originalNodeRef.get("parm", {}))
+        self.restoreOriginalParms(self.model.records[item.data(0, ENTRY_ID_ROLE)])
 
         self.treeWidget.clearSelection()
         self.treeWidget.setCurrentItem(item)
@@ -664,20 +1045,29 @@ class NsLoader(QtCore.QObject):
         self._editInProgress = True
         self.btn_Edit(True)
         
+    def editedParms(self):
+        # (record index, parms) of the records edited in this session, edits undone by hand are left out
+        return [
+            (index, self.model.records[index].parms) for index, originalParms in self._originalParms.items()
+            if self.model.records[index].parms != originalParms
+        ]
+
+    def restoreOriginalParms(self, record):
+        # Update in place, native records share their dict with the children_data payload
+        originalParms = self._originalParms.get(record.index)
+        if originalParms is not None:
+            record.parms.clear()
+            record.parms.update(copy.deepcopy(originalParms))
+
     def btn_Cancel(self):
         selectedItems = self.treeWidget.selectedItems()
         if not selectedItems:
             return
 
         item = selectedItems[0]
-        nodeName = item.data(0, QtCore.Qt.UserRole)
 
         # Reset just like Reset
-        originalNodeRef = self.findAndUpdateNode(self.nodesDict, nodeName)
-        workingNodeRef  = self.findAndUpdateNode(self.workingNodesDict, nodeName)
-
-        if originalNodeRef and workingNodeRef:
-            workingNodeRef["parm"] = copy.deepcopy(originalNodeRef.get("parm", {}))
+        self.restoreOriginalParms(self.model.records[item.data(0, ENTRY_ID_ROLE)])
 
         self._editInProgress = False
         self.btn_Edit(False)
@@ -866,19 +1256,59 @@ class NsLoader(QtCore.QObject):
         
     def cleanup(self):
         """Clean up memory and close the loader window."""
-        self.nodesDict.clear()
-        self.workingNodesDict.clear()
+        self.model.blobs.close()
+        self.model = SnapshotModel()
+        self._recordCategories = None
+        self._originalParms.clear()
         self.wgLoader.close()
     
     def closeEvent(self, event):
         """Clean up memory when window closes"""
-        self.nodesDict.clear()
-        self.workingNodesDict.clear()
+        # The running import still reads the model and its mapped blobs
+        if self._loading:
+            event.ignore()
+            return
+
+        self.model.blobs.close()
+        self.model = SnapshotModel()
+        self._recordCategories = None
+        self._originalParms.clear()
         event.accept()
     
+    def resetState(self):
+        self.treeWidget.clear()
+        self.searchIndex.clear()
+        self._treeItems = []
+        self._hiddenIds = set()
+        self._checkedPaths = set()
+        self._previousTreeSelection = None
+        self._currentJsonPath = ""
+
+        self.lineEdit.clear()
+        self.leSearch.blockSignals(True)
+        self.leSearch.clear()
+        self.leSearch.blockSignals(False)
+        self.parmModel.setRowCount(0)
+        self.populateMetaLabels({})
+        self.updateSelectAllCheckbox()
+        self.btnEdit.setEnabled(False)
+        self.btn_Edit(False)
+
     def show(self):
+        if not self.wgLoader.isVisible():
+            self.resetState()
+
         self.wgLoader.closeEvent = self.closeEvent
         self.wgLoader.setParent(PARENT, QtCore.Qt.Tool)
         self.wgLoader.show()
         self.wgLoader.raise_()
         self.wgLoader.activateWindow()
+
+
+def show():
+    # Reuse one hidden window so reopening from the shelf skips the .ui load and styling
+    global _instance
+    if _instance is None or not QtCompat.isValid(_instance.wgLoader):
+        _instance = NsLoader()
+    _instance.show()
+    return _instance
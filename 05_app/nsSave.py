@@ -4,17 +4,17 @@
 # -----
 # Date:
 # Created  : 26/05/2025
-# Modified : 15/06/2025
+# Modified : 19/10/2026
 # -----
-# Dependencies = os, hou, json, datetime, QtWidgets, QtCompat, QtCore, QtGui, 
-#                nodeSnapLogic, webbrowser                 
+# Dependencies = os, hou, datetime, QtWidgets, QtCore, QtGui, 
+#                nodeSnapLogic, nodeSnapModel, nodeSnapIndex, nodeSnapBundle, nodeSnapStrings,
+#                nodeSnapChannels, nodeSnapBlobs, nodeSnapProfile, nodeJsonCodec, nsUiCache, webbrowser
 # -----
 # Author  : Mayank Modi
 # Email   : mayank_modi@outlook.com
 # ****************************************************************************************
 
 import os
-import json
 import getpass
 import webbrowser
 from datetime import datetime
@@ -22,16 +22,28 @@ from datetime import datetime
 from Qt import QtWidgets, QtCompat, QtCore, QtGui
 
 import hou
+import nsUiCache
+import nodeJsonCodec
+import nodeSnapIndex
 from nodeSnapLogic import NodeSnapLogic
+from nodeSnapModel import SnapshotModel, writeSnapshot
+from nodeSnapBundle import BUNDLE_SUFFIX, bundleRoot
+from nodeSnapBlobs import extractBlobs
+from nodeSnapStrings import outlineStrings
+from nodeSnapChannels import encodeSnapshotChannels
+from nodeSnapProfile import COOK_STATS_KEY
 
 TITLE  = os.path.splitext(os.path.basename(__file__))[0]
 PARENT = hou.ui.mainQtWindow()
 
+_instance = None
+
 class NsSave():
     def __init__(self):
             self.ui_path = os.path.join(os.path.dirname(__file__), "ui", TITLE + ".ui")
-            self.wgSave = QtCompat.loadUi(self.ui_path)
+            self.wgSave = nsUiCache.loadUi(self.ui_path)
             self.logic = NodeSnapLogic()
+            self.path = ""
 
             self.loadWidgets()
             self.setWidgetsProperties()
@@ -49,6 +61,9 @@ class NsSave():
         
         self.leFilePath = self.wgSave.findChild(QtWidgets.QLineEdit, "le_FilePath")
         self.leComments = self.wgSave.findChild(QtWidgets.QPlainTextEdit, "le_Comments")
+
+        self.cbNativeExport = self.wgSave.findChild(QtWidgets.QCheckBox, "cb_NativeExport")
+        self.cbCookStats = self.wgSave.findChild(QtWidgets.QCheckBox, "cb_CookStats")
     
     def setWidgetsProperties(self):
         self.btnHelp.setStyleSheet("""
@@ -70,6 +85,8 @@ class NsSave():
         
         self.btnHelp.setToolTip("Open wiki")
         self.btnBrowse.setToolTip("Open file browser")    
+        self.cbCookStats.setToolTip("Store the per-node cook times, cook counts and memory Houdini reports for the selected networks")
+        self.cbNativeExport.setToolTip("Serialize each selected node's whole subtree with one asData() call")
     
     def setConnections(self):
         self.btnSave.clicked.connect(self.exportNodes)
@@ -152,11 +169,11 @@ class NsSave():
             self.wgSave,
             "Save JSON File",
             hip_dir,
-            "JSON Files (*.json);;All Files (*)"
+            "JSON Files (*.json);;Snapshot Bundles (*.nsbundle *.zip);;Snapshot Streams (*.ndjson);;All Files (*)"
         )
 
         if filePath:
-            if not filePath.lower().endswith(".json"):
+            if not filePath.lower().endswith((".json", ".zip", ".ndjson", BUNDLE_SUFFIX)):
                 filePath += ".json"
 
             self.leFilePath.setText(filePath)
@@ -165,7 +182,10 @@ class NsSave():
     def exportNodes(self):
         if self.path:
             self.CreateJsonFile()
-            nodesData = self.logic.exportSelectedNodesToJson()
+            if self.cbNativeExport.isChecked():
+                nodesData = self.logic.exportSelectedNodesNative()
+            else:
+                nodesData = self.logic.exportSelectedNodesToJson()
 
             nodesData["meta"] = {
                 "File Name"       : hou.hipFile.basename(),
@@ -175,9 +195,15 @@ class NsSave():
                 "Creation"        : self.getDateAndTime(),
                 "Houdini Version" : hou.applicationVersionString(),
             }
+            if self.cbCookStats.isChecked():
+                nodesData["meta"][COOK_STATS_KEY] = self.logic.captureCookStats(hou.selectedNodes())
 
-            with open(self.path, "w") as f:
-                json.dump(nodesData, f, indent=4)
+            # Geometry goes out first, so the string table never holds it
+            extractBlobs(nodesData, bundleRoot(self.path))
+            encodeSnapshotChannels(nodesData)
+            outlineStrings(nodesData)
+            writeSnapshot(nodesData, self.path)
+            nodeSnapIndex.writeIndex(SnapshotModel.fromData(nodesData), self.path)
 
             self.lblAuthorName.setText(nodesData["meta"]["Author"])
             self.lblDateAndTime.setText(nodesData["meta"]["Creation"])
@@ -185,8 +211,8 @@ class NsSave():
             self.wgSave.close()
         
     def CreateJsonFile(self):
-        with open(self.path, "w") as f:
-            json.dump({}, f, indent=4)
+        if not self.path.lower().endswith((".zip", BUNDLE_SUFFIX)):
+            nodeJsonCodec.dump({}, self.path)
             
     def getComments(self):
         return self.leComments.toPlainText().strip() or " "
@@ -200,10 +226,27 @@ class NsSave():
     def openHelpPage(self):
         webbrowser.open("https://github.com/M-M0di/Python-Advance")
 
+    def resetState(self):
+        self.path = ""
+        self.leFilePath.clear()
+        self.leComments.clear()
+
     def show(self):
+        if not self.wgSave.isVisible():
+            self.resetState()
+
         self.lblAuthorName.setText(self.getAuthorName())
         self.lblDateAndTime.setText(self.getDateAndTime())
         self.wgSave.setParent(PARENT, QtCore.Qt.Tool)
         self.wgSave.show()
         self.wgSave.raise_()
-        self.wgSave.activateWindow()
\ No newline at end of file
+        self.wgSave.activateWindow()
+
+
+def show():
+    # Reuse one hidden window so reopening from the shelf skips the .ui load and styling
+    global _instance
+    if _instance is None or not QtCompat.isValid(_instance.wgSave):
+        _instance = NsSave()
+    _instance.show()
+    return _instance
\ No newline at end of file
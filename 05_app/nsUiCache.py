@@ -0,0 +1,155 @@
+# ****************************************************************************************
+# Content : Compiles Qt Designer .ui files once into cached Python modules
+# -----
+# Date:
+# Created  : 19/10/2026
+# Modified : 19/10/2026
+# -----
+# Dependencies = os, sys, json, shutil, hashlib, importlib.util, subprocess,
+#                xml.etree.ElementTree, Qt, hou
+# -----
+# Author  : Mayank Modi
+# Email   : mayank_modi@outlook.com
+# ****************************************************************************************
+
+import os
+import sys
+import json
+import shutil
+import hashlib
+import importlib.util
+import subprocess
+import xml.etree.ElementTree as ElementTree
+
+import Qt
+from Qt import QtWidgets, QtCompat
+
+import hou
+
+CACHE_DIR = os.path.join(hou.homeHoudiniDirectory(), "nodeSnap", "uicache")
+
+_loadedModules = {}
+
+
+def fileHash(filePath):
+    with open(filePath, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def cachePaths(uiPath):
+    # The generated code imports the binding directly, so cache per binding, and per
+    # full path so .ui files of the same name in different folders never share a cache
+    pathHash = hashlib.sha1(os.path.normcase(os.path.abspath(uiPath)).encode("utf-8")).hexdigest()[:10]
+    baseName = f"{os.path.splitext(os.path.basename(uiPath))[0]}_{pathHash}_{Qt.__binding__}"
+    return os.path.join(CACHE_DIR, baseName + ".py"), os.path.join(CACHE_DIR, baseName + ".json")
+
+
+def uicCommands():
+    binding = Qt.__binding__.lower()
+    bindingDir = os.path.dirname(sys.modules[Qt.__binding__].__file__)
+
+    # Only the uic of the running binding, another one generates imports of its own binding
+    found = shutil.which(f"{binding}-uic")
+    if found:
+        yield [found]
+
+    for uic in (os.path.join(bindingDir, "uic"), os.path.join(bindingDir, "Qt", "libexec", "uic"),
+                os.path.join(os.environ.get("HFS", ""), "bin", "uic")):
+        for candidate in (uic, uic + ".exe"):
+            if os.path.isfile(candidate):
+                yield [candidate, "-g", "python"]
+
+
+def compileUi(uiPath, pyPath):
+    if Qt.__binding__ in ("PyQt5", "PyQt4"):
+        from importlib import import_module
+        uic = import_module(Qt.__binding__ + ".uic")
+        with open(pyPath, "w") as pyFile:
+            uic.compileUi(uiPath, pyFile)
+        return True
+
+    for command in uicCommands():
+        result = subprocess.run(command + [uiPath, "-o", pyPath], capture_output=True)
+        if result.returncode == 0 and os.path.exists(pyPath):
+            return True
+
+    return False
+
+
+def readMeta(metaPath):
+    # A corrupt or half written meta file only costs a recompile
+    try:
+        with open(metaPath, "r") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return meta if isinstance(meta, dict) else {}
+
+
+def writeMeta(metaPath, meta):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(metaPath, "w") as f:
+        json.dump(meta, f, indent=4)
+
+
+def ensureCompiled(uiPath):
+    """Return the cached module path for ``uiPath``, recompiling it when stale."""
+    pyPath, metaPath = cachePaths(uiPath)
+    stat = os.stat(uiPath)
+
+    meta = readMeta(metaPath)
+    # mtime and size are checked first so an unchanged file is never hashed
+    if meta.get("mtime") == stat.st_mtime and meta.get("size") == stat.st_size:
+        # A file no uic could compile is not tried again until it changes
+        if meta.get("failed"):
+            return None, None
+        if meta.get("hash") and meta.get("baseClass") and os.path.exists(pyPath):
+            return pyPath, meta
+
+    uiHash = fileHash(uiPath)
+    if meta.get("hash") != uiHash or not os.path.exists(pyPath):
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        if not compileUi(uiPath, pyPath):
+            writeMeta(metaPath, {"mtime": stat.st_mtime, "size": stat.st_size, "failed": True})
+            return None, None
+
+    root = ElementTree.parse(uiPath).getroot().find("widget")
+    meta = {
+        "mtime"     : stat.st_mtime,
+        "size"      : stat.st_size,
+        "hash"      : uiHash,
+        "baseClass" : root.get("class"),
+    }
+    writeMeta(metaPath, meta)
+
+    return pyPath, meta
+
+
+def loadUi(uiPath):
+    """Build the widget from the cached compiled form, falling back to QtCompat.loadUi."""
+    try:
+        pyPath, meta = ensureCompiled(uiPath)
+    except (OSError, ValueError, ElementTree.ParseError):
+        pyPath = None
+
+    if not pyPath:
+        return QtCompat.loadUi(uiPath)
+
+    cacheKey = (pyPath, meta["hash"])
+    module = _loadedModules.get(cacheKey)
+    if module is None:
+        # A compiled module that does not import or define a Ui_ class is never used
+        try:
+            spec = importlib.util.spec_from_file_location(os.path.splitext(os.path.basename(pyPath))[0], pyPath)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            next(name for name in vars(module) if name.startswith("Ui_"))
+        except Exception:
+            return QtCompat.loadUi(uiPath)
+        _loadedModules[cacheKey] = module
+
+    uiClass = next(value for name, value in vars(module).items() if name.startswith("Ui_"))
+    widget = getattr(QtWidgets, meta["baseClass"])()
+    widget.ui = uiClass()
+    widget.ui.setupUi(widget)
+    return widget
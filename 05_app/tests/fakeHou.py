@@ -0,0 +1,154 @@
+import sys
+import types
+from contextlib import contextmanager
+
+
+class Error(Exception):
+    pass
+
+
+class OperationFailed(Error):
+    pass
+
+
+class NodeType:
+    def __init__(self, name, category="Object", definition=None):
+        self._name       = name
+        self._category   = category
+        self._definition = definition
+
+    def name(self):
+        return self._name
+
+    def nameWithCategory(self):
+        return f"{self._category}/{self._name}"
+
+    def definition(self):
+        return self._definition
+
+
+class Definition:
+    def __init__(self, libraryFile, modified=0):
+        self._libraryFile = libraryFile
+        self._modified    = modified
+
+    def libraryFilePath(self):
+        return self._libraryFile
+
+    def modificationTime(self):
+        return self._modified
+
+
+class Node:
+    """Just enough of hou.Node for the import and export paths of nodeSnapLogic."""
+
+    def __init__(self, name, typeName="", parent=None, definition=None, locked=False):
+        self._name     = name
+        self._type     = NodeType(typeName, definition=definition)
+        self._parent   = parent
+        self._children = {}
+        self._locked   = locked
+        self.parms     = {}
+        self.inputs    = {}
+        self.calls     = []
+        if parent is not None:
+            parent._children[name] = self
+
+    def name(self):
+        return self._name
+
+    def path(self):
+        if self._parent is None:
+            return "/"
+        return f"{self._parent.path().rstrip('/')}/{self._name}"
+
+    def parent(self):
+        return self._parent
+
+    def type(self):
+        return self._type
+
+    def children(self):
+        return tuple(self._children.values())
+
+    def node(self, relativePath):
+        node = self
+        for name in relativePath.strip("/").split("/"):
+            node = node._children.get(name)
+            if node is None:
+                return None
+        return node
+
+    def createNode(self, typeName, name=None):
+        return Node(name or f"{typeName}1", typeName, self)
+
+    def isLockedHDA(self):
+        return self._locked
+
+    def allowEditingOfContents(self):
+        self._locked = False
+
+    def matchCurrentDefinition(self):
+        pass
+
+    def moveToGoodPosition(self):
+        pass
+
+    def childrenAsData(self):
+        return {name: child.asData() for name, child in self._children.items()}
+
+    def asData(self):
+        data = {"type": self._type.name()}
+        if self.parms:
+            data["parms"] = dict(self.parms)
+        if self._children:
+            data["children"] = self.childrenAsData()
+        return data
+
+    def setChildrenFromData(self, data, clear_content=True):
+        self.calls.append(("setChildrenFromData", data))
+        if clear_content:
+            self._children.clear()
+        for name, childData in data.items():
+            child = Node(name, childData.get("type", ""), self)
+            child.parms.update(childData.get("parms") or {})
+            child.setChildrenFromData(childData.get("children") or {}, clear_content=False)
+            child.calls.clear()
+
+    def setParmsFromData(self, data):
+        self.parms.update(data)
+
+    def parmTuple(self, name):
+        return None
+
+    def setInput(self, index, source, outputIndex=0):
+        self.inputs[index] = (source, outputIndex)
+
+    def setInputsFromData(self, data):
+        self.calls.append(("setInputsFromData", data))
+
+
+class SopNode(Node):
+    pass
+
+
+def install(monkeypatch):
+    """Install a fresh hou stub with an empty /obj and return it with nodeSnapLogic imported against it."""
+    hou = types.ModuleType("hou")
+    root = Node("")
+    Node("obj", "obj", root)
+
+    hou.Error           = Error
+    hou.OperationFailed = OperationFailed
+    hou.Node            = Node
+    hou.SopNode         = SopNode
+    hou.Keyframe        = object
+    hou.root            = root
+    hou.node            = lambda path: root if path.strip("/") == "" else root.node(path)
+    hou.selectedNodes   = lambda: ()
+    hou.undos           = types.SimpleNamespace(group=contextmanager(lambda label: (yield)))
+
+    monkeypatch.setitem(sys.modules, "hou", hou)
+    monkeypatch.delitem(sys.modules, "nodeSnapLogic", raising=False)
+    import nodeSnapLogic
+    return hou, nodeSnapLogic
@@ -0,0 +1,88 @@
+import json
+import math
+from array import array
+
+import pytest
+
+import nodeJsonCodec
+
+BACKENDS = nodeJsonCodec.availableBackends()
+
+SAMPLE = {
+    "nodes" : {"geo1": {"parm": {"t": [0.0, 1.5, -2.25], "file": "$HIP/geo/a.bgeo.sc", "on": 1}}},
+    "meta"  : {"Houdini Version": "20.5.0", "note": "unicode é and / slashes"},
+}
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("pretty", [True, False])
+def test_round_trip(backend, pretty):
+    encoded = nodeJsonCodec.dumpsBytes(SAMPLE, pretty=pretty, compatible=False, backend=backend)
+    assert nodeJsonCodec.loads(encoded, backend) == SAMPLE
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_non_finite_floats_survive(backend):
+    data = {"parm": {"a": float("nan"), "b": [1.0, float("inf")], "c": array("d", [float("-inf"), 2.0])}}
+    decoded = nodeJsonCodec.loads(nodeJsonCodec.dumpsBytes(data, compatible=False, backend=backend), backend)
+
+    assert math.isnan(decoded["parm"]["a"])
+    assert decoded["parm"]["b"] == [1.0, float("inf")]
+    assert decoded["parm"]["c"] == [float("-inf"), 2.0]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("value", [float("nan"), array("d", [1.0, float("inf")]), {"x": [None, float("-inf")]}])
+def test_single_non_finite_value_falls_back(backend, value):
+    decoded = nodeJsonCodec.loads(nodeJsonCodec.dumpsBytes({"v": value, "n": None}, compatible=False, backend=backend))
+    assert nodeJsonCodec.hasNonFinite(decoded["v"])
+    assert decoded["n"] is None
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_finite_data_is_not_scanned(monkeypatch, backend):
+    def scan(data):
+        raise AssertionError("scanned")
+    monkeypatch.setattr(nodeJsonCodec, "hasNonFinite", scan)
+
+    data = {"t": array("d", [1.0, 2.0]), "s": 0.5}
+    assert nodeJsonCodec.loads(nodeJsonCodec.dumpsBytes(data, compatible=False, backend=backend)) == {"t": [1.0, 2.0], "s": 0.5}
+
+
+def test_has_non_finite():
+    assert not nodeJsonCodec.hasNonFinite(SAMPLE)
+    assert nodeJsonCodec.hasNonFinite({"a": [{"b": (1, float("nan"))}]})
+    assert nodeJsonCodec.hasNonFinite(array("d", [0.0, float("inf")]))
+    assert not nodeJsonCodec.hasNonFinite(array("i", [1, 2]))
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_compatible_matches_stdlib(backend):
+    encoded = nodeJsonCodec.dumps(SAMPLE, compatible=True, backend=backend)
+    assert encoded == json.dumps(SAMPLE, indent=4)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_packed_arrays_are_written_as_lists(backend):
+    data = {"t": array("d", [1.0, 2.0, 3.0])}
+    encoded = nodeJsonCodec.dumpsBytes(data, compatible=False, backend=backend)
+    assert nodeJsonCodec.loads(encoded) == {"t": [1.0, 2.0, 3.0]}
+
+
+def test_loads_memoryview_and_stdlib_only_input():
+    assert nodeJsonCodec.loads(memoryview(b'{"a": 1}'), "json") == {"a": 1}
+    assert math.isnan(nodeJsonCodec.loads(b'{"a": NaN}')["a"])
+
+
+def test_dump_and_load_file(tmp_path):
+    filePath = str(tmp_path / "snap.json")
+    nodeJsonCodec.dump(SAMPLE, filePath)
+    assert nodeJsonCodec.load(filePath) == SAMPLE
+
+    nodeJsonCodec.dump(SAMPLE, filePath, compatible=True)
+    with open(filePath) as f:
+        assert f.read() == json.dumps(SAMPLE, indent=4)
+
+
+def test_unknown_backend_falls_back():
+    assert nodeJsonCodec.selectBackend("noSuchBackend") == BACKENDS[0]
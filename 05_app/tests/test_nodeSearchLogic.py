@@ -0,0 +1,69 @@
+from nodeSearchLogic import NodeSearchIndex, trigramsOf
+
+
+def buildIndex():
+    index = NodeSearchIndex()
+    geo = index.addNode("geo1", "geo", ["tx", "scale"])
+    index.addNode("box1", "box", ["sizex", "divrate"], geo)
+    index.addNode("null_OUT", "null", [], geo)
+    cam = index.addNode("cam1", "cam", ["focal", "resx"])
+    index.addNode("", "", ["aperture"], cam)
+    index.finalize()
+    return index
+
+
+def test_trigrams():
+    assert trigramsOf("abcd") == {"abc", "bcd"}
+    assert trigramsOf("ab") == set()
+
+
+def test_empty_query_filters_nothing():
+    index = buildIndex()
+    assert index.match("   ") is None
+    assert index.visibleIds("") is None
+
+
+def test_short_words_match_prefixes_only():
+    index = buildIndex()
+    assert index.match("bo") == {1}
+    assert index.match("ox") == set()
+
+
+def test_long_words_match_substrings_case_insensitively():
+    index = buildIndex()
+    assert index.match("OUT") == {2}
+    assert index.match("size") == {1}
+    assert index.match("ocal") == {3}
+
+
+def test_every_word_has_to_match():
+    index = buildIndex()
+    assert index.match("geo tx") == {0}
+    assert index.match("box focal") == set()
+
+
+def test_narrowing_and_widening_queries():
+    index = buildIndex()
+    assert index.match("ca") == {3}
+    # A prefix word growing into a substring word must not reuse the prefix result
+    assert index.match("cal") == {0, 3}
+    assert index.match("calx") == set()
+    assert index.match("s") == {0, 1}
+    assert index.match("sc") == {0}
+    assert index.match("sc box") == set()
+    assert index.match("ze") == set()
+    assert index.match("ize") == {1}
+
+
+def test_visible_ids_include_ancestors():
+    index = buildIndex()
+    assert index.visibleIds("aperture") == {3, 4}
+    assert index.visibleIds("null") == {0, 2}
+
+
+def test_adding_after_a_query_resets_the_cache():
+    index = buildIndex()
+    assert index.match("box") == {1}
+    index.addNode("box2", "box")
+    assert index.match("box") == {1, 5}
+    assert len(index) == 6
@@ -0,0 +1,65 @@
+import os
+
+import nodeSnapBlobs
+from nodeSnapBlobs import BlobStore, BLOB_KEY, extractBlobs, isBlobRef, hasBlobs, summarizeBlobs
+
+GEOMETRY = "P 0 0 0\n" * (nodeSnapBlobs.GEOMETRY_THRESHOLD // 8 + 1)
+
+
+def makeData():
+    return {
+        "nodes"       : {"geo1": {"parm": {"stash": GEOMETRY, "label": "small"}, "child": {
+            "net1": {"parm": {}, "children_data": {"file1": {"parms": {"geo": {"points": [[0.0, 1.0]]}}}}},
+        }}},
+        "definitions" : {"key1": {"inner": {"parms": {"stash": GEOMETRY}}}},
+    }
+
+
+def test_extract_and_resolve(tmp_path):
+    filePath = str(tmp_path / "snap.json")
+    data = extractBlobs(makeData(), filePath)
+
+    assert data["blobs"] == "snap.blobs"
+    stash = data["nodes"]["geo1"]["parm"]["stash"]
+    assert isBlobRef(stash) and stash["kind"] == "text" and stash["size"] == len(GEOMETRY)
+    assert data["nodes"]["geo1"]["parm"]["label"] == "small"
+    # Identical payloads share one content hashed file
+    assert data["definitions"]["key1"]["inner"]["parms"]["stash"][BLOB_KEY] == stash[BLOB_KEY]
+    assert len(os.listdir(tmp_path / "snap.blobs")) == 1
+    # Geometry below the threshold stays inline
+    assert data["nodes"]["geo1"]["child"]["net1"]["children_data"] == makeData()["nodes"]["geo1"]["child"]["net1"]["children_data"]
+    assert hasBlobs(data["nodes"]) and not hasBlobs(makeData()["nodes"]["geo1"]["parm"])
+
+    store = BlobStore(data["blobs"])
+    store.setSnapshotPath(filePath)
+    resolved = store.resolve(data["nodes"]["geo1"])
+    store.close()
+    assert resolved == makeData()["nodes"]["geo1"]
+
+
+def test_no_blob_folder_without_geometry(tmp_path):
+    data = extractBlobs({"nodes": {"geo1": {"parm": {"a": 1}}}}, str(tmp_path / "snap.json"))
+    assert "blobs" not in data and not os.listdir(tmp_path)
+
+
+def test_store_without_folder_leaves_values():
+    store = BlobStore()
+    assert not store
+    ref = {BLOB_KEY: "abc", "kind": "text", "size": 3}
+    assert store.resolve(ref) == ref
+
+
+def test_empty_blob_is_read_without_mapping(tmp_path):
+    blobDir = tmp_path / "snap.blobs"
+    blobDir.mkdir()
+    (blobDir / "empty.blob").write_bytes(b"")
+
+    store = BlobStore("snap.blobs")
+    store.setSnapshotPath(str(tmp_path / "snap.json"))
+    assert store.load({BLOB_KEY: "empty", "kind": "text"}) == ""
+    store.close()
+
+
+def test_summary():
+    ref = {BLOB_KEY: "abc", "kind": "json", "size": 3 * 1024 * 1024}
+    assert summarizeBlobs({"a": [ref]}) == {"a": ["<json blob, 3.0 MB>"]}
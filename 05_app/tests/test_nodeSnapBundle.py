@@ -0,0 +1,111 @@
+import os
+
+import pytest
+
+import nodeSnapBundle
+from nodeSnapBundle import MANIFEST, BUNDLE_SUFFIX
+
+
+def makeNodes(count, children=2):
+    return {
+        f"geo{number}": {
+            "path"  : "/obj/",
+            "type"  : "geo",
+            "parm"  : {"tx": float(number)},
+            "child" : {f"box{child}": {"path": f"/obj/geo{number}/", "type": "box", "child": {}}
+                       for child in range(children)},
+        }
+        for number in range(count)
+    }
+
+
+def makeData(count=10):
+    return {
+        "version" : 1,
+        "nodes"   : makeNodes(count),
+        "meta"    : {"Houdini Version": "20.5.0"},
+        "strings" : {"s0": "abc"},
+        "labels"  : {"Sop/box": {"size": "Size"}},
+    }
+
+
+def test_split_shards_keeps_top_level_nodes_whole():
+    shards = list(nodeSnapBundle.splitShards(makeNodes(10), nodesPerShard=7))
+    # Every geo counts three records, so a shard closes after the third geo
+    assert [len(shard) for shard in shards] == [3, 3, 3, 1]
+    assert [name for shard in shards for name in shard] == list(makeNodes(10))
+
+
+@pytest.mark.parametrize("fileName", ["snap" + BUNDLE_SUFFIX, "snap.zip"])
+def test_round_trip(tmp_path, fileName):
+    filePath = str(tmp_path / fileName)
+    data = makeData()
+
+    root = nodeSnapBundle.writeBundle(data, filePath, nodesPerShard=7)
+    assert nodeSnapBundle.isBundle(root)
+    assert nodeSnapBundle.readBundle(root) == data
+    assert list(nodeSnapBundle.readBundle(root)["nodes"]) == list(data["nodes"])
+
+
+def test_manifest_path_opens_the_bundle(tmp_path):
+    root = nodeSnapBundle.writeBundle(makeData(), str(tmp_path / ("snap" + BUNDLE_SUFFIX)))
+    manifestPath = os.path.join(root, MANIFEST)
+
+    assert nodeSnapBundle.isBundle(manifestPath)
+    assert nodeSnapBundle.bundleRoot(manifestPath) == root
+    assert nodeSnapBundle.sourceFile(root) == manifestPath
+    assert nodeSnapBundle.readBundle(manifestPath)["meta"] == {"Houdini Version": "20.5.0"}
+
+
+@pytest.mark.parametrize("fileName", ["snap" + BUNDLE_SUFFIX, "snap.zip"])
+def test_rewrite_replaces_the_whole_bundle(tmp_path, fileName):
+    filePath = str(tmp_path / fileName)
+    nodeSnapBundle.writeBundle(makeData(30), filePath, nodesPerShard=7)
+    nodeSnapBundle.writeBundle(makeData(2), filePath, nodesPerShard=7)
+
+    assert list(nodeSnapBundle.readBundle(filePath)["nodes"]) == ["geo0", "geo1"]
+    if os.path.isdir(filePath):
+        assert sorted(os.listdir(filePath)) == [MANIFEST, "shard_00000.json"]
+    # Nothing of the temporary or replaced bundle is left next to it
+    assert sorted(os.listdir(tmp_path)) == [fileName]
+
+
+def test_failed_write_keeps_the_old_bundle(tmp_path, monkeypatch):
+    filePath = str(tmp_path / ("snap" + BUNDLE_SUFFIX))
+    nodeSnapBundle.writeBundle(makeData(3), filePath)
+
+    def failingDump(*args, **kwargs):
+        raise OSError("disk full")
+    monkeypatch.setattr(nodeSnapBundle.nodeJsonCodec, "dump", failingDump)
+
+    with pytest.raises(OSError):
+        nodeSnapBundle.writeBundle(makeData(5), filePath)
+    monkeypatch.undo()
+
+    assert list(nodeSnapBundle.readBundle(filePath)["nodes"]) == ["geo0", "geo1", "geo2"]
+
+
+def test_rejects_foreign_manifest(tmp_path):
+    root = tmp_path / ("other" + BUNDLE_SUFFIX)
+    root.mkdir()
+    (root / MANIFEST).write_text('{"format": "something-else"}')
+    with pytest.raises(ValueError):
+        nodeSnapBundle.readManifest(str(root))
+
+
+def test_plain_folders_are_not_bundles(tmp_path):
+    folder = tmp_path / "templates"
+    folder.mkdir()
+    (folder / "notes.txt").write_text("keep me")
+
+    assert not nodeSnapBundle.isBundle(str(folder))
+    with pytest.raises(ValueError):
+        nodeSnapBundle.writeBundle(makeData(), str(folder))
+
+    # A folder named like a bundle but without a manifest is not overwritten either
+    lookalike = tmp_path / ("other" + BUNDLE_SUFFIX)
+    lookalike.mkdir()
+    (lookalike / "notes.txt").write_text("keep me")
+    with pytest.raises(ValueError):
+        nodeSnapBundle.writeBundle(makeData(), str(lookalike))
+    assert (lookalike / "notes.txt").read_text() == "keep me"
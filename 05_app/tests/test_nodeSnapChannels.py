@@ -0,0 +1,95 @@
+import pytest
+
+import nodeSnapChannels
+from nodeSnapChannels import CHANNEL_KEY, encodeKeys, decodeKeys, encodeChannels, decodeChannels
+
+
+def makeKeys(count=6):
+    return [
+        {"frame": frame, "value": frame * 0.5, "slope": 0.0, "accel": 0.3333, "expression": "bezier()"}
+        for frame in range(1, count + 1)
+    ]
+
+
+def test_round_trip_is_exact():
+    keys = makeKeys()
+    decoded = decodeKeys(encodeKeys(keys))
+    assert decoded == keys
+    assert [list(key) for key in decoded] == [list(key) for key in keys]
+    assert all(type(key["frame"]) is int for key in decoded)
+
+
+def test_shared_fields_become_constants_and_numbers_columns():
+    channel = encodeKeys(makeKeys())[CHANNEL_KEY]
+    assert set(channel["constants"]) == {"slope", "accel", "expression"}
+    assert set(channel["numeric"]) == {"frame", "value"}
+    assert channel["integers"] == ["frame"]
+
+
+def test_explicit_none_and_absent_fields_are_kept_apart():
+    keys = makeKeys()
+    keys[1]["expression"] = None
+    keys[2]["value"] = None
+    del keys[3]["slope"]
+    keys[4]["in_slope"] = None
+    keys[5]["lock"] = "on"
+
+    assert decodeKeys(encodeKeys(keys)) == keys
+
+
+def test_string_columns_use_a_table():
+    keys = makeKeys()
+    for number, key in enumerate(keys):
+        key["expression"] = ("linear()", "bezier()", None)[number % 3]
+
+    tableData = encodeKeys(keys)[CHANNEL_KEY]["tables"]["expression"]
+    assert tableData["table"] == ["linear()", "bezier()"]
+    assert decodeKeys(encodeKeys(keys)) == keys
+
+
+def test_channels_without_missing_section_drop_none():
+    channel = encodeKeys(makeKeys())
+    channel[CHANNEL_KEY].pop("missing")
+    channel[CHANNEL_KEY]["other"]["extra"] = [None, 1, None, 1, None, 1]
+    channel[CHANNEL_KEY]["fields"].append("extra")
+
+    decoded = decodeKeys(channel)
+    assert "extra" not in decoded[0] and decoded[1]["extra"] == 1
+
+
+def test_short_and_non_keyframe_lists_are_left_alone():
+    short = makeKeys(nodeSnapChannels.MIN_KEYS - 1)
+    value = {"short": short, "plain": [1.0, 2.0, 3.0, 4.0], "nested": [makeKeys()]}
+
+    encoded = encodeChannels(value)
+    assert encoded["short"] == short and encoded["plain"] == value["plain"]
+    assert nodeSnapChannels.isChannel(encoded["nested"][0])
+    assert nodeSnapChannels.hasChannels(encoded) and not nodeSnapChannels.hasChannels(value)
+    assert decodeChannels(encoded) == value
+
+
+@pytest.mark.parametrize("values", [[0.0, -1.5, 1e300], [float("inf")]])
+def test_column_packing(values):
+    assert nodeSnapChannels.unpackColumn(nodeSnapChannels.packColumn(values)).tolist() == values
+
+
+def test_summary_and_snapshot_encoding():
+    data = {"nodes": {"geo1": {"parm": {"tx": makeKeys()}, "child": {"box1": {"parm": {"ty": makeKeys()}}}}}}
+    nodeSnapChannels.encodeSnapshotChannels(data)
+
+    parm = data["nodes"]["geo1"]["parm"]
+    assert nodeSnapChannels.summarizeChannels(parm) == {"tx": "<6 keys, frame 1-6>"}
+    assert nodeSnapChannels.isChannel(data["nodes"]["geo1"]["child"]["box1"]["parm"]["ty"])
+
+
+def test_native_payloads_and_definitions_are_encoded():
+    payload = {"box1": {"type": "box", "parms": {"sizex": makeKeys()}, "children": {"inner": {"parms": {"t": makeKeys()}}}}}
+    data = {"nodes": {"geo1": {"parm": {}, "children_data": payload, "child": {}}},
+            "definitions": {"abc": {"box1": {"type": "box", "parms": {"sizey": makeKeys()}}}}}
+    nodeSnapChannels.encodeSnapshotChannels(data)
+
+    childrenData = data["nodes"]["geo1"]["children_data"]
+    assert nodeSnapChannels.isChannel(childrenData["box1"]["parms"]["sizex"])
+    assert nodeSnapChannels.isChannel(childrenData["box1"]["children"]["inner"]["parms"]["t"])
+    assert nodeSnapChannels.isChannel(data["definitions"]["abc"]["box1"]["parms"]["sizey"])
+    assert decodeChannels(childrenData)["box1"]["parms"]["sizex"] == makeKeys()
@@ -0,0 +1,51 @@
+import os
+
+import pytest
+
+from nodeSnapCheckpoint import Checkpoint, checkpointPath
+
+
+@pytest.fixture(autouse=True)
+def tempDir(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOUDINI_TEMP_DIR", str(tmp_path))
+    return tmp_path
+
+
+def test_save_load_and_remove(tempDir):
+    checkpoint = Checkpoint("/templates/a.json", "hash1", {"/obj/b", "/obj/a"}, "/obj/target")
+    checkpoint.done.append("/obj/a")
+    checkpoint.created.extend(["/obj/target/a", "/obj/target/a/box1"])
+    checkpoint.save()
+
+    path = checkpointPath("/templates/a.json")
+    assert os.path.dirname(path) == str(tempDir) and not os.path.exists(path + ".tmp")
+
+    loaded = Checkpoint.load("/templates/a.json")
+    assert loaded.checked == ["/obj/a", "/obj/b"]
+    assert loaded.done == ["/obj/a"] and loaded.created == checkpoint.created
+    assert loaded.matches("hash1", ["/obj/a", "/obj/b"], "/obj/target")
+    assert not loaded.matches("hash2", ["/obj/a", "/obj/b"], "/obj/target")
+    assert not loaded.matches("hash1", ["/obj/a"], "/obj/target")
+    assert not loaded.matches("hash1", ["/obj/a", "/obj/b"])
+
+    loaded.remove()
+    assert Checkpoint.load("/templates/a.json") is None
+
+
+def test_checkpoints_are_per_snapshot():
+    assert checkpointPath("/templates/a.json") != checkpointPath("/templates/b.json")
+    Checkpoint("/templates/a.json", "hash", []).save()
+    assert Checkpoint.load("/templates/b.json") is None
+
+
+def test_in_memory_models_are_never_saved(tempDir):
+    checkpoint = Checkpoint("", "", [])
+    checkpoint.save()
+    checkpoint.remove()
+    assert os.listdir(tempDir) == []
+
+
+def test_broken_checkpoint_is_ignored():
+    with open(checkpointPath("/templates/a.json"), "w") as f:
+        f.write('{"source": "/templates/a.json"}')
+    assert Checkpoint.load("/templates/a.json") is None
@@ -0,0 +1,96 @@
+import os
+
+import nodeJsonCodec
+import nodeSnapIndex
+from nodeSnapModel import SnapshotModel, writeSnapshot
+
+DATA = {
+    "version" : 1,
+    "meta"    : {"Houdini Version": "20.5.0"},
+    "nodes"   : {
+        "geo1": {
+            "path"   : "/obj/",
+            "type"   : "geo",
+            "root"   : "/obj/",
+            "parent" : {"name": "obj", "type": ""},
+            "parm"   : {"tx": 1.0, "t": [0.0, 1.0, 2.0]},
+            "child"  : {"box1": {"path": "/obj/geo1/", "type": "box", "parm": {"size": 2.0}, "child": {}}},
+        },
+    },
+}
+
+
+def writeJson(tmp_path, name="snap.json", data=DATA):
+    filePath = str(tmp_path / name)
+    nodeJsonCodec.dump(data, filePath)
+    return filePath
+
+
+def openAndWait(filePath):
+    model = nodeSnapIndex.openModel(filePath)
+    thread = nodeSnapIndex._rebuildThreads.get(filePath)
+    if thread is not None:
+        thread.join()
+    return model
+
+
+def test_open_builds_index_then_opens_from_it(tmp_path):
+    filePath = writeJson(tmp_path)
+
+    full = openAndWait(filePath)
+    assert full.loaded and os.path.exists(nodeSnapIndex.indexPath(filePath))
+
+    skeleton = nodeSnapIndex.openModel(filePath)
+    assert not skeleton.loaded
+    assert [record.fullPath for record in skeleton.records] == ["/obj/geo1", "/obj/geo1/box1"]
+    assert list(skeleton.record("/obj/geo1").parms) == ["tx", "t"]
+    assert skeleton.meta == DATA["meta"]
+
+    skeleton.ensureLoaded()
+    assert skeleton.record("/obj/geo1/box1").parms == {"size": 2.0}
+
+
+def test_index_path_keeps_the_full_name(tmp_path):
+    jsonPath = writeJson(tmp_path, "a.json")
+    streamPath = writeSnapshot(DATA, str(tmp_path / "a.ndjson"))
+
+    assert nodeSnapIndex.indexPath(jsonPath) != nodeSnapIndex.indexPath(streamPath)
+    openAndWait(jsonPath)
+    openAndWait(streamPath)
+    assert nodeSnapIndex.readIndex(jsonPath) is not None
+    assert nodeSnapIndex.readIndex(streamPath) is not None
+
+
+def test_touched_file_keeps_its_index_and_stores_the_new_mtime(tmp_path):
+    filePath = writeJson(tmp_path)
+    openAndWait(filePath)
+
+    stat = os.stat(filePath)
+    os.utime(filePath, (stat.st_atime, stat.st_mtime + 10))
+    assert nodeSnapIndex.readIndex(filePath) is not None
+
+    stored = nodeJsonCodec.load(nodeSnapIndex.indexPath(filePath))["source"]
+    assert stored["mtime"] == os.stat(filePath).st_mtime
+
+
+def test_changed_file_makes_the_index_stale(tmp_path):
+    filePath = writeJson(tmp_path)
+    openAndWait(filePath)
+
+    changed = dict(DATA, meta={"Houdini Version": "21.0.0"})
+    nodeJsonCodec.dump(changed, filePath)
+    assert nodeSnapIndex.readIndex(filePath) is None
+    assert nodeSnapIndex.snapshotHash(filePath) == nodeSnapIndex.fileHash(filePath)
+
+
+def test_background_rebuild_uses_a_copy_of_the_model(tmp_path):
+    filePath = writeJson(tmp_path)
+    model = SnapshotModel.load(filePath)
+
+    skeletonData = nodeSnapIndex.skeleton(model)
+    model.meta["Houdini Version"] = "edited"
+    model.records.clear()
+
+    assert nodeSnapIndex.writeSkeleton(skeletonData, filePath)
+    index = nodeSnapIndex.readIndex(filePath)
+    assert index["meta"] == DATA["meta"] and len(index["records"]) == 2
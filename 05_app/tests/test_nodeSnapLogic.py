@@ -0,0 +1,168 @@
+import pytest
+
+import fakeHou
+from nodeSnapModel import SnapshotModel, SCHEMA_VERSION
+from nodeSnapChannels import encodeSnapshotChannels
+
+
+def nodeEntry(path, typeName, parms=None, children=None, **extra):
+    entry = {"path": path, "type": typeName, "root": "/obj/", "parent": {"name": "obj", "type": ""},
+             "parm": parms or {}, "parm_label": {}, "input": None, "flag": None, "child": children or {}}
+    entry.update(extra)
+    return entry
+
+
+@pytest.fixture
+def hou(monkeypatch):
+    return fakeHou.install(monkeypatch)
+
+
+def test_native_children_imported_with_owner(hou):
+    hou, nodeSnapLogic = hou
+    childrenData = {
+        "box1"  : {"type": "box", "parms": {"sizex": 2.0}},
+        "xform1": {"type": "xform", "parms": {"ty": 1.0}, "children": {}},
+    }
+    model = SnapshotModel.fromData({"version": SCHEMA_VERSION, "meta": {}, "nodes": {
+        "geo1": nodeEntry("/obj/", "geo", {"scale": 2.0}, children_data=childrenData),
+    }})
+    owner = model.record("/obj/geo1")
+    # Only the owner is checked, its native rows can not be
+    records = [owner]
+
+    logic = nodeSnapLogic.NodeSnapLogic()
+    fallback = logic.importRecordsNative(model, records)
+
+    assert fallback == []
+    geo = hou.node("/obj/geo1")
+    assert sorted(child.name() for child in geo.children()) == ["box1", "xform1"]
+    assert geo.node("box1").parms == {"sizex": 2.0}
+    assert geo.parms == {"scale": 2.0}
+
+
+def test_native_import_decodes_channels(hou):
+    hou, nodeSnapLogic = hou
+    keys = [{"frame": frame, "value": frame * 0.5} for frame in range(1, 7)]
+    data = {"version": SCHEMA_VERSION, "meta": {}, "nodes": {
+        "geo1": nodeEntry("/obj/", "geo", children_data={"box1": {"type": "box", "parms": {"sizex": keys}}}),
+    }}
+    encodeSnapshotChannels(data)
+    model = SnapshotModel.fromData(data)
+
+    nodeSnapLogic.NodeSnapLogic().importRecordsNative(model, [model.record("/obj/geo1")])
+
+    assert hou.node("/obj/geo1/box1").parms == {"sizex": keys}
+
+
+def lockedTool(hou, name, size):
+    definition = fakeHou.Definition("/hda/tools.hda", modified=1)
+    tool = fakeHou.Node(name, "tool", hou.node("/obj"), definition=definition, locked=True)
+    fakeHou.Node("inner", "box", tool).parms["size"] = size
+    return tool
+
+
+def definitionModel(key, size):
+    return SnapshotModel.fromData({"version": SCHEMA_VERSION, "meta": {},
+                                   "definitions": {key: {"inner": {"type": "box", "parms": {"size": size}}}},
+                                   "nodes": {
+                                       "tool1": nodeEntry("/obj/", "tool", definition=key),
+                                       "tool2": nodeEntry("/obj/", "tool", definition=key),
+                                   }})
+
+
+def test_definition_contents_stored_once(hou):
+    hou, nodeSnapLogic = hou
+    logic = nodeSnapLogic.NodeSnapLogic()
+    definitions = {}
+
+    first = logic.childrenToData(lockedTool(hou, "tool1", 1.0), definitions)
+    second = logic.childrenToData(lockedTool(hou, "tool2", 1.0), definitions)
+
+    assert first == second == {"definition": next(iter(definitions))}
+    assert definitions[first["definition"]] == {"inner": {"type": "box", "parms": {"size": 1.0}}}
+
+
+@pytest.mark.parametrize("sessionSize, applied", [(1.0, False), (3.0, True)])
+def test_definition_contents_applied_on_mismatch(hou, sessionSize, applied):
+    hou, nodeSnapLogic = hou
+    tools = [lockedTool(hou, "tool1", sessionSize), lockedTool(hou, "tool2", sessionSize)]
+    model = definitionModel("saved", 1.0)
+
+    nodeSnapLogic.NodeSnapLogic().setNodeDataFromRecords([model.record("/obj/tool1"), model.record("/obj/tool2")])
+
+    for tool in tools:
+        calls = [name for name, _ in tool.calls if name == "setChildrenFromData"]
+        assert calls == (["setChildrenFromData"] if applied else [])
+        assert tool.node("inner").parms["size"] == 1.0
+        # Saved contents only unlock the instances whose definition differs
+        assert tool.isLockedHDA() is not applied
+
+
+def test_inputs_follow_the_target_network(hou):
+    hou, nodeSnapLogic = hou
+    fakeHou.Node("hero", "subnet", hou.node("/obj"))
+    model = SnapshotModel.fromData({"version": SCHEMA_VERSION, "meta": {}, "nodes": {
+        "geo1": nodeEntry("/obj/", "geo", children={
+            "box1"  : nodeEntry("/obj/geo1/", "box"),
+            "xform1": nodeEntry("/obj/geo1/", "xform", input=[{"from": "box1"}]),
+            "merge1": nodeEntry("/obj/geo1/", "merge", input=[
+                {"from": "/obj/geo1/box1", "to_index": 0},
+                {"from": "/obj/gone/box1", "to_index": 1},
+            ]),
+        }),
+    }})
+    records = list(model.records)
+
+    logic = nodeSnapLogic.NodeSnapLogic()
+    logic.remapper = nodeSnapLogic.PathRemapper({"/obj/geo1": "/obj/hero/geo1"})
+    createdNodes = logic.createNodesFromRecords(records)
+    unresolved = logic.setNodeDataFromRecords(records, createdNodes=createdNodes)
+
+    box = hou.node("/obj/hero/geo1/box1")
+    merge = hou.node("/obj/hero/geo1/merge1")
+    assert hou.node("/obj/geo1") is None
+    assert hou.node("/obj/hero/geo1/xform1").inputs == {0: (box, 0)}
+    assert merge.inputs == {0: (box, 0)}
+    # A source outside the import is reported, not looked up again at its saved path
+    assert unresolved == [("/obj/hero/geo1/merge1", 1, "/obj/gone/box1")]
+    assert not [call for call in merge.calls if call[0] == "setInputsFromData"]
+
+
+class CookedNode(fakeHou.SopNode):
+    def __init__(self, name, parent, cooks, cookTime):
+        super().__init__(name, "box", parent)
+        self.cooks    = cooks
+        self.cookTime = cookTime
+        self.forced   = 0
+
+    def allSubChildren(self):
+        return tuple(child for node in self.children() for child in (node, *node.allSubChildren()))
+
+    def cookCount(self):
+        return self.cooks
+
+    def lastCookTime(self):
+        return self.cookTime
+
+    def cook(self, force=False):
+        self.forced += 1
+        self.cooks += 1
+
+    def needsToCook(self):
+        return True
+
+
+def test_cook_stats_read_without_cooking(hou):
+    hou, nodeSnapLogic = hou
+    top = CookedNode("geo1", hou.node("/obj"), 7, 12.5)
+    inner = CookedNode("box1", top, 3, 2.0)
+    logic = nodeSnapLogic.NodeSnapLogic()
+
+    stats = logic.captureCookStats([top])
+    assert stats == {"/obj/geo1": {"time": 12.5, "cooks": 7, "memory": 0},
+                     "/obj/geo1/box1": {"time": 2.0, "cooks": 3, "memory": 0}}
+    assert top.forced == inner.forced == 0
+
+    # A forced cook is opt-in and limited to the given nodes
+    logic.captureCookStats([top], forceCook=True)
+    assert (top.forced, inner.forced) == (1, 0)
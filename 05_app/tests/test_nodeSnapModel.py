@@ -0,0 +1,155 @@
+import copy
+from array import array
+
+import pytest
+
+import nodeSnapModel
+from nodeSnapModel import SnapshotModel, migrate, packValue, unpackValue, SCHEMA_VERSION
+
+
+def nodeEntry(path, typeName, parms=None, children=None, **extra):
+    entry = {"path": path, "type": typeName, "root": "/obj/", "parent": {"name": "obj", "type": ""},
+             "parm": parms or {}, "parm_label": {}, "input": None, "flag": None, "child": children or {}}
+    entry.update(extra)
+    return entry
+
+
+DATA = {
+    "version" : SCHEMA_VERSION,
+    "meta"    : {"Houdini Version": "20.5.0"},
+    "nodes"   : {
+        "geo1": nodeEntry("/obj/", "geo", {"t": [0.0, 1.0, 2.0], "scale": 1.0}, {
+            "box1"  : nodeEntry("/obj/geo1/", "box", {"size": [1.0, 1.0, 1.0], "divs": [2, 2, 2]}),
+            "xform1": nodeEntry("/obj/geo1/", "xform", {"ramp": {"points": [[0.0, 0.5], [1.0, 1.5]]}},
+                                input=[{"from": "box1"}]),
+        }),
+        "cam1": nodeEntry("/obj/", "cam", {"resx": 1920}, comment="kept as extra"),
+    },
+}
+
+
+def test_pack_value():
+    packed = packValue({"a": [1.0, 2.0], "b": [1, 2], "c": [1.0], "d": [[0.0, 1.0], "x"], "e": [1.0, 2]})
+    assert isinstance(packed["a"], array) and packed["a"].typecode == "d"
+    assert packed["b"] == [1, 2] and packed["c"] == [1.0] and packed["e"] == [1.0, 2]
+    assert isinstance(packed["d"][0], array)
+    assert unpackValue(packed) == {"a": [1.0, 2.0], "b": [1, 2], "c": [1.0], "d": [[0.0, 1.0], "x"], "e": [1.0, 2]}
+
+
+def test_round_trip():
+    model = SnapshotModel.fromData(copy.deepcopy(DATA))
+    assert [record.fullPath for record in model.records] == ["/obj/geo1", "/obj/geo1/box1", "/obj/geo1/xform1", "/obj/cam1"]
+    assert isinstance(model.record("/obj/geo1").parms["t"], array)
+    assert model.record("/obj/cam1").extra == {"comment": "kept as extra"}
+    assert model.toData() == DATA
+
+
+def test_tree_navigation():
+    model = SnapshotModel.fromData(copy.deepcopy(DATA))
+    geo = model.byPath["/obj/geo1"]
+    xform = model.byPath["/obj/geo1/xform1"]
+
+    assert model.roots == [geo, model.byPath["/obj/cam1"]]
+    assert list(model.walk(geo)) == [geo, model.byPath["/obj/geo1/box1"], xform]
+    assert list(model.ancestors(xform)) == [geo]
+    assert model.record("/obj/missing") is None
+
+
+def test_migrate_v0_aliases_and_grandchildren():
+    legacy = {"nodes": {"geo1": {
+        "path": "/obj/", "type": "geo", "parms": {"tx": 1.0}, "label": {"tx": "Translate X"}, "child": {
+            "sub1": {"path": "/obj/geo1/", "type": "subnet", "parms": {}, "grandchild": {
+                "box1": {"path": "/obj/geo1/sub1/", "type": "box", "parms": {"size": 1.0}},
+            }},
+            "net1": {"path": "/obj/geo1/", "type": "dopnet", "grandchild": {
+                "solver": {"type": "rbdsolver", "parms": {}},
+            }},
+        },
+    }}}
+
+    data = migrate(legacy)
+    assert data["version"] == SCHEMA_VERSION
+    geo = data["nodes"]["geo1"]
+    assert geo["parm"] == {"tx": 1.0} and geo["parm_label"] == {"tx": "Translate X"}
+    assert geo["child"]["sub1"]["child"]["box1"]["parm"] == {"size": 1.0}
+    # Payloads without paths came from childrenAsData()
+    assert geo["child"]["net1"]["children_data"] == {"solver": {"type": "rbdsolver", "parms": {}}}
+
+    model = SnapshotModel.fromData(data)
+    assert model.record("/obj/geo1/net1/solver").native
+
+
+def test_current_version_is_not_migrated_again():
+    data = {"version": SCHEMA_VERSION, "nodes": {"geo1": {"path": "/obj/", "type": "geo", "parms": {"a": 1}}}}
+    assert "parms" in migrate(data)["nodes"]["geo1"]
+
+
+def test_native_payloads_and_definitions():
+    payload = {"solver": {"type": "rbdsolver", "parms": {"substeps": 2}, "children": {
+        "inner": {"type": "null", "parms": {}},
+    }}}
+    data = {
+        "version"     : SCHEMA_VERSION,
+        "nodes"       : {
+            "net1": nodeEntry("/obj/", "dopnet", children_data=payload),
+            "hda1": nodeEntry("/obj/", "myasset", definition="key1"),
+        },
+        "definitions" : {"key1": {"null1": {"type": "null"}}},
+    }
+    model = SnapshotModel.fromData(data)
+
+    inner = model.record("/obj/net1/solver/inner")
+    assert inner.native and inner.parentType == "rbdsolver"
+    # Edits of native parms flow back into the payload
+    model.record("/obj/net1/solver").parms["substeps"] = 4
+    assert payload["solver"]["parms"]["substeps"] == 4
+
+    shared = model.record("/obj/hda1/null1")
+    assert shared.native and shared.definition == "key1"
+    assert model.toData()["nodes"]["hda1"]["definition"] == "key1"
+    assert model.toData()["definitions"] == data["definitions"]
+    # Native records go back as the payload, never as saved children
+    assert model.toData()["nodes"]["net1"]["child"] == {}
+
+
+def test_labels_for():
+    model = SnapshotModel.fromData({"version": SCHEMA_VERSION, "nodes": {
+        "null1": nodeEntry("/obj/", "null"),
+        "geo1" : nodeEntry("/obj/", "geo", parm_label={"tx": "Own Label"}),
+    }, "labels": {"Object/null": {"scale": "Uniform Scale"}, "Sop/null": {"copyinput": "Copy Input"}, "null": {"old": "Old"}}})
+
+    assert model.labelsFor(model.record("/obj/null1"), "Object") == {"scale": "Uniform Scale"}
+    assert model.labelsFor(model.record("/obj/null1"), "Sop") == {"copyinput": "Copy Input"}
+    # Tables without categories, written by older versions
+    assert model.labelsFor(model.record("/obj/null1")) == {"old": "Old"}
+    assert model.labelsFor(model.record("/obj/geo1"), "Object") == {"tx": "Own Label"}
+
+
+@pytest.mark.parametrize("fileName", ["snap.json", "snap.ndjson", "snap.nsbundle", "snap.zip"])
+def test_write_and_load_every_format(tmp_path, fileName):
+    filePath = nodeSnapModel.writeSnapshot(copy.deepcopy(DATA), str(tmp_path / fileName))
+    model = SnapshotModel.load(filePath)
+    assert model.source == filePath
+    assert model.toData() == DATA
+
+
+def test_newer_version_is_rejected():
+    data = {"version": SCHEMA_VERSION + 1, "nodes": {}}
+    with pytest.raises(ValueError):
+        migrate(data)
+    assert data["version"] == SCHEMA_VERSION + 1
+
+
+def test_stream_from_a_newer_version_is_rejected():
+    with pytest.raises(ValueError):
+        SnapshotModel.fromStream([{"version": SCHEMA_VERSION + 1}])
+
+
+def test_ensure_loaded_replaces_a_skeleton(tmp_path):
+    filePath = nodeSnapModel.writeSnapshot(copy.deepcopy(DATA), str(tmp_path / "snap.json"))
+    skeleton = SnapshotModel()
+    skeleton.source, skeleton.loaded = filePath, False
+
+    assert skeleton.ensureLoaded() is skeleton
+    assert skeleton.loaded and len(skeleton) == 4
+    assert skeleton.record("/obj/cam1").parms == {"resx": 1920}
@@ -0,0 +1,46 @@
+import nodeJsonCodec
+import nodeSnapProfile
+from nodeSnapProfile import ImportProfiler, DISABLED, PHASES
+
+
+def test_disabled_profiler_records_nothing():
+    assert not DISABLED
+    assert DISABLED.mark() == 0 and DISABLED.add("/obj/a", "create", 0) == 0
+    assert DISABLED.rows() == []
+
+
+def test_phases_chain_and_sum():
+    profiler = ImportProfiler()
+    start = profiler.mark()
+    start = profiler.add("/obj/a", "create", start, "geo")
+    start = profiler.add("/obj/a", "parms", start)
+    profiler.add("/obj/b", "create", profiler.mark())
+    profiler.add("/obj/b", "flags", profiler.mark(), "null")
+    profiler.nodes["/obj/a"]["parms"] += 1.0
+
+    rows = profiler.rows()
+    assert [row["path"] for row in rows] == ["/obj/a", "/obj/b"]
+    assert rows[0]["type"] == "geo" and rows[1]["type"] == "null"
+    assert rows[0]["total"] == sum(rows[0][phase] for phase in PHASES)
+    assert [row["path"] for row in profiler.rows("path")] == ["/obj/a", "/obj/b"]
+
+    totals = profiler.totals()
+    assert totals["total"] == sum(totals[phase] for phase in PHASES)
+
+
+def test_write(tmp_path):
+    profiler = ImportProfiler()
+    profiler.add("/obj/a", "create", profiler.mark(), "geo")
+    data = nodeJsonCodec.load(profiler.write(str(tmp_path / "profile.json")))
+    assert data["phases"] == list(PHASES) and data["nodes"][0]["path"] == "/obj/a"
+
+
+
+
+
+def test_cook_stats():
+    stats = {"/obj/a": {"time": 10.0, "memory": 1024 * 1024}, "/obj/b": {"time": 40.0, "cooks": 2}}
+    assert nodeSnapProfile.heatLevels(stats) == {"/obj/a": 0.25, "/obj/b": 1.0}
+    assert nodeSnapProfile.heatLevels({"/obj/a": {}}) == {"/obj/a": 0.0}
+    assert nodeSnapProfile.summarizeCookStats(stats) == "2 nodes, 50.0 ms, 1.0 MB\nSlowest: /obj/b (40.0 ms)"
+    assert nodeSnapProfile.summarizeCookStats({}) == "No cook stats"
@@ -0,0 +1,53 @@
+from nodeSnapChannels import encodeKeys, decodeKeys
+from nodeSnapRemap import PathRemapper, normalizePath
+
+# What the loader builds for /obj/geo1 and /obj/geo2 imported under /obj/hero
+MAPPING = {"/obj/geo1": "/obj/hero/geo1", "/obj/geo2/": "/obj/hero/geo2"}
+
+
+def test_normalize_path():
+    assert normalizePath(" obj/geo1/ ") == "/obj/geo1"
+
+
+def test_empty_mapping_is_falsy_and_leaves_values():
+    remapper = PathRemapper({"/": "/obj", "": "/x"})
+    assert not remapper
+    assert remapper.remapValue({"a": "/obj/geo1"}) == {"a": "/obj/geo1"}
+
+
+def test_remap_path_only_on_name_boundaries():
+    remapper = PathRemapper(MAPPING)
+    assert remapper.remapPath("/obj/geo1") == "/obj/hero/geo1"
+    assert remapper.remapPath("/obj/geo1/box1") == "/obj/hero/geo1/box1"
+    assert remapper.remapPath("/obj/geo10") == "/obj/geo10"
+    assert remapper.remapPath("/obj/cam1") == "/obj/cam1"
+    assert remapper.remapPath("") == ""
+
+
+def test_longest_prefix_wins():
+    remapper = PathRemapper({"/obj/geo1": "/a", "/obj/geo1/sub": "/b"})
+    assert remapper.remapPath("/obj/geo1/sub/box") == "/b/box"
+    assert remapper.remapPath("/obj/geo1/other") == "/a/other"
+
+
+def test_remap_text_absolute_references_only():
+    remapper = PathRemapper(MAPPING)
+    text = 'ch("/obj/geo1/box1/sizex") + ch("../geo1/tx") + ch("/obj/cam1/focal") + ch("/obj/geo2/tx")'
+    assert remapper.remapText(text) == (
+        'ch("/obj/hero/geo1/box1/sizex") + ch("../geo1/tx") + ch("/obj/cam1/focal") + ch("/obj/hero/geo2/tx")'
+    )
+    assert remapper.remapText("/obj/geo1") == "/obj/hero/geo1"
+    assert remapper.remapText("op:/obj/geo1 and x/obj/geo1") == "op:/obj/hero/geo1 and x/obj/geo1"
+
+
+def test_remap_value_walks_containers_and_channels():
+    remapper = PathRemapper(MAPPING)
+    keys = [{"frame": frame, "value": 0.0, "expression": 'ch("/obj/geo1/tx")'} for frame in range(5)]
+    value = {"a": ["/obj/geo2/out", 1, None], "b": {"c": "/obj/geo1"}, "keys": encodeKeys(keys)}
+
+    remapped = remapper.remapValue(value)
+    assert remapped["a"] == ["/obj/hero/geo2/out", 1, None]
+    assert remapped["b"] == {"c": "/obj/hero/geo1"}
+    assert {key["expression"] for key in decodeKeys(remapped["keys"])} == {'ch("/obj/hero/geo1/tx")'}
+    # The source value is left as it was
+    assert value["a"][0] == "/obj/geo2/out"
@@ -0,0 +1,95 @@
+import os
+
+import pytest
+
+import nodeSnapStream
+import nodeSnapBlobs
+from nodeSnapModel import SnapshotModel
+
+DATA = {
+    "version" : 1,
+    "meta"    : {"Houdini Version": "20.5.0"},
+    "strings" : {"abc": "eJwrSa0oAQAEZwHG"},
+    "nodes"   : {
+        "geo1": {"path": "/obj/", "type": "geo", "parm": {"tx": 1.0}, "child": {
+            "box1": {"path": "/obj/geo1/", "type": "box", "parm": {}, "child": {}},
+            "null1": {"path": "/obj/geo1/", "type": "null", "parm": {}, "child": {}},
+        }},
+        "cam1": {"path": "/obj/", "type": "cam", "parm": {}, "child": {}},
+    },
+}
+
+
+def test_flatten_writes_parents_first():
+    entries = list(nodeSnapStream.flattenNodes(DATA["nodes"]))
+    assert [entry["fullPath"] for entry in entries] == ["/obj/geo1", "/obj/geo1/box1", "/obj/geo1/null1", "/obj/cam1"]
+    assert entries[1]["parentPath"] == "/obj/geo1" and entries[0]["parentPath"] is None
+    assert "child" not in entries[0]
+
+
+def test_round_trip(tmp_path):
+    filePath = nodeSnapStream.writeStream(DATA, str(tmp_path / "snap.ndjson"))
+    assert nodeSnapStream.readStream(filePath) == DATA
+
+    model = SnapshotModel.load(filePath)
+    assert [record.fullPath for record in model.records] == ["/obj/geo1", "/obj/geo1/box1", "/obj/geo1/null1", "/obj/cam1"]
+    assert model.strings.resolve({"$text": "abc"}) == "text"
+
+
+def test_children_of_filtered_parents_move_to_the_top():
+    entries = [entry for entry in nodeSnapStream.flattenNodes(DATA["nodes"]) if entry["name"] != "geo1"]
+    assert list(nodeSnapStream.nestNodes(entries)) == ["box1", "null1", "cam1"]
+
+
+def test_append_creates_and_extends(tmp_path):
+    filePath = str(tmp_path / "log.ndjson")
+    nodeSnapStream.appendNodes(filePath, {"cam1": DATA["nodes"]["cam1"]}, meta={"a": 1}, version=1)
+    nodeSnapStream.appendNodes(filePath, {"geo1": DATA["nodes"]["geo1"]})
+
+    data = nodeSnapStream.readStream(filePath)
+    assert list(data["nodes"]) == ["cam1", "geo1"] and data["meta"] == {"a": 1}
+
+
+def test_missing_header_is_rejected(tmp_path):
+    filePath = tmp_path / "bad.ndjson"
+    filePath.write_text('{"name": "geo1"}\n')
+    with pytest.raises(ValueError):
+        nodeSnapStream.readStream(str(filePath))
+
+
+def writeWithBlob(directory, name, payload):
+    directory.mkdir()
+    data = {"version": 1, "meta": {}, "nodes": {name: {
+        "path": "/obj/", "type": "geo", "parm": {"stash": payload}, "child": {},
+    }}}
+    filePath = str(directory / f"{name}.ndjson")
+    nodeSnapBlobs.extractBlobs(data, filePath)
+    return nodeSnapStream.writeStream(data, filePath)
+
+
+def test_merge_copies_blobs_of_every_input(tmp_path, capsysbinary, monkeypatch):
+    sizes = nodeSnapBlobs.GEOMETRY_THRESHOLD + 1
+    first = writeWithBlob(tmp_path / "a", "geoA", "a" * sizes)
+    second = writeWithBlob(tmp_path / "b", "geoB", "b" * sizes)
+
+    with pytest.raises(SystemExit):
+        nodeSnapStream.main(["merge", first, second])
+    capsysbinary.readouterr()
+
+    monkeypatch.chdir(tmp_path)
+    assert nodeSnapStream.main(["merge", first, second, "--blobs", "ab.blobs"]) == 0
+    (tmp_path / "ab.ndjson").write_bytes(capsysbinary.readouterr().out)
+
+    assert len(os.listdir(tmp_path / "ab.blobs")) == 2
+    model = SnapshotModel.load(str(tmp_path / "ab.ndjson"))
+    resolved = [model.resolve(record.parms)["stash"] for record in model.records]
+    model.blobs.close()
+    assert resolved == ["a" * sizes, "b" * sizes]
+
+
+def test_join_keeps_a_shared_blob_folder(tmp_path, capsysbinary):
+    first = writeWithBlob(tmp_path / "a", "geoA", "a" * (nodeSnapBlobs.GEOMETRY_THRESHOLD + 1))
+
+    assert nodeSnapStream.main(["join", first]) == 0
+    data = nodeSnapStream.nodeJsonCodec.loads(capsysbinary.readouterr().out)
+    assert data["blobs"] == "geoA.blobs" and list(data["nodes"]) == ["geoA"]
@@ -0,0 +1,52 @@
+import nodeSnapStrings
+from nodeSnapStrings import StringTable, outlineStrings, outlineValue, TEXT_KEY
+from nodeSnapChannels import encodeKeys
+
+LONG_VEX = "@P.y += sin(@Time);\n" * 100
+
+
+def test_short_text_stays_inline():
+    table = {}
+    assert outlineValue("ch('tx')", table) == "ch('tx')" and table == {}
+
+
+def test_long_text_is_stored_once():
+    table = {}
+    value = outlineValue({"snippet": LONG_VEX, "other": [LONG_VEX, 1]}, table)
+
+    assert len(table) == 1
+    assert value["snippet"] == value["other"][0] == {TEXT_KEY: next(iter(table))}
+    assert StringTable(table).resolve(value) == {"snippet": LONG_VEX, "other": [LONG_VEX, 1]}
+
+
+def test_outline_snapshot_nodes_payloads_and_definitions():
+    keys = [{"frame": frame, "value": 0.0, "expression": LONG_VEX} for frame in range(5)]
+    data = {
+        "nodes"       : {"geo1": {"parm": {"code": LONG_VEX, "anim": encodeKeys(keys)}, "child": {
+            "net1": {"parm": {}, "children_data": {"wrangle": {"parms": {"snippet": LONG_VEX + "x"}}}},
+        }}},
+        "definitions" : {"key1": {"inner": {"parms": {"python": LONG_VEX + "y"}}}},
+    }
+    original = {"code": LONG_VEX, "anim": encodeKeys(keys)}
+    outlineStrings(data)
+
+    assert len(data["strings"]) == 3
+    # Packed channels are left as they are
+    assert data["nodes"]["geo1"]["parm"]["anim"] == original["anim"]
+    table = StringTable(data["strings"])
+    assert table.resolve(data["nodes"]["geo1"]["parm"]) == original
+    assert table.resolve(data["definitions"])["key1"]["inner"]["parms"]["python"] == LONG_VEX + "y"
+
+
+def test_no_strings_table_without_long_text():
+    data = outlineStrings({"nodes": {"geo1": {"parm": {"a": "short"}}}})
+    assert "strings" not in data
+
+
+def test_table_decodes_lazily_and_once():
+    encoded = {"key": nodeSnapStrings.encodeText("hello")}
+    table = StringTable(encoded)
+    assert table and not StringTable()
+    assert table._decoded == {}
+    assert table.text("key") == "hello" and table._decoded == {"key": "hello"}
+    assert StringTable().resolve({TEXT_KEY: "key"}) == {TEXT_KEY: "key"}
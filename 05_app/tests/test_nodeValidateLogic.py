@@ -0,0 +1,134 @@
+import os
+import sys
+import types
+
+import nodeJsonCodec
+import nodeValidateLogic
+from nodeValidateLogic import NodeSchema, SnapshotValidator
+
+SCHEMA_DATA = {
+    "houdini" : "20.5.0",
+    "roots"   : {"/obj": "Object"},
+    "types"   : {
+        "Object/geo" : {"parms": {"tx": "Float", "scale": "Float"}, "children": "Sop"},
+        "Sop/box"    : {"parms": {"size": "Float", "uv#": "Int"}, "children": None},
+    },
+}
+
+
+def nodeEntry(path, typeName, parms=None, inputs=None, children=None):
+    return {
+        "path"   : path,
+        "type"   : typeName,
+        "parent" : {"name": "obj", "type": ""},
+        "root"   : "/obj",
+        "parm"   : parms or {},
+        "input"  : inputs,
+        "child"  : children or {},
+    }
+
+
+def writeSnapshot(tmp_path, nodes):
+    filePath = str(tmp_path / "snap.json")
+    nodeJsonCodec.dump({"version": 1, "nodes": nodes, "meta": {}}, filePath)
+    return filePath
+
+
+def codes(report):
+    return sorted(issue["code"] for issue in report["issues"])
+
+
+def test_worker_reports_unknown_type_without_hou(tmp_path):
+    assert "hou" not in sys.modules
+    filePath = writeSnapshot(tmp_path, {"geo1": nodeEntry("/obj/", "geo", children={
+        "bogus1": nodeEntry("/obj/geo1/", "notAType"),
+    })})
+
+    nodeValidateLogic._initWorker(SCHEMA_DATA)
+    report = nodeValidateLogic._validateInWorker(filePath)
+
+    assert codes(report) == ["unknown_type"]
+    assert report["issues"][0]["node"] == "/obj/geo1/bogus1"
+    assert report["errors"] == 1
+
+
+def test_parm_kinds_and_multiparms(tmp_path):
+    filePath = writeSnapshot(tmp_path, {"geo1": nodeEntry("/obj/", "geo", {"tx": "oops"}, children={
+        "box1": nodeEntry("/obj/geo1/", "box", {"size": [1.0, 2.0, 3.0], "uv3": 1, "missing": 0}),
+    })})
+
+    report = SnapshotValidator(NodeSchema(SCHEMA_DATA)).validateFile(filePath)
+    assert codes(report) == ["unknown_parm", "wrong_parm_type"]
+
+
+def test_inputs_outside_snapshot_are_not_dangling_offline(tmp_path):
+    filePath = writeSnapshot(tmp_path, {"geo1": nodeEntry("/obj/", "geo", inputs=[{"from": "/obj/elsewhere"}])})
+    report = SnapshotValidator(NodeSchema(SCHEMA_DATA)).validateFile(filePath)
+    assert report["issues"] == []
+
+
+def test_unreadable_file(tmp_path):
+    filePath = tmp_path / "broken.json"
+    filePath.write_text("{not json")
+    report = SnapshotValidator(NodeSchema(SCHEMA_DATA)).validateFile(str(filePath))
+    assert codes(report) == ["unreadable"] and report["errors"] == 1
+
+
+def test_validate_directory_in_processes(tmp_path):
+    writeSnapshot(tmp_path, {"geo1": nodeEntry("/obj/", "bogus")})
+    (tmp_path / "snap_backup.json").write_text("{}")
+
+    report = nodeValidateLogic.validateDirectory(str(tmp_path), NodeSchema(SCHEMA_DATA), workers=1)
+    assert [fileReport["file"] for fileReport in report["files"]] == [str(tmp_path / "snap.json")]
+    assert report["errors"] == 1
+
+
+def test_build_all_caches_roots(monkeypatch):
+    category = types.SimpleNamespace(name=lambda: "Object", nodeTypes=lambda: {})
+    rootNode = types.SimpleNamespace(childTypeCategory=lambda: category)
+    fakeHou = types.SimpleNamespace(
+        node=lambda path: rootNode if path == "/obj" else None,
+        nodeTypeCategories=lambda: {},
+    )
+    monkeypatch.setitem(sys.modules, "hou", fakeHou)
+
+    schema = NodeSchema(live=True)
+    schema.buildAll()
+    assert schema.data["roots"]["/obj"] == "Object"
+    assert set(schema.data["roots"]) == set(nodeValidateLogic.ROOT_PATHS)
+
+    # Offline copies of the cache resolve roots on their own
+    assert NodeSchema(schema.data, live=False).rootCategory("/obj") == "Object"
+
+
+def test_schema_persists_only_installed_types(monkeypatch, tmp_path):
+    libraryFile = tmp_path / "tools.hda"
+    libraryFile.write_bytes(b"")
+    definition = types.SimpleNamespace(libraryFilePath=lambda: str(libraryFile))
+    template = types.SimpleNamespace(name=lambda: "size", type=lambda: types.SimpleNamespace(name=lambda: "Float"))
+    nodeType = types.SimpleNamespace(
+        childTypeCategory=lambda: None,
+        definition=lambda: definition,
+        parmTemplateGroup=lambda: types.SimpleNamespace(parmTemplates=lambda: [template]),
+    )
+    category = types.SimpleNamespace(nodeType=lambda typeName: nodeType if typeName == "tool" else None)
+    fakeHou = types.SimpleNamespace(
+        nodeTypeCategories=lambda: {"Sop": category},
+        applicationVersionString=lambda: "20.5.0",
+    )
+    monkeypatch.setitem(sys.modules, "hou", fakeHou)
+
+    schema = NodeSchema(live=True)
+    assert schema.lookup("Sop", "notInstalled") is None
+    assert schema.lookup("Sop", "tool")["parms"] == {"size": "Float"}
+    schemaPath = str(tmp_path / "schema.json")
+    schema.save(schemaPath)
+
+    # Missing types are not written, they may be installed by the next session
+    reloaded = NodeSchema.load(schemaPath)
+    assert set(reloaded.data["types"]) == {"Sop/tool"}
+
+    # A changed HDA library drops its types from the cache
+    modified = libraryFile.stat().st_mtime + 10
+    os.utime(libraryFile, (modified, modified))
+    assert NodeSchema.load(schemaPath).data["types"] == {}